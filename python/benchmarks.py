@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Modern Calendar System - Benchmarks
+Repeatable micro-benchmarks with JSON baselines and a regression gate
+
+    python benchmarks.py run -o baseline.json
+    python benchmarks.py compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter_ns
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+BASELINE_VERSION = 2
+
+# Dates every benchmark walks through, so results do not hinge on one day
+SAMPLE_START = datetime(2000, 1, 1)
+SAMPLE_SIZE = 1000
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], None]]
+    ops: int
+    description: str
+
+
+class BenchmarkResult(NamedTuple):
+    """Per-operation timings of one benchmark, in nanoseconds"""
+    name: str
+    ops: int
+    repeat: int
+    min: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, ops: int = SAMPLE_SIZE):
+    """
+    Register a benchmark.
+
+    The decorated function is the setup: it runs once, untimed, and returns
+    a zero-argument callable that performs ``ops`` operations per call.
+    """
+    def register(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, ops, (setup.__doc__ or '').strip())
+        return setup
+    return register
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of already sorted samples"""
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    weight = position - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def time_benchmark(bench: Benchmark, repeat: int = 30, warmup: int = 3) -> BenchmarkResult:
+    """Run a benchmark ``warmup + repeat`` times and summarize the timed runs"""
+    run = bench.setup()
+    for _ in range(warmup):
+        run()
+
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        run()
+        samples.append((perf_counter_ns() - start) / bench.ops)
+
+    samples.sort()
+    return BenchmarkResult(
+        name=bench.name,
+        ops=bench.ops,
+        repeat=repeat,
+        min=samples[0],
+        mean=sum(samples) / len(samples),
+        p50=percentile(samples, 0.50),
+        p90=percentile(samples, 0.90),
+        p99=percentile(samples, 0.99),
+        max=samples[-1]
+    )
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeat: int = 30,
+                   warmup: int = 3) -> List[BenchmarkResult]:
+    """Run the selected benchmarks (default: all) in registration order"""
+    selected = list(BENCHMARKS) if not names else names
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"Unknown benchmarks: {', '.join(unknown)}")
+    return [time_benchmark(BENCHMARKS[name], repeat, warmup) for name in selected]
+
+
+def sample_dates(step: int = 37, start: datetime = SAMPLE_START) -> List[datetime]:
+    return [start + timedelta(days=i * step) for i in range(SAMPLE_SIZE)]
+
+
+def check_cache_hits(cache, run: Callable[[], None]) -> None:
+    """Fail unless a warm run of ``run`` is served from ``cache`` without misses"""
+    run()
+    before = cache.cache_info()
+    run()
+    after = cache.cache_info()
+    if after.hits == before.hits or after.misses != before.misses:
+        raise RuntimeError(f"Warm run missed the cache: {before} -> {after}")
+
+
+# --- Benchmarks -------------------------------------------------------------
+
+@benchmark('convert.gregorian_to_ethiopian')
+def bench_gregorian_to_ethiopian():
+    """EthiopianCalendar.gregorian_to_ethiopian over 1000 dates"""
+    from modern_calendar import CALENDARS
+    convert = CALENDARS['ethiopian'].gregorian_to_ethiopian
+    dates = sample_dates()
+
+    def run():
+        for date in dates:
+            convert(date)
+    return run
+
+
+@benchmark('convert.ethiopian_to_gregorian')
+def bench_ethiopian_to_gregorian():
+    """EthiopianCalendar.ethiopian_to_gregorian over 1000 dates"""
+    from modern_calendar import CALENDARS
+    calendar_impl = CALENDARS['ethiopian']
+    convert = calendar_impl.ethiopian_to_gregorian
+    ymds = [calendar_impl.gregorian_to_ethiopian(date) for date in sample_dates()]
+
+    def run():
+        for year, month, day in ymds:
+            convert(year, month, day)
+    return run
+
+
+@benchmark('convert.gregorian_to_islamic')
+def bench_gregorian_to_islamic():
+    """IslamicCalendar.gregorian_to_islamic over 1000 dates"""
+    from modern_calendar import CALENDARS
+    convert = CALENDARS['islamic'].gregorian_to_islamic
+    dates = sample_dates()
+
+    def run():
+        for date in dates:
+            convert(date)
+    return run
+
+
+def _format_benchmark(calendar_type: str, language: str, style: str = 'full'):
+    def setup():
+        from modern_calendar import ModernCalendar
+        calendar = ModernCalendar(calendar_type, language)
+        dates = sample_dates()
+
+        def run():
+            for date in dates:
+                calendar.format_date(date, style)
+        return run
+    setup.__doc__ = (f"ModernCalendar('{calendar_type}', '{language}').format_date"
+                     f"({style!r}) over 1000 dates")
+    return setup
+
+
+benchmark('format.gregorian_en')(_format_benchmark('gregorian', 'en'))
+benchmark('format.ethiopian_am')(_format_benchmark('ethiopian', 'am'))
+benchmark('format.ethiopian_geez')(_format_benchmark('ethiopian', 'am', 'geez'))
+benchmark('format.islamic_ar')(_format_benchmark('islamic', 'ar'))
+
+
+@benchmark('format.format_many', ops=SAMPLE_SIZE)
+def bench_format_many():
+    """ModernCalendar.format_many with a compiled pattern over 1000 dates"""
+    from modern_calendar import ModernCalendar
+    calendar = ModernCalendar('ethiopian', 'am')
+    dates = sample_dates()
+
+    def run():
+        calendar.format_many(dates, '%-d %B %Y')
+    return run
+
+
+@benchmark('grid.month_uncached', ops=13 * 20)
+def bench_month_grid_uncached():
+    """Ethiopian month grids built from scratch, 20 years x 13 months"""
+    from modern_calendar import CALENDARS
+    build = CALENDARS['ethiopian'].get_month_calendar
+
+    def run():
+        for year in range(2000, 2020):
+            for month in range(1, 14):
+                build(year, month)
+    return run
+
+
+@benchmark('grid.month_cached', ops=13 * 10)
+def bench_month_grid_cached():
+    """ModernCalendar.get_month_calendar hitting the shared grid cache, 10 years x 13 months"""
+    from modern_calendar import ModernCalendar
+    from modern_calendar.calendars import MONTH_GRID_CACHE
+    calendar = ModernCalendar('ethiopian', 'am')
+    keys = [(year, month) for year in range(2000, 2010) for month in range(1, 14)]
+    # More keys than entries would evict each grid before it is asked for again
+    if len(keys) > MONTH_GRID_CACHE.maxsize:
+        raise RuntimeError(f"{len(keys)} month grids do not fit the grid cache")
+
+    def run():
+        for year, month in keys:
+            calendar.get_month_calendar(year, month)
+
+    MONTH_GRID_CACHE.cache_clear()
+    check_cache_hits(MONTH_GRID_CACHE, run)
+    return run
+
+
+@benchmark('grid.year_uncached', ops=20)
+def bench_year_grid_uncached():
+    """Ethiopian whole-year grids built from scratch, 20 years"""
+    from modern_calendar import CALENDARS
+    build = CALENDARS['ethiopian'].get_year_calendar
+
+    def run():
+        for year in range(2000, 2020):
+            build(year)
+    return run
+
+
+@benchmark('holiday.is_holiday')
+def bench_is_holiday():
+    """ModernCalendar('ethiopian').is_holiday over 1000 dates in the precompiled window"""
+    from modern_calendar import ModernCalendar
+    calendar = ModernCalendar('ethiopian', 'am')
+    dates = sample_dates(step=7)
+
+    def run():
+        for date in dates:
+            calendar.is_holiday(date)
+
+    calendar.get_calendar().holidays.cache_clear()
+    run()
+    return run
+
+
+@benchmark('holiday.is_holiday_compiled')
+def bench_is_holiday_compiled():
+    """ModernCalendar('ethiopian').is_holiday over 1000 dates in 20 years past the window"""
+    from modern_calendar import ModernCalendar
+    calendar = ModernCalendar('ethiopian', 'am')
+    # 2200 onwards is outside the 1900-2100 window, so each call goes
+    # through compile_year; the warm run below compiles every year once
+    dates = sample_dates(step=7, start=datetime(2200, 1, 1))
+
+    def run():
+        for date in dates:
+            calendar.is_holiday(date)
+
+    calendar.get_calendar().holidays.cache_clear()
+    run()
+    return run
+
+
+@benchmark('info.get_date_info')
+def bench_get_date_info():
+    """ModernCalendar('ethiopian', 'am').get_date_info over 1000 dates"""
+    from modern_calendar import ModernCalendar
+    calendar = ModernCalendar('ethiopian', 'am')
+    dates = sample_dates()
+
+    def run():
+        for date in dates:
+            calendar.get_date_info(date)
+    return run
+
+
+@benchmark('construct.modern_calendar')
+def bench_construct():
+    """ModernCalendar construction, 1000 instances"""
+    from modern_calendar import ModernCalendar
+
+    def run():
+        for _ in range(SAMPLE_SIZE):
+            ModernCalendar('ethiopian', 'am')
+    return run
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules the core import must never pull in
+HEADLESS_FORBIDDEN = ('tkinter', 'numpy', 'pandas')
+
+
+def check_headless() -> None:
+    """Fail if a fresh ``import modern_calendar`` loads a GUI or optional dependency"""
+    code = ("import sys, modern_calendar; "
+            f"print(','.join(m for m in {HEADLESS_FORBIDDEN!r} if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_DIR, check=True,
+                            capture_output=True, text=True).stdout.strip()
+    if loaded:
+        raise RuntimeError(f"import modern_calendar loaded {loaded}")
+
+
+@benchmark('import.core', ops=1)
+def bench_import_core():
+    """Re-import of the modern_calendar package with the standard library warm"""
+    check_headless()
+
+    def run():
+        for name in [m for m in sys.modules if m == 'modern_calendar' or m.startswith('modern_calendar.')]:
+            del sys.modules[name]
+        importlib.import_module('modern_calendar')
+    return run
+
+
+@benchmark('import.cold_start', ops=1)
+def bench_import_cold_start():
+    """New interpreter running ``import modern_calendar`` (includes startup)"""
+    command = [sys.executable, '-c', 'import modern_calendar']
+
+    def run():
+        subprocess.run(command, cwd=PACKAGE_DIR, check=True)
+    return run
+
+
+# --- Baselines --------------------------------------------------------------
+
+def environment() -> Dict:
+    """Interpreter and machine details stored alongside a baseline"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine()
+    }
+
+
+def save_baseline(results: List[BenchmarkResult], path: str) -> None:
+    """Write results to a JSON baseline file"""
+    data = {
+        'version': BASELINE_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'benchmarks': {result.name: result.to_dict() for result in results}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    """Read the per-benchmark entries of a JSON baseline file"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {data.get('version')}")
+    return data['benchmarks']
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+
+
+def compare_results(baseline: Dict[str, Dict], results: List[BenchmarkResult],
+                    threshold: float = 0.2, stat: str = 'p50') -> List[Comparison]:
+    """
+    Compare results with a baseline on one statistic.
+
+    A benchmark regresses when it is more than ``threshold`` (a fraction,
+    0.2 = 20%) slower than its baseline. Benchmarks missing from the
+    baseline are skipped.
+    """
+    comparisons = []
+    for result in results:
+        entry = baseline.get(result.name)
+        if entry is None:
+            continue
+        before, after = entry[stat], getattr(result, stat)
+        ratio = after / before if before else float('inf')
+        comparisons.append(Comparison(result.name, before, after, ratio, ratio > 1 + threshold))
+    return comparisons
+
+
+# --- Reporting --------------------------------------------------------------
+
+def format_ns(value: float) -> str:
+    """Human-readable duration from nanoseconds"""
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} µs"
+    return f"{value:.0f} ns"
+
+
+def print_results(results: List[BenchmarkResult], file=sys.stdout) -> None:
+    print(f"{'benchmark':<34} {'p50':>10} {'p90':>10} {'p99':>10} {'min':>10}", file=file)
+    for r in results:
+        print(f"{r.name:<34} {format_ns(r.p50):>10} {format_ns(r.p90):>10} "
+              f"{format_ns(r.p99):>10} {format_ns(r.min):>10}", file=file)
+
+
+def print_comparisons(comparisons: List[Comparison], stat: str, file=sys.stdout) -> None:
+    print(f"{'benchmark':<34} {'baseline':>10} {'current':>10} {'change':>8}  ({stat}/op)", file=file)
+    for c in comparisons:
+        flag = '  REGRESSED' if c.regressed else ''
+        print(f"{c.name:<34} {format_ns(c.baseline):>10} {format_ns(c.current):>10} "
+              f"{(c.ratio - 1) * 100:>+7.1f}%{flag}", file=file)
+
+
+# --- Command line -----------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python benchmarks.py',
+                                     description='Modern Calendar System benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_run_options(command):
+        command.add_argument('-b', '--benchmark', action='append', dest='names',
+                             help='Benchmark to run (repeatable; default: all)')
+        command.add_argument('-r', '--repeat', type=int, default=30,
+                             help='Timed repetitions per benchmark (default: 30)')
+        command.add_argument('-w', '--warmup', type=int, default=3,
+                             help='Untimed warmup runs per benchmark (default: 3)')
+
+    run = commands.add_parser('run', help='Run benchmarks and optionally save a baseline')
+    add_run_options(run)
+    run.add_argument('-o', '--output', help='Write results to this JSON baseline')
+
+    compare = commands.add_parser('compare', help='Run benchmarks and compare with a baseline')
+    compare.add_argument('baseline', help='JSON baseline written by "run -o"')
+    add_run_options(compare)
+    compare.add_argument('-t', '--threshold', type=float, default=0.2,
+                         help='Allowed slowdown as a fraction (default: 0.2 = 20%%)')
+    compare.add_argument('--stat', choices=('min', 'mean', 'p50', 'p90', 'p99'), default='p50',
+                         help='Statistic to compare (default: p50)')
+
+    commands.add_parser('list', help='List available benchmarks')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exits 1 when compare finds a regression"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'list':
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<34} {bench.description}")
+        return 0
+
+    if args.repeat < 1:
+        print("error: --repeat must be at least 1", file=sys.stderr)
+        return 2
+
+    if args.command == 'compare':
+        baseline = load_baseline(args.baseline)
+        names = args.names or [name for name in BENCHMARKS if name in baseline]
+        results = run_benchmarks(names, args.repeat, args.warmup)
+        comparisons = compare_results(baseline, results, args.threshold, args.stat)
+        print_comparisons(comparisons, args.stat)
+        regressed = [c.name for c in comparisons if c.regressed]
+        if regressed:
+            print(f"\n{len(regressed)} benchmark(s) regressed by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressed)}", file=sys.stderr)
+            return 1
+        return 0
+
+    results = run_benchmarks(args.names, args.repeat, args.warmup)
+    print_results(results)
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"\nBaseline written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -169,29 +169,48 @@ def demo_special_dates():
         print(f"  {formatted}: Holiday={is_holiday}, Weekend={is_weekend}")
 
 def demo_performance():
-    """Demonstrate performance with multiple operations"""
+    """Demonstrate performance with a quick run of the benchmark suite"""
     print_separator("PERFORMANCE DEMO")
     
-    import time
-    
-    calendar = ModernCalendar('gregorian', 'en')
-    
-    # Time date formatting
-    start_time = time.time()
-    for i in range(1000):
-        date = calendar.add_days(calendar.today(), i)
-        calendar.format_date(date)
-    end_time = time.time()
-    
-    print(f"Formatted 1000 dates in {end_time - start_time:.4f} seconds")
-    
-    # Time calendar generation
-    start_time = time.time()
-    for month in range(1, 13):
-        calendar.get_month_calendar(2024, month)
-    end_time = time.time()
+    from benchmarks import print_results, run_benchmarks
+    
+    # A short run; use `python benchmarks.py run` for stable numbers
+    results = run_benchmarks([
+        'convert.gregorian_to_ethiopian',
+        'format.gregorian_en',
+        'format.ethiopian_am',
+        'grid.month_cached',
+        'info.get_date_info'
+    ], repeat=5, warmup=1)
+    print("Time per operation:")
+    print_results(results)
+
+def demo_construction_cost():
+    """Compare per-request construction with fresh vs shared calendars"""
+    print_separator("CONSTRUCTION COST")
     
-    print(f"Generated 12 month calendars in {end_time - start_time:.4f} seconds")
+    import time
+    from modern_calendar import build_calendars, build_locales
+    
+    iterations = 10000
+    
+    # Before: every instance built its own calendars and locales
+    start_time = time.perf_counter()
+    for i in range(iterations):
+        calendar = ModernCalendar('ethiopian', 'am')
+        calendar.calendars = build_calendars()
+        calendar.languages = build_locales()
+    fresh_time = time.perf_counter() - start_time
+    
+    # After: instances share the process-wide registries
+    start_time = time.perf_counter()
+    for i in range(iterations):
+        calendar = ModernCalendar('ethiopian', 'am')
+    shared_time = time.perf_counter() - start_time
+    
+    print(f"Fresh calendars:  {fresh_time / iterations * 1e6:.2f} µs per ModernCalendar")
+    print(f"Shared calendars: {shared_time / iterations * 1e6:.2f} µs per ModernCalendar")
+    print(f"Speedup: {fresh_time / shared_time:.1f}x")
 
 def interactive_demo():
     """Interactive demo allowing user input"""
@@ -260,6 +279,7 @@ def main():
         demo_calendar_comparison()
         demo_special_dates()
         demo_performance()
+        demo_construction_cost()
         
         # Ask if user wants interactive demo
         print("\n" + "="*50)
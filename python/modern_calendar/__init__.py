@@ -0,0 +1,31 @@
+"""
+Modern Calendar System - Python Implementation
+Gregorian, Ethiopian and Islamic calendars with localized formatting
+
+The core (conversion, formatting, grids, holidays) uses only the standard
+library and never imports tkinter; the Tk date picker lives in
+modern_calendar.datepicker, the NumPy batch API in modern_calendar.batch and
+the pandas ``.ethiopian`` accessor in modern_calendar.pandas_accessor.
+"""
+
+from .calendars import (
+    CALENDARS, MONTH_GRID_CACHE, BaseCalendar, DateDisplay, EthiopianCalendar,
+    GregorianCalendar, IslamicCalendar, ModernCalendar, MonthGrid, build_calendars
+)
+from .ethiopian_date import EthiopianDate
+from .holiday_rules import Holiday, HolidayCalendar
+from .locales import (
+    LOCALES, AmharicLocale, ArabicLocale, BaseLocale, EnglishLocale, OromoLocale,
+    build_locales
+)
+
+__version__ = '1.0.0'
+
+__all__ = [
+    'CALENDARS', 'LOCALES', 'MONTH_GRID_CACHE',
+    'ModernCalendar', 'DateDisplay', 'MonthGrid',
+    'BaseCalendar', 'GregorianCalendar', 'EthiopianCalendar', 'IslamicCalendar',
+    'BaseLocale', 'EnglishLocale', 'AmharicLocale', 'OromoLocale', 'ArabicLocale',
+    'EthiopianDate', 'Holiday', 'HolidayCalendar',
+    'build_calendars', 'build_locales',
+]
@@ -0,0 +1,45 @@
+"""
+Modern Calendar System - Entry Point
+python -m modern_calendar [command ...]; without a command, prints a short demo
+"""
+
+import sys
+
+from .calendars import DateDisplay, ModernCalendar
+
+
+def demo() -> None:
+    """Print today's date in a few calendars and languages"""
+    # Test Gregorian calendar
+    print("=== Gregorian Calendar (English) ===")
+    greg_cal = ModernCalendar('gregorian', 'en')
+    today = greg_cal.today()
+    print(f"Today: {greg_cal.format_date(today)}")
+    print(f"Date Info: {greg_cal.get_date_info(today)}")
+
+    # Test Ethiopian calendar
+    print("\n=== Ethiopian Calendar (Amharic) ===")
+    eth_cal = ModernCalendar('ethiopian', 'am')
+    print(f"Today: {eth_cal.format_date(today)}")
+    print(f"Date Info: {eth_cal.get_date_info(today)}")
+
+    # Test date operations
+    print("\n=== Date Operations ===")
+    future_date = greg_cal.add_days(today, 30)
+    print(f"30 days from now: {greg_cal.format_date(future_date)}")
+
+    # Test DateDisplay
+    print("\n=== Date Display Component ===")
+    date_display = DateDisplay('gregorian', 'en')
+    print(f"Display: {date_display.display_date()}")
+
+    eth_display = DateDisplay('ethiopian', 'am')
+    print(f"Ethiopian Display: {eth_display.display_date()}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Subcommands, e.g. python -m modern_calendar convert ...
+        from .cli import main
+        sys.exit(main())
+    demo()
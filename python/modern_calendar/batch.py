@@ -0,0 +1,193 @@
+"""
+Modern Calendar System - Batch Conversion
+Vectorized Gregorian <-> Ethiopian / Islamic conversion over NumPy arrays
+"""
+
+from typing import Tuple
+
+from .day_numbers import ETHIOPIAN_EPOCH, ISLAMIC_EPOCH
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Day number of the NumPy datetime64 epoch (1970-01-01)
+UNIX_EPOCH_RD = 719163
+
+if np is not None:
+    ETHIOPIAN_DTYPE = np.dtype([('year', 'i4'), ('month', 'i1'), ('day', 'i1')])
+    ISLAMIC_DTYPE = ETHIOPIAN_DTYPE
+else:
+    ETHIOPIAN_DTYPE = ISLAMIC_DTYPE = None
+
+
+def _require_numpy():
+    """Raise a helpful error when NumPy is not installed"""
+    if np is None:
+        raise ImportError("Batch conversion requires NumPy: pip install numpy")
+
+
+def to_day_numbers(dates):
+    """Convert a datetime64 or integer day-number array to int64 day numbers"""
+    _require_numpy()
+    dates = np.asarray(dates)
+    if np.issubdtype(dates.dtype, np.datetime64):
+        return dates.astype('datetime64[D]').astype(np.int64) + UNIX_EPOCH_RD
+    if not np.issubdtype(dates.dtype, np.integer):
+        raise TypeError(f"Expected datetime64 or integer array, got {dates.dtype}")
+    return dates.astype(np.int64, copy=False)
+
+
+def _day_numbers_and_mask(dates):
+    """
+    Day numbers of datetime64 or integer input plus its missing-value mask.
+
+    NaT and masked entries are flagged in the mask (None when nothing is
+    missing) and replaced by the Unix epoch so the arithmetic stays in range.
+    """
+    mask = np.ma.getmask(dates)
+    values = np.asarray(np.ma.getdata(dates))
+    if np.issubdtype(values.dtype, np.datetime64):
+        nat = np.isnat(values)
+        mask = nat if mask is np.ma.nomask else mask | nat
+    day_numbers = to_day_numbers(values)
+    if mask is np.ma.nomask or not mask.any():
+        return day_numbers, None
+    return np.where(mask, UNIX_EPOCH_RD, day_numbers), mask
+
+
+def _fields_and_mask(years, months, days):
+    """Year, month and day arrays (masked entries filled with 1) and their joint mask"""
+    if months is None and days is None:
+        records = years
+        if np.asarray(records).dtype.names is None:
+            raise TypeError("Expected year, month and day arrays or a structured array")
+        years, months, days = records['year'], records['month'], records['day']
+    mask = np.ma.getmask(years) | np.ma.getmask(months) | np.ma.getmask(days)
+    fields = tuple(np.ma.filled(field, 1) if np.ma.isMaskedArray(field) else field
+                   for field in (years, months, days))
+    if mask is np.ma.nomask or not np.any(mask):
+        return fields, None
+    return fields, mask
+
+
+def _result_fields(fields, mask, dtype, structured: bool):
+    """Package (years, months, days) as plain, structured or masked arrays"""
+    years, months, days = fields
+    if structured:
+        result = np.empty(years.shape, dtype=dtype)
+        result['year'] = years
+        result['month'] = months
+        result['day'] = days
+        return result if mask is None else np.ma.masked_array(result, mask=mask)
+    if mask is None:
+        return years, months, days
+    return tuple(np.ma.masked_array(field, mask=mask) for field in fields)
+
+
+def _result_dates(day_numbers, mask, as_day_numbers: bool):
+    """Day numbers as datetime64[D] (NaT where missing) or masked int64"""
+    if as_day_numbers:
+        return day_numbers if mask is None else np.ma.masked_array(day_numbers, mask=mask)
+    values = day_numbers_to_datetime64(day_numbers)
+    if mask is not None:
+        values[mask] = np.datetime64('NaT')
+    return values
+
+
+def day_numbers_to_datetime64(day_numbers):
+    """Convert an integer day-number array to datetime64[D]"""
+    _require_numpy()
+    day_numbers = np.asarray(day_numbers, dtype=np.int64)
+    return (day_numbers - UNIX_EPOCH_RD).astype('datetime64[D]')
+
+
+def day_numbers_to_ethiopian(day_numbers) -> Tuple:
+    """Convert day numbers to Ethiopian (years, months, days) arrays"""
+    _require_numpy()
+    n = np.asarray(day_numbers, dtype=np.int64) - ETHIOPIAN_EPOCH
+    years = (4 * n + 1463) // 1461
+    day_of_year = n - 365 * (years - 1) - years // 4
+    return years, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+def ethiopian_to_day_numbers(years, months, days):
+    """Convert Ethiopian year, month and day arrays to day numbers"""
+    _require_numpy()
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    return (ETHIOPIAN_EPOCH - 1 + 365 * (years - 1) + years // 4
+            + 30 * (months - 1) + days)
+
+
+def gregorian_to_ethiopian_batch(dates, structured: bool = False):
+    """
+    Convert Gregorian dates to Ethiopian dates in one vectorized pass.
+
+    ``dates`` is a datetime64 array or an integer day-number array.
+    Returns (years, months, days) int64 arrays, or a single array of
+    ETHIOPIAN_DTYPE records when ``structured`` is True. When the input
+    has NaT or masked entries, the results are masked arrays.
+    """
+    _require_numpy()
+    day_numbers, mask = _day_numbers_and_mask(dates)
+    return _result_fields(day_numbers_to_ethiopian(day_numbers), mask,
+                          ETHIOPIAN_DTYPE, structured)
+
+
+def ethiopian_to_gregorian_batch(years, months=None, days=None, as_day_numbers: bool = False):
+    """
+    Convert Ethiopian dates to Gregorian dates in one vectorized pass.
+
+    Accepts separate year, month and day arrays, or a single
+    ETHIOPIAN_DTYPE structured array, any of them masked. Returns
+    datetime64[D] (NaT where masked), or int64 day numbers (masked
+    where the input is) when ``as_day_numbers`` is True.
+    """
+    _require_numpy()
+    fields, mask = _fields_and_mask(years, months, days)
+    return _result_dates(ethiopian_to_day_numbers(*fields), mask, as_day_numbers)
+
+
+def day_numbers_to_islamic(day_numbers) -> Tuple:
+    """Convert day numbers to tabular Islamic (years, months, days) arrays"""
+    _require_numpy()
+    rd = np.asarray(day_numbers, dtype=np.int64)
+    years = (30 * (rd - ISLAMIC_EPOCH) + 10646) // 10631
+    day_of_year = rd - (ISLAMIC_EPOCH + 354 * (years - 1) + (3 + 11 * years) // 30)
+    months = np.minimum((11 * day_of_year + 330) // 325, 12)
+    return years, months, day_of_year - 29 * (months - 1) - months // 2 + 1
+
+
+def islamic_to_day_numbers(years, months, days):
+    """Convert tabular Islamic year, month and day arrays to day numbers"""
+    _require_numpy()
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    return (ISLAMIC_EPOCH - 1 + 354 * (years - 1) + (3 + 11 * years) // 30
+            + 29 * (months - 1) + months // 2 + days)
+
+
+def gregorian_to_islamic_batch(dates, structured: bool = False):
+    """
+    Convert Gregorian dates to tabular Islamic dates in one vectorized pass.
+
+    Takes and returns the same shapes as gregorian_to_ethiopian_batch.
+    """
+    _require_numpy()
+    day_numbers, mask = _day_numbers_and_mask(dates)
+    return _result_fields(day_numbers_to_islamic(day_numbers), mask, ISLAMIC_DTYPE, structured)
+
+
+def islamic_to_gregorian_batch(years, months=None, days=None, as_day_numbers: bool = False):
+    """
+    Convert tabular Islamic dates to Gregorian dates in one vectorized pass.
+
+    Takes and returns the same shapes as ethiopian_to_gregorian_batch.
+    """
+    _require_numpy()
+    fields, mask = _fields_and_mask(years, months, days)
+    return _result_dates(islamic_to_day_numbers(*fields), mask, as_day_numbers)
@@ -0,0 +1,242 @@
+"""
+Modern Calendar System - Frontend Data Bundles
+Exports precomputed Ethiopian calendar data for the JS, React and PHP clients
+
+The build writes, into one output directory:
+
+    manifest.json                  bundle version, conventions, file list with hashes
+    locales.json                   month/day names per language, holiday names
+    ethiopian-2010-2019.json       one chunk per decade of Ethiopian years
+    ethiopian-2010-2019.bin        the same chunk as fixed-width binary records
+
+Conventions shared by every file, chosen to match JavaScript's Date and
+PHP's date('w'):
+
+* day numbers are days since 1970-01-01 (multiply by 86400000 for a JS
+  timestamp), and
+* weekdays count from 0 = Sunday; localized day names are Sunday-first.
+
+Output is deterministic (sorted keys, no timestamps), chunks cover fixed
+decades, and the manifest lists each file's SHA-256. Regenerating after a
+rule change therefore only changes the chunks it affects, and clients can
+refetch just the files whose hash moved. Files compress well with gzip;
+``compress=True`` (``--gzip`` on the command line) also writes
+reproducible .gz copies.
+
+Binary chunk layout (little-endian):
+
+    header   8s magic, H bundle version, H header size, i first year, H year count
+    years    per year: i first day, B weekday, B Pagume length,
+             13s month start weekdays, B holiday count
+    holidays per holiday, year by year: H day of year (1-based), B holiday id
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import struct
+from typing import Dict, Iterable, List, Tuple
+
+from . import __version__
+from .day_numbers import ethiopian_days_in_month, ethiopian_year_start
+from .holiday_rules import ETHIOPIAN_HOLIDAYS, HolidayCalendar
+from .locales import LOCALES
+
+BUNDLE_FORMAT = 'modern-calendar-bundle'
+
+# Bump when a file layout changes; clients should refuse other versions
+BUNDLE_VERSION = 1
+
+MAGIC = b'MCALBND\x00'
+HEADER = struct.Struct('<8sHHiH')
+YEAR_RECORD = struct.Struct('<iBB13sB')
+HOLIDAY_RECORD = struct.Struct('<HB')
+
+# Day number (date.toordinal()) of 1970-01-01
+UNIX_EPOCH_RD = 719163
+
+CHUNK_YEARS = 10
+
+DEFAULT_FIRST_YEAR = 1900
+DEFAULT_LAST_YEAR = 2100
+
+YEAR_FIELDS = ('year', 'first_day', 'weekday', 'pagume_days', 'month_weekdays', 'holidays')
+
+
+def _sunday_weekday(rd: int) -> int:
+    """Weekday with 0 = Sunday (JS getDay / PHP date('w'))"""
+    return rd % 7
+
+
+def _sunday_first(names: Tuple[str, ...]) -> List[str]:
+    """Reorder Monday-first locale names to Sunday-first"""
+    return list(names[-1:] + names[:-1])
+
+
+def year_record(year: int, holiday_ids: Dict[str, int],
+                holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> list:
+    """One Ethiopian year as a list of YEAR_FIELDS values"""
+    first = ethiopian_year_start(year)
+    last = ethiopian_year_start(year + 1) - 1
+    month_weekdays = [_sunday_weekday(first + 30 * month) for month in range(13)]
+    year_holidays = [
+        [holiday.day_number - first + 1, holiday_ids[holiday.name]]
+        for holiday in holidays.holidays_between(first, last)
+    ]
+    return [year, first - UNIX_EPOCH_RD, _sunday_weekday(first),
+            ethiopian_days_in_month(year, 13), month_weekdays, year_holidays]
+
+
+def build_chunk(first_year: int, last_year: int, holiday_ids: Dict[str, int],
+                holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> dict:
+    """JSON-ready data for Ethiopian years first_year..last_year"""
+    return {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'calendar': 'ethiopian',
+        'first_year': first_year,
+        'last_year': last_year,
+        'fields': list(YEAR_FIELDS),
+        'years': [year_record(year, holiday_ids, holidays)
+                  for year in range(first_year, last_year + 1)],
+    }
+
+
+def pack_chunk(chunk: dict) -> bytes:
+    """Binary form of a chunk (layout in the module docstring)"""
+    years = chunk['years']
+    parts = [HEADER.pack(MAGIC, BUNDLE_VERSION, HEADER.size, chunk['first_year'], len(years))]
+    for year, first_day, weekday, pagume_days, month_weekdays, year_holidays in years:
+        parts.append(YEAR_RECORD.pack(first_day, weekday, pagume_days,
+                                      bytes(month_weekdays), len(year_holidays)))
+    for record in years:
+        for day_of_year, holiday_id in record[5]:
+            parts.append(HOLIDAY_RECORD.pack(day_of_year, holiday_id))
+    return b''.join(parts)
+
+
+def build_locales_bundle(holiday_names: List[str]) -> dict:
+    """Localized names for every language, Sunday-first"""
+    languages = {}
+    for code in sorted(LOCALES):
+        locale = LOCALES[code]
+        languages[code] = {
+            'month_names': list(locale.month_names),
+            'ethiopian_month_names': list(locale.ethiopian_month_names),
+            'islamic_month_names': list(locale.islamic_month_names),
+            'day_names': _sunday_first(locale.day_names),
+            'day_names_short': _sunday_first(locale.day_names_short),
+            'weekend_days': sorted((day + 1) % 7 for day in locale.weekend_days),
+        }
+    return {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'languages': languages,
+        'holidays': holiday_names,
+    }
+
+
+def holiday_names(holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> List[str]:
+    """Holiday names in rule order; a name's index is its holiday id"""
+    names = []
+    for rule in holidays.rules:
+        if rule.name not in names:
+            names.append(rule.name)
+    return names
+
+
+def _dumps(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def _write(directory: str, name: str, data: bytes, compress: bool) -> dict:
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if compress:
+        # mtime=0 keeps the .gz byte-identical across builds
+        with open(path + '.gz', 'wb') as raw, \
+                gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as f:
+            f.write(data)
+    return {'name': name, 'bytes': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+
+def chunk_ranges(first_year: int, last_year: int,
+                 chunk_years: int = CHUNK_YEARS) -> Iterable[Tuple[int, int]]:
+    """Aligned (first, last) year ranges covering first_year..last_year"""
+    start = first_year - first_year % chunk_years
+    for chunk_first in range(start, last_year + 1, chunk_years):
+        yield chunk_first, chunk_first + chunk_years - 1
+
+
+def export_bundles(directory: str, first_year: int = DEFAULT_FIRST_YEAR,
+                   last_year: int = DEFAULT_LAST_YEAR, chunk_years: int = CHUNK_YEARS,
+                   compress: bool = False,
+                   holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> dict:
+    """
+    Write the bundle files for Ethiopian years first_year..last_year
+    (widened to whole chunks) and return the manifest.
+    """
+    if first_year < 1 or last_year < first_year:
+        raise ValueError(f"Invalid year range: {first_year}-{last_year}")
+    if chunk_years < 1:
+        raise ValueError(f"chunk_years must be positive, got {chunk_years}")
+    os.makedirs(directory, exist_ok=True)
+
+    names = holiday_names(holidays)
+    holiday_ids = {name: index for index, name in enumerate(names)}
+    chunks = []
+    for chunk_first, chunk_last in chunk_ranges(first_year, last_year, chunk_years):
+        chunk = build_chunk(max(chunk_first, 1), chunk_last, holiday_ids, holidays)
+        stem = f"ethiopian-{chunk['first_year']}-{chunk_last}"
+        chunks.append({
+            'first_year': chunk['first_year'],
+            'last_year': chunk_last,
+            'json': _write(directory, stem + '.json', _dumps(chunk), compress),
+            'bin': _write(directory, stem + '.bin', pack_chunk(chunk), compress),
+        })
+
+    manifest = {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'package_version': __version__,
+        'calendar': 'ethiopian',
+        'day_numbers': 'days since 1970-01-01',
+        'weekdays': '0 = Sunday',
+        'chunk_years': chunk_years,
+        'first_year': chunks[0]['first_year'],
+        'last_year': chunks[-1]['last_year'],
+        'locales': _write(directory, 'locales.json', _dumps(build_locales_bundle(names)), compress),
+        'chunks': chunks,
+    }
+    _write(directory, 'manifest.json', _dumps(manifest), compress)
+    return manifest
+
+
+def read_chunk(data: bytes) -> dict:
+    """Decode a binary chunk back into its JSON form (for checks and tooling)"""
+    magic, version, header_size, first_year, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != BUNDLE_VERSION:
+        raise ValueError(f"Not a version {BUNDLE_VERSION} calendar bundle")
+    years = []
+    offset = header_size
+    for year in range(first_year, first_year + count):
+        first_day, weekday, pagume_days, month_weekdays, holiday_count = \
+            YEAR_RECORD.unpack_from(data, offset)
+        offset += YEAR_RECORD.size
+        years.append([year, first_day, weekday, pagume_days, list(month_weekdays), holiday_count])
+    for record in years:
+        record[5] = [list(HOLIDAY_RECORD.unpack_from(data, offset + HOLIDAY_RECORD.size * i))
+                     for i in range(record[5])]
+        offset += HOLIDAY_RECORD.size * len(record[5])
+    return {
+        'format': BUNDLE_FORMAT,
+        'version': version,
+        'calendar': 'ethiopian',
+        'first_year': first_year,
+        'last_year': first_year + count - 1,
+        'fields': list(YEAR_FIELDS),
+        'years': years,
+    }
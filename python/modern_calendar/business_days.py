@@ -0,0 +1,144 @@
+"""
+Modern Calendar System - Business Days
+O(1) business-day counting and offsets using whole-week arithmetic
+"""
+
+from bisect import bisect_left
+from datetime import timedelta
+from functools import lru_cache
+from threading import Lock
+from typing import Iterable
+
+from .day_numbers import weekday
+
+# Saturday and Sunday (Monday = 0)
+DEFAULT_WEEKEND = (5, 6)
+
+# Extra days of holidays compiled beyond a requested range
+COVERAGE_MARGIN = 366
+
+
+def _day_number(date) -> int:
+    return date if isinstance(date, int) else date.toordinal()
+
+
+class BusinessCalendar:
+    """
+    Business-day arithmetic for a weekend mask and an optional holiday calendar.
+
+    Working days before a day number are counted with whole weeks plus a
+    per-weekday prefix table; holidays come from a sorted array of
+    working-day holidays that is compiled a year at a time as needed, so
+    the cost does not grow with the length of the range.
+    """
+
+    def __init__(self, weekend: Iterable[int] = DEFAULT_WEEKEND, holidays=None):
+        self.weekend = frozenset(weekend)
+        if not self.weekend <= set(range(7)) or len(self.weekend) == 7:
+            raise ValueError("weekend must be a proper subset of weekdays 0-6")
+        self.holidays = holidays
+
+        self._workdays = tuple(d for d in range(7) if d not in self.weekend)
+        self._week = len(self._workdays)
+        # _before[d]: working days among weekdays 0..d-1
+        self._before = tuple(sum(1 for w in self._workdays if w < d) for d in range(8))
+
+        # (first covered day, last covered day + 1, sorted working-day holidays)
+        self._coverage = (0, 0, ())
+        self._lock = Lock()
+
+    def _workdays_before(self, rd: int) -> int:
+        """Working days (ignoring holidays) in [RD 1, rd)"""
+        weeks, day = divmod(rd - 1, 7)
+        return weeks * self._week + self._before[day]
+
+    def _nth_workday(self, n: int) -> int:
+        """Day number of the working day with n working days before it"""
+        weeks, i = divmod(n, self._week)
+        return 1 + weeks * 7 + self._workdays[i]
+
+    def _covered(self, first: int, last: int):
+        """Holiday coverage including [first, last], extended if needed"""
+        lo, hi, days = self._coverage
+        if self.holidays is None or (lo <= first and last < hi and lo < hi):
+            return lo, hi, days
+        with self._lock:
+            lo, hi, days = self._coverage
+            if lo == hi:
+                lo = hi = first
+            new_lo = min(lo, first - COVERAGE_MARGIN)
+            new_hi = max(hi, last + 1 + COVERAGE_MARGIN)
+            before = self._working_holidays(new_lo, lo - 1) if new_lo < lo else []
+            after = self._working_holidays(hi, new_hi - 1) if hi < new_hi else []
+            self._coverage = (new_lo, new_hi, tuple(before) + days + tuple(after))
+            return self._coverage
+
+    def _working_holidays(self, first: int, last: int):
+        weekend = self.weekend
+        return [rd for rd in self.holidays.day_numbers_between(first, last)
+                if weekday(rd) not in weekend]
+
+    def is_business_day(self, date) -> bool:
+        """Check if a date (or day number) is neither weekend nor holiday"""
+        rd = _day_number(date)
+        if weekday(rd) in self.weekend:
+            return False
+        return self.holidays is None or not self.holidays.is_holiday(rd)
+
+    def count_business_days(self, start, end) -> int:
+        """
+        Count business days in [start, end), like numpy.busday_count.
+
+        When end is before start the result is negative and, as in NumPy,
+        counts the days in (end, start].
+        """
+        first, last = _day_number(start), _day_number(end)
+        if last < first:
+            return -self.count_business_days(last + 1, first + 1)
+        count = self._workdays_before(last) - self._workdays_before(first)
+        if self.holidays is None:
+            return count
+        lo, hi, days = self._covered(first, last)
+        return count - (bisect_left(days, last) - bisect_left(days, first))
+
+    def add_business_days(self, date, n: int):
+        """
+        Move n business days from a date, like numpy.busday_offset with
+        roll='forward': a non-business start first rolls to the next
+        business day when n is 0. Returns the same type as the input.
+        """
+        rd = _day_number(date)
+        if self.holidays is None:
+            result = self._nth_workday(self._workdays_before(rd) + n)
+        else:
+            result = self._offset_with_holidays(rd, n)
+        if isinstance(date, int):
+            return result
+        return date + timedelta(days=result - rd)
+
+    def _offset_with_holidays(self, rd: int, n: int) -> int:
+        # Estimate the span so the holiday array covers it up front
+        span = abs(n) * 7 // self._week + 7
+        lo, hi, days = self._covered(rd - span, rd + span)
+        while True:
+            # Business-day rank of rd relative to the covered holidays
+            k = self._workdays_before(rd) - bisect_left(days, rd) + n
+            h = 0
+            while True:
+                x = self._nth_workday(k + h)
+                if not lo <= x < hi:
+                    break
+                holidays_before = bisect_left(days, x)
+                if holidays_before != h:
+                    h = holidays_before
+                elif h < len(days) and days[h] == x:
+                    h += 1
+                else:
+                    return x
+            lo, hi, days = self._covered(min(rd, x) - span, max(rd, x) + span)
+
+
+@lru_cache(maxsize=32)
+def get_business_calendar(weekend=DEFAULT_WEEKEND, holidays=None) -> BusinessCalendar:
+    """Shared BusinessCalendar for a weekend mask and holiday calendar"""
+    return BusinessCalendar(weekend, holidays)
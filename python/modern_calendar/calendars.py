@@ -0,0 +1,472 @@
+"""
+Modern Calendar System - Python Implementation
+Supports multiple calendar types with date operations
+"""
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, List, Tuple
+import calendar as py_calendar
+
+from .caching import LRUCache, CacheInfo
+from .business_days import get_business_calendar
+from .formatting import MONTH_NAME_ATTRIBUTES, compile_pattern, format_many
+from .holiday_rules import ETHIOPIAN_HOLIDAYS, GREGORIAN_HOLIDAYS, Holiday
+from .day_numbers import (
+    EthiopianYearIndex, IslamicMonthTable, get_ethiopian_year_index,
+    ethiopian_to_rd, rd_to_ethiopian, gregorian_to_rd, rd_to_gregorian,
+    islamic_to_rd, rd_to_islamic, is_islamic_leap_year, islamic_days_in_month,
+    rd_to_jd, jd_to_rd, weekday
+)
+from .locales import ETHIOPIAN_MONTH_NAMES, LOCALES
+
+# One month of a year view: month number, localized name and week rows
+MonthGrid = namedtuple('MonthGrid', ['month', 'name', 'weeks'])
+
+# Shared month grids keyed on (calendar type, year, month, first weekday);
+# whole-year views use None for the month
+MONTH_GRID_CACHE = LRUCache(maxsize=256)
+
+
+class ModernCalendar:
+    """Modern calendar system supporting multiple calendar types"""
+    
+    def __init__(self, calendar_type: str = 'gregorian', language: str = 'en'):
+        self.calendar_type = calendar_type
+        self.language = language
+        self._current_date: Optional[datetime] = None
+        
+        # Shared calendar and locale singletons
+        self.calendars = CALENDARS
+        self.languages = LOCALES
+    
+    @property
+    def current_date(self) -> datetime:
+        """Local time when first read (no clock call on construction)"""
+        if self._current_date is None:
+            self._current_date = datetime.now()
+        return self._current_date
+    
+    @current_date.setter
+    def current_date(self, value: datetime) -> None:
+        self._current_date = value
+    
+    def get_calendar(self):
+        """Get the current calendar implementation"""
+        return self.calendars.get(self.calendar_type, self.calendars['gregorian'])
+    
+    def get_locale(self):
+        """Get the current language locale"""
+        return self.languages.get(self.language) or self.languages['en']
+    
+    def today(self) -> datetime:
+        """Get today's date"""
+        return datetime.now()
+    
+    def format_date(self, date: datetime, format_type: str = 'full') -> str:
+        """Format a date according to the current calendar and language"""
+        calendar_impl = self.get_calendar()
+        locale = self.get_locale()
+        
+        return calendar_impl.format_date(date, locale, format_type)
+    
+    def compile_format(self, pattern: str):
+        """Compile a strftime-style pattern for the current calendar and language"""
+        return self.get_calendar().compile_format(pattern, self.get_locale())
+    
+    def format_many(self, dates, pattern: str) -> List[str]:
+        """Format a batch of dates with one compiled pattern"""
+        return format_many(self.compile_format(pattern), dates)
+    
+    def get_month_calendar(self, year: int, month: int,
+                           first_weekday: int = 0) -> Tuple[Tuple[int, ...], ...]:
+        """Get calendar grid for a specific month (cached, immutable)"""
+        calendar_type = self.calendar_type if self.calendar_type in self.calendars else 'gregorian'
+        key = (calendar_type, year, month, first_weekday)
+        grid = MONTH_GRID_CACHE.get(key)
+        if grid is None:
+            calendar_impl = self.calendars[calendar_type]
+            grid = tuple(map(tuple, calendar_impl.get_month_calendar(year, month, first_weekday)))
+            MONTH_GRID_CACHE.put(key, grid)
+        return grid
+    
+    def get_year_calendar(self, year: int, first_weekday: int = 0) -> Tuple[MonthGrid, ...]:
+        """Get every month grid of a year with month names for the current language"""
+        calendar_type = self.calendar_type if self.calendar_type in self.calendars else 'gregorian'
+        key = (calendar_type, year, None, first_weekday)
+        grids = MONTH_GRID_CACHE.get(key)
+        if grids is None:
+            calendar_impl = self.calendars[calendar_type]
+            grids = tuple(
+                tuple(map(tuple, grid))
+                for grid in calendar_impl.get_year_calendar(year, first_weekday)
+            )
+            MONTH_GRID_CACHE.put(key, grids)
+        
+        month_names = getattr(self.get_locale(), MONTH_NAME_ATTRIBUTES[calendar_type])
+        return tuple(
+            MonthGrid(month, month_names[month - 1], weeks)
+            for month, weeks in enumerate(grids, 1)
+        )
+    
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Get month grid cache statistics"""
+        return MONTH_GRID_CACHE.cache_info()
+    
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the month grid cache"""
+        MONTH_GRID_CACHE.cache_clear()
+    
+    def get_month_name(self, month: int) -> str:
+        """Get month name in current language"""
+        locale = self.get_locale()
+        return locale.month_names[month - 1]
+    
+    def get_day_name(self, day: int) -> str:
+        """Get day name in current language"""
+        locale = self.get_locale()
+        return locale.day_names[day]
+    
+    def add_days(self, date: datetime, days: int) -> datetime:
+        """Add days to a date"""
+        return date + timedelta(days=days)
+    
+    def add_months(self, date: datetime, months: int) -> datetime:
+        """Add months to a date"""
+        calendar_impl = self.get_calendar()
+        return calendar_impl.add_months(date, months)
+    
+    def is_weekend(self, date: datetime) -> bool:
+        """Check if date is weekend for the current language"""
+        return date.weekday() in self.get_locale().weekend_days
+    
+    def is_holiday(self, date: datetime) -> bool:
+        """Check if date is a holiday (can be extended)"""
+        calendar_impl = self.get_calendar()
+        return calendar_impl.is_holiday(date)
+    
+    def get_business_calendar(self):
+        """Get the shared business-day calendar for the current calendar and language"""
+        return get_business_calendar(self.get_locale().weekend_days, self.get_calendar().holidays)
+    
+    def is_business_day(self, date: datetime) -> bool:
+        """Check if date is neither weekend nor holiday"""
+        return self.get_business_calendar().is_business_day(date)
+    
+    def add_business_days(self, date: datetime, days: int) -> datetime:
+        """Add business days to a date, skipping weekends and holidays"""
+        return self.get_business_calendar().add_business_days(date, days)
+    
+    def count_business_days(self, start: datetime, end: datetime) -> int:
+        """Count business days from start up to (not including) end"""
+        return self.get_business_calendar().count_business_days(start, end)
+    
+    def get_holidays(self, start: datetime, end: datetime) -> List[Holiday]:
+        """Get all holidays from start to end inclusive"""
+        calendar_impl = self.get_calendar()
+        return calendar_impl.holidays.holidays_between(start, end)
+    
+    def get_date_info(self, date: datetime) -> Dict:
+        """Get comprehensive date information"""
+        calendar_impl = self.get_calendar()
+        locale = self.get_locale()
+        
+        return {
+            'formatted': self.format_date(date),
+            'day_name': locale.day_names[date.weekday()],
+            'month_name': locale.month_names[date.month - 1],
+            'year': date.year,
+            'month': date.month,
+            'day': date.day,
+            'weekday': date.weekday(),
+            'is_weekend': self.is_weekend(date),
+            'is_holiday': self.is_holiday(date),
+            'calendar_type': self.calendar_type,
+            'language': self.language
+        }
+
+
+class BaseCalendar:
+    """Base calendar implementation"""
+    
+    calendar_type = None
+    holidays = GREGORIAN_HOLIDAYS
+    
+    # Format patterns for the 'full' and 'short' styles; anything else uses 'medium'
+    format_patterns = {}
+    
+    def format_date(self, date: datetime, locale, format_type: str = 'full') -> str:
+        """Format date using the calendar's pattern for the style"""
+        pattern = self.format_patterns.get(format_type) or self.format_patterns['medium']
+        return self.compile_format(pattern, locale)(date.toordinal())
+    
+    def compile_format(self, pattern: str, locale):
+        """Compile a strftime-style pattern for this calendar"""
+        return compile_pattern(pattern, self.calendar_type, locale)
+    
+    def get_month_calendar(self, year: int, month: int, first_weekday: int = 0) -> List[List[int]]:
+        """Get month calendar grid"""
+        cal = py_calendar.Calendar(first_weekday).monthdayscalendar(year, month)
+        return cal
+    
+    @staticmethod
+    def build_month_grid(first_day: int, days_in_month: int, first_weekday: int = 0) -> List[List[int]]:
+        """Build a week-by-week grid for a month starting on a day number"""
+        # Pad with zeros before the first day and after the last day
+        lead = (weekday(first_day) - first_weekday) % 7
+        cells = [0] * lead + list(range(1, days_in_month + 1))
+        cells += [0] * (-len(cells) % 7)
+        return [cells[i:i + 7] for i in range(0, len(cells), 7)]
+    
+    def months_in_year(self, year: int) -> int:
+        """Number of months in a year"""
+        return 12
+    
+    def days_in_month(self, year: int, month: int) -> int:
+        """Number of days in a month"""
+        return py_calendar.monthrange(year, month)[1]
+    
+    def get_year_calendar(self, year: int, first_weekday: int = 0) -> List[List[List[int]]]:
+        """Get the grids of every month in a year in one pass"""
+        first_day = self.to_day_number(year, 1, 1)
+        grids = []
+        for month in range(1, self.months_in_year(year) + 1):
+            days = self.days_in_month(year, month)
+            grids.append(self.build_month_grid(first_day, days, first_weekday))
+            first_day += days
+        return grids
+    
+    def to_day_number(self, year: int, month: int, day: int) -> int:
+        """Convert date to a fixed day number"""
+        return gregorian_to_rd(year, month, day)
+    
+    def from_day_number(self, rd: int) -> Tuple[int, int, int]:
+        """Convert a fixed day number to date"""
+        return rd_to_gregorian(rd)
+    
+    def add_months(self, date: datetime, months: int) -> datetime:
+        """Add months to date"""
+        month = date.month - 1 + months
+        year = date.year + month // 12
+        month = month % 12 + 1
+        day = min(date.day, py_calendar.monthrange(year, month)[1])
+        return date.replace(year=year, month=month, day=day)
+    
+    def is_holiday(self, date: datetime) -> bool:
+        """Check if date is holiday"""
+        return self.holidays.is_holiday(date)
+
+
+class GregorianCalendar(BaseCalendar):
+    """Gregorian calendar implementation"""
+    
+    calendar_type = 'gregorian'
+    format_patterns = {
+        'full': '%A, %B %-d, %Y',
+        'short': '%-m/%-d/%Y',
+        'medium': '%B %-d, %Y'
+    }
+
+
+class EthiopianCalendar(BaseCalendar):
+    """Ethiopian calendar implementation"""
+    
+    calendar_type = 'ethiopian'
+    holidays = ETHIOPIAN_HOLIDAYS
+    format_patterns = {
+        'full': '%A, %-d %B %Y',
+        'short': '%-m/%-d/%Y',
+        'medium': '%-d %B %Y',
+        'geez': '%A, %Od %B %OY'
+    }
+    
+    def __init__(self, year_index: Optional[EthiopianYearIndex] = None, conversion_table=None):
+        self.jd_epoch = 1724220.5  # Ethiopian epoch: August 29, 8 CE
+        self._year_index = year_index
+        # Optional memory-mapped ConversionTable for holiday checks; days
+        # outside its window (and all conversions) use arithmetic
+        self.conversion_table = conversion_table
+        self.ethiopian_months = ETHIOPIAN_MONTH_NAMES
+    
+    @property
+    def year_index(self) -> EthiopianYearIndex:
+        """Year-start index, defaulting to the shared one built on first use"""
+        if self._year_index is None:
+            self._year_index = get_ethiopian_year_index()
+        return self._year_index
+    
+    def gregorian_to_jd(self, date: datetime) -> float:
+        """Convert Gregorian date to Julian Day"""
+        return rd_to_jd(date.toordinal())
+    
+    def jd_to_ethiopian(self, jd: float) -> Tuple[int, int, int]:
+        """Convert Julian Day to Ethiopian date"""
+        year, month, day = rd_to_ethiopian(jd_to_rd(jd))
+        if year <= 0:
+            year -= 1
+        return year, month, day
+    
+    def ethiopian_to_jd(self, year: int, month: int, day: int) -> float:
+        """Convert Ethiopian date to Julian Day"""
+        if year < 0:
+            year += 1
+        return rd_to_jd(ethiopian_to_rd(year, month, day))
+    
+    def gregorian_to_ethiopian(self, date: datetime) -> Tuple[int, int, int]:
+        """Convert Gregorian date to Ethiopian date"""
+        return rd_to_ethiopian(date.toordinal())
+    
+    def ethiopian_to_gregorian(self, year: int, month: int, day: int) -> datetime:
+        """Convert Ethiopian date to Gregorian date"""
+        return datetime.fromordinal(ethiopian_to_rd(year, month, day))
+    
+    def to_day_number(self, year: int, month: int, day: int) -> int:
+        """Convert Ethiopian date to a fixed day number"""
+        return ethiopian_to_rd(year, month, day)
+    
+    def from_day_number(self, rd: int) -> Tuple[int, int, int]:
+        """Convert a fixed day number to Ethiopian date"""
+        return rd_to_ethiopian(rd)
+    
+    def is_holiday(self, date: datetime) -> bool:
+        """Check if date is holiday"""
+        table = self.conversion_table
+        if table is not None:
+            flag = table.holiday_flag(date if isinstance(date, int) else date.toordinal())
+            if flag is not None:
+                return flag
+        return self.holidays.is_holiday(date)
+    
+    def is_leap_year(self, year: int) -> bool:
+        """Check if Ethiopian year is leap year"""
+        return self.year_index.is_leap_year(year)
+    
+    def months_in_year(self, year: int) -> int:
+        """Number of months in an Ethiopian year, Pagume included"""
+        return 13
+    
+    def days_in_month(self, year: int, month: int) -> int:
+        """Number of days in an Ethiopian month"""
+        return self.year_index.days_in_month(year, month)
+    
+    def get_month_calendar(self, year: int, month: int, first_weekday: int = 0) -> List[List[int]]:
+        """Get Ethiopian month calendar grid"""
+        # For Ethiopian calendar, we need to handle 13 months
+        days_in_month = self.year_index.days_in_month(year, month)
+        
+        first_day = self.year_index.month_start(year, month)
+        return self.build_month_grid(first_day, days_in_month, first_weekday)
+    
+    def jd_to_gregorian(self, jd: float) -> Tuple[int, int, int]:
+        """Convert Julian Day to Gregorian date"""
+        year, month, day = rd_to_gregorian(jd_to_rd(jd))
+        if year <= 0:
+            year -= 1
+        return year, month, day
+
+
+class IslamicCalendar(BaseCalendar):
+    """Islamic (tabular Hijri) calendar implementation"""
+    
+    calendar_type = 'islamic'
+    format_patterns = {
+        'full': '%-d %B %Y هـ',
+        'short': '%-m/%-d/%Y',
+        'medium': '%-d %B %Y'
+    }
+    
+    def __init__(self, month_table: Optional[IslamicMonthTable] = None):
+        # Optional observed month starts; tabular arithmetic otherwise
+        self.month_table = month_table
+    
+    def to_day_number(self, year: int, month: int, day: int) -> int:
+        """Convert Islamic date to a fixed day number"""
+        if self.month_table is not None:
+            return self.month_table.to_rd(year, month, day)
+        return islamic_to_rd(year, month, day)
+    
+    def from_day_number(self, rd: int) -> Tuple[int, int, int]:
+        """Convert a fixed day number to Islamic date"""
+        if self.month_table is not None:
+            return self.month_table.from_rd(rd)
+        return rd_to_islamic(rd)
+    
+    def gregorian_to_islamic(self, date: datetime) -> Tuple[int, int, int]:
+        """Convert Gregorian date to Islamic date"""
+        return self.from_day_number(date.toordinal())
+    
+    def islamic_to_gregorian(self, year: int, month: int, day: int) -> datetime:
+        """Convert Islamic date to Gregorian date"""
+        return datetime.fromordinal(self.to_day_number(year, month, day))
+    
+    def year_start(self, year: int) -> int:
+        """Day number of Muharram 1 of a year"""
+        return self.to_day_number(year, 1, 1)
+    
+    def is_leap_year(self, year: int) -> bool:
+        """Check if Islamic year is a 355-day leap year"""
+        return is_islamic_leap_year(year)
+    
+    def days_in_month(self, year: int, month: int) -> int:
+        """Number of days in an Islamic month (29 or 30)"""
+        if self.month_table is not None:
+            return self.month_table.days_in_month(year, month)
+        return islamic_days_in_month(year, month)
+    
+    def compile_format(self, pattern: str, locale):
+        """Compile a strftime-style pattern for this calendar"""
+        if self.month_table is None:
+            return compile_pattern(pattern, self.calendar_type, locale)
+        return compile_pattern(pattern, self.calendar_type, locale,
+                               (self.from_day_number, self.year_start))
+    
+    def get_month_calendar(self, year: int, month: int, first_weekday: int = 0) -> List[List[int]]:
+        """Get Islamic month calendar grid"""
+        first_day = self.to_day_number(year, month, 1)
+        return self.build_month_grid(first_day, self.days_in_month(year, month), first_weekday)
+
+
+def build_calendars() -> Dict[str, BaseCalendar]:
+    """Construct a fresh set of calendar implementations"""
+    return {
+        'gregorian': GregorianCalendar(),
+        'ethiopian': EthiopianCalendar(),
+        'islamic': IslamicCalendar()
+    }
+
+
+# Process-wide registry shared by every ModernCalendar instance
+CALENDARS = MappingProxyType(build_calendars())
+
+
+class DateDisplay:
+    """Date display utility class"""
+    
+    def __init__(self, calendar_type: str = 'gregorian', language: str = 'en'):
+        self.calendar = ModernCalendar(calendar_type, language)
+    
+    def display_date(self, date: datetime = None, format_type: str = 'full') -> str:
+        """Display formatted date"""
+        if date is None:
+            date = datetime.now()
+        
+        return self.calendar.format_date(date, format_type)
+    
+    def display_date_info(self, date: datetime = None) -> Dict:
+        """Display comprehensive date information"""
+        if date is None:
+            date = datetime.now()
+        
+        return self.calendar.get_date_info(date)
+    
+    def display_month_calendar(self, year: int = None, month: int = None) -> Tuple[Tuple[int, ...], ...]:
+        """Display month calendar grid"""
+        if year is None:
+            year = datetime.now().year
+        if month is None:
+            month = datetime.now().month
+        
+        return self.calendar.get_month_calendar(year, month)
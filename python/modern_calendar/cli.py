@@ -0,0 +1,218 @@
+"""
+Modern Calendar System - Command Line Interface
+Streaming CSV / JSON Lines date conversion between Gregorian and Ethiopian,
+the HTTP service and the frontend data bundle export
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import date
+from typing import Callable, List, Optional
+
+from .calendars import CALENDARS
+from .locales import LOCALES
+from .parsing import parse_ethiopian_day_number
+
+STYLES = ('iso', 'full', 'short', 'medium', 'geez')
+
+
+class ConversionError(ValueError):
+    """Raised when a date value cannot be converted"""
+
+
+def parse_gregorian(value: str) -> int:
+    """Day number of an ISO Gregorian date string (YYYY-MM-DD)"""
+    return date.fromisoformat(value.strip()[:10]).toordinal()
+
+
+def build_converter(target: str, style: str, language: str) -> Callable[[str], str]:
+    """Build a string -> string converter for one direction and output style"""
+    calendar_impl = CALENDARS[target]
+    locale = LOCALES.get(language) or LOCALES['en']
+    parse = parse_gregorian if target == 'ethiopian' else parse_ethiopian_day_number
+
+    if style == 'iso':
+        render = calendar_impl.compile_format('%Y-%m-%d', locale)
+    else:
+        render = calendar_impl.compile_format(
+            calendar_impl.format_patterns.get(style) or calendar_impl.format_patterns['medium'],
+            locale
+        )
+
+    def convert(value: str) -> str:
+        return render(parse(value))
+
+    return convert
+
+
+def _convert_row(row: dict, columns: List[str], convert: Callable, suffix: str,
+                 errors: str, line: int) -> dict:
+    for column in columns:
+        value = row.get(column)
+        if value is None or value == '':
+            if suffix:
+                row[column + suffix] = ''
+            continue
+        try:
+            converted = convert(str(value))
+        except ValueError as e:
+            if errors == 'strict':
+                raise ConversionError(f"line {line}, column {column!r}: {e}") from None
+            converted = '' if errors == 'blank' else value
+        row[column + suffix] = converted
+    return row
+
+
+def convert_csv(infile, outfile, columns, convert, suffix='', errors='strict') -> int:
+    """Stream a CSV file, converting the named columns row by row"""
+    reader = csv.DictReader(infile)
+    fieldnames = list(reader.fieldnames or [])
+    width = len(fieldnames)
+    missing = [c for c in columns if c not in fieldnames]
+    if missing:
+        raise ConversionError(f"Columns not found in input: {', '.join(missing)}")
+    if suffix:
+        fieldnames += [c + suffix for c in columns]
+
+    writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+    writer.writeheader()
+    rows = 0
+    for rows, row in enumerate(reader, 1):
+        # DictReader collects fields beyond the header under the None key
+        if None in row:
+            raise ConversionError(f"line {rows + 1}: {width + len(row[None])} fields, "
+                                  f"header has {width}")
+        writer.writerow(_convert_row(row, columns, convert, suffix, errors, rows + 1))
+    return rows
+
+
+def convert_jsonl(infile, outfile, columns, convert, suffix='', errors='strict') -> int:
+    """Stream a JSON Lines file, converting the named fields record by record"""
+    rows = 0
+    for line, text in enumerate(infile, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            raise ConversionError(f"line {line}: invalid JSON ({e})") from None
+        if not isinstance(record, dict):
+            raise ConversionError(f"line {line}: expected a JSON object")
+        record = _convert_row(record, columns, convert, suffix, errors, line)
+        outfile.write(json.dumps(record, ensure_ascii=False))
+        outfile.write('\n')
+        rows += 1
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m modern_calendar',
+                                     description='Modern Calendar System tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser('convert', help='Convert date columns in CSV or JSON Lines')
+    convert.add_argument('input', nargs='?', default='-', help='Input file (default: stdin)')
+    convert.add_argument('-c', '--columns', required=True,
+                         help='Comma-separated date column names')
+    convert.add_argument('--to', dest='target', choices=('ethiopian', 'gregorian'),
+                         default='ethiopian', help='Target calendar (default: ethiopian)')
+    convert.add_argument('--input-format', choices=('csv', 'jsonl'),
+                         help='Input format (default: from file extension, else csv)')
+    convert.add_argument('--style', choices=STYLES, default='iso',
+                         help='Output style: iso or a format_date style (default: iso)')
+    convert.add_argument('--language', default='en', help='Locale for month and day names')
+    convert.add_argument('--suffix', default='',
+                         help='Write results to <column><suffix> instead of in place')
+    convert.add_argument('--errors', choices=('strict', 'keep', 'blank'), default='strict',
+                         help='On unparseable values: fail, keep the input, or blank it')
+    convert.add_argument('-o', '--output', default='-', help='Output file (default: stdout)')
+
+    serve = commands.add_parser('serve', help='Run the JSON HTTP conversion service')
+    serve.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    serve.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    serve.add_argument('--cache-size', type=int, default=4096,
+                       help='Cached responses kept in memory (default: 4096)')
+
+    export = commands.add_parser('export-bundles',
+                                 help='Export calendar data bundles for the JS, React and PHP clients')
+    export.add_argument('-o', '--output', default='calendar-data',
+                        help='Output directory (default: calendar-data)')
+    export.add_argument('--first-year', type=int, default=1900,
+                        help='First Ethiopian year (default: 1900)')
+    export.add_argument('--last-year', type=int, default=2100,
+                        help='Last Ethiopian year (default: 2100)')
+    export.add_argument('--chunk-years', type=int, default=10,
+                        help='Ethiopian years per chunk file (default: 10)')
+    export.add_argument('--gzip', action='store_true', help='Also write .gz copies')
+    return parser
+
+
+def _open(path: str, mode: str):
+    try:
+        return open(path, mode, newline='', encoding='utf-8')
+    except OSError as e:
+        raise ConversionError(f"cannot open {path}: {e.strerror or e}") from None
+
+
+def run_convert(args) -> int:
+    columns = [c.strip() for c in args.columns.split(',') if c.strip()]
+    input_format = args.input_format
+    if input_format is None:
+        input_format = 'jsonl' if args.input.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+    convert = build_converter(args.target, args.style, args.language)
+    stream = convert_jsonl if input_format == 'jsonl' else convert_csv
+
+    infile = sys.stdin if args.input == '-' else _open(args.input, 'r')
+    try:
+        outfile = sys.stdout if args.output == '-' else _open(args.output, 'w')
+    except ConversionError:
+        if infile is not sys.stdin:
+            infile.close()
+        raise
+    start = time.perf_counter()
+    try:
+        rows = stream(infile, outfile, columns, convert, args.suffix, args.errors)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+        else:
+            outfile.flush()
+
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else float('inf')
+    print(f"Converted {rows} rows in {elapsed:.3f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == 'convert':
+            return run_convert(args)
+        if args.command == 'serve':
+            from .server import serve
+            serve(args.host, args.port, args.cache_size)
+            return 0
+        if args.command == 'export-bundles':
+            from .bundles import export_bundles
+            manifest = export_bundles(args.output, args.first_year, args.last_year,
+                                      args.chunk_years, args.gzip)
+            print(f"Wrote {len(manifest['chunks'])} chunks for Ethiopian years "
+                  f"{manifest['first_year']}-{manifest['last_year']} to {args.output}",
+                  file=sys.stderr)
+            return 0
+    except ConversionError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""
+Modern Calendar System - Conversion Table
+Memory-mapped day-number -> Ethiopian date table shared across processes
+
+A table file holds one little-endian uint32 per day in a window of day
+numbers, packing the Ethiopian year, month and day, the weekday and a
+holiday bit. Readers mmap the file read-only, so every worker process on
+a machine shares the same page-cache pages instead of its own copy.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from datetime import date
+from typing import Optional, Tuple
+
+from .day_numbers import gregorian_to_rd, rd_to_ethiopian, weekday
+from .holiday_rules import ETHIOPIAN_HOLIDAYS, HolidayCalendar
+
+MAGIC = b'MCALTBL\x00'
+
+# Bump when the record layout or the conversion code changes
+FORMAT_VERSION = 1
+
+# magic, format version, header size, first day number, day count,
+# data fingerprint, payload CRC-32
+HEADER = struct.Struct('<8sHHiIII')
+
+# Record layout, low bits first: day (5), month (4), weekday (3), holiday (1),
+# 3 spare bits, then the Ethiopian year in the high 16 bits
+DAY_MASK = 0x1F
+MONTH_SHIFT = 5
+MONTH_MASK = 0x0F
+WEEKDAY_SHIFT = 9
+WEEKDAY_MASK = 0x07
+HOLIDAY_BIT = 1 << 12
+YEAR_SHIFT = 16
+
+DEFAULT_FIRST_YEAR = 1900
+DEFAULT_LAST_YEAR = 2100
+
+DEFAULT_PATH_ENV = 'MODERN_CALENDAR_TABLE'
+
+
+class StaleTableError(ValueError):
+    """Raised when a table file is corrupt or was built from different data"""
+
+
+def default_path() -> str:
+    """Table location: $MODERN_CALENDAR_TABLE, else the system temp directory"""
+    return os.environ.get(DEFAULT_PATH_ENV) or os.path.join(
+        tempfile.gettempdir(), f"modern_calendar_ethiopian_v{FORMAT_VERSION}.tbl")
+
+
+def data_fingerprint(holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> int:
+    """CRC-32 of the format version and holiday rules baked into a table"""
+    rules = [
+        (rule.__class__.__name__, sorted(vars(rule).items()))
+        for rule in holidays.rules
+    ]
+    return zlib.crc32(repr((FORMAT_VERSION, rules)).encode('utf-8'))
+
+
+def pack(year: int, month: int, day: int, weekday_: int, holiday: bool) -> int:
+    return ((year << YEAR_SHIFT) | (HOLIDAY_BIT if holiday else 0)
+            | (weekday_ << WEEKDAY_SHIFT) | (month << MONTH_SHIFT) | day)
+
+
+def build_table(first_rd: int, last_rd: int,
+                holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> array:
+    """Packed records for day numbers first_rd..last_rd inclusive"""
+    if rd_to_ethiopian(first_rd)[0] < 1 or rd_to_ethiopian(last_rd)[0] > 0xFFFF:
+        raise ValueError("Table window must lie within Ethiopian years 1-65535")
+    holiday_days = frozenset(holidays.day_numbers_between(first_rd, last_rd))
+
+    records = array('I')
+    year, month, day = rd_to_ethiopian(first_rd)
+    for rd in range(first_rd, last_rd + 1):
+        records.append(pack(year, month, day, weekday(rd), rd in holiday_days))
+        # Step the Ethiopian date without reconverting
+        day += 1
+        if day > 30 or (month == 13 and day > (6 if year % 4 == 3 else 5)):
+            day = 1
+            month += 1
+            if month > 13:
+                month = 1
+                year += 1
+    if sys.byteorder != 'little':
+        records.byteswap()
+    return records
+
+
+def write_table(path: Optional[str] = None, first_year: int = DEFAULT_FIRST_YEAR,
+                last_year: int = DEFAULT_LAST_YEAR,
+                holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS) -> str:
+    """
+    Write a table covering Gregorian first_year..last_year to path.
+
+    The file is written beside its destination and renamed into place, so
+    concurrent readers see either the old table or the complete new one.
+    """
+    path = path or default_path()
+    first_rd = gregorian_to_rd(first_year, 1, 1)
+    last_rd = gregorian_to_rd(last_year, 12, 31)
+    payload = build_table(first_rd, last_rd, holidays).tobytes()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, HEADER.size, first_rd,
+                         last_rd - first_rd + 1, data_fingerprint(holidays),
+                         zlib.crc32(payload))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.modern_calendar_', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+class ConversionTable:
+    """
+    Read-only, memory-mapped conversion table.
+
+    Lookups are a single indexed read into the mapping; day numbers outside
+    the window fall back to arithmetic in the callers.
+    """
+
+    def __init__(self, path: str, verify: bool = True,
+                 holidays: HolidayCalendar = ETHIOPIAN_HOLIDAYS):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise StaleTableError(f"{path}: empty file") from None
+        try:
+            self._validate(verify, data_fingerprint(holidays))
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def _validate(self, verify: bool, fingerprint: int) -> None:
+        if len(self._mmap) < HEADER.size:
+            raise StaleTableError(f"{self.path}: truncated header")
+        (magic, version, header_size, first_rd, count,
+         file_fingerprint, checksum) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise StaleTableError(f"{self.path}: not a conversion table")
+        if version != FORMAT_VERSION or file_fingerprint != fingerprint:
+            raise StaleTableError(f"{self.path}: built from different data (version {version})")
+        if len(self._mmap) != header_size + 4 * count:
+            raise StaleTableError(f"{self.path}: size does not match header")
+
+        payload = memoryview(self._mmap)[header_size:]
+        if verify and zlib.crc32(payload) != checksum:
+            payload.release()
+            raise StaleTableError(f"{self.path}: checksum mismatch")
+
+        self.first_day_number = first_rd
+        self.last_day_number = first_rd + count - 1
+        self._count = count
+        self.checksum = checksum
+        if sys.byteorder == 'little':
+            self._records = payload.cast('I')
+        else:
+            payload.release()
+            self._records = None
+
+    def __len__(self) -> int:
+        return self.last_day_number - self.first_day_number + 1
+
+    def __contains__(self, rd: int) -> bool:
+        return self.first_day_number <= rd <= self.last_day_number
+
+    def record(self, rd: int) -> int:
+        """Packed record of a day number in the window"""
+        index = rd - self.first_day_number
+        if index < 0:
+            raise IndexError(f"Day number {rd} is before the table window")
+        if self._records is not None:
+            return self._records[index]
+        return struct.unpack_from('<I', self._mmap, HEADER.size + 4 * index)[0]
+
+    def lookup(self, rd: int) -> Optional[Tuple[int, int, int]]:
+        """Ethiopian (year, month, day) of a day number, or None outside the window"""
+        index = rd - self.first_day_number
+        if not 0 <= index < self._count:
+            return None
+        value = self._records[index] if self._records is not None else self.record(rd)
+        return value >> YEAR_SHIFT, (value >> MONTH_SHIFT) & MONTH_MASK, value & DAY_MASK
+
+    def holiday_flag(self, rd: int) -> Optional[bool]:
+        """Whether a day number is a holiday, or None outside the window"""
+        index = rd - self.first_day_number
+        if not 0 <= index < self._count:
+            return None
+        value = self._records[index] if self._records is not None else self.record(rd)
+        return bool(value & HOLIDAY_BIT)
+
+    def ethiopian(self, rd: int) -> Tuple[int, int, int]:
+        """Ethiopian (year, month, day) of a day number in the window"""
+        value = self.record(rd)
+        return value >> YEAR_SHIFT, (value >> MONTH_SHIFT) & MONTH_MASK, value & DAY_MASK
+
+    def weekday(self, rd: int) -> int:
+        return (self.record(rd) >> WEEKDAY_SHIFT) & WEEKDAY_MASK
+
+    def is_holiday(self, rd: int) -> bool:
+        return bool(self.record(rd) & HOLIDAY_BIT)
+
+    def close(self) -> None:
+        if self._records is not None:
+            self._records.release()
+            self._records = None
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        first = date.fromordinal(self.first_day_number)
+        last = date.fromordinal(self.last_day_number)
+        return f"ConversionTable({self.path!r}, {first}..{last})"
+
+
+def load_table(path: Optional[str] = None, first_year: int = DEFAULT_FIRST_YEAR,
+               last_year: int = DEFAULT_LAST_YEAR, rebuild: bool = True,
+               verify: bool = True) -> ConversionTable:
+    """
+    Open a conversion table, rebuilding it first when it is missing,
+    corrupt, built from different data or does not cover the window.
+    """
+    path = path or default_path()
+    first_rd = gregorian_to_rd(first_year, 1, 1)
+    last_rd = gregorian_to_rd(last_year, 12, 31)
+    try:
+        table = ConversionTable(path, verify)
+    except (FileNotFoundError, StaleTableError):
+        if not rebuild:
+            raise
+    else:
+        if first_rd in table and last_rd in table:
+            return table
+        table.close()
+        if not rebuild:
+            raise StaleTableError(f"{path}: does not cover {first_year}-{last_year}")
+    write_table(path, first_year, last_year)
+    return ConversionTable(path, verify)
+
+
+def install_conversion_table(path: Optional[str] = None, first_year: int = DEFAULT_FIRST_YEAR,
+                             last_year: int = DEFAULT_LAST_YEAR) -> ConversionTable:
+    """
+    Load (rebuilding if stale) a table and use it for the shared Ethiopian
+    calendar's holiday checks. Call once at worker start-up, e.g. in a
+    gunicorn post_fork hook.
+    """
+    from .calendars import CALENDARS
+    table = load_table(path, first_year, last_year)
+    CALENDARS['ethiopian'].conversion_table = table
+    return table
@@ -0,0 +1,166 @@
+"""
+Modern Calendar System - Compact Date Encoding
+Fixed-width int32 encodings of Ethiopian dates for storage and transport
+
+Two encodings are supported, both exact round trips of the
+(year, month, day) triples EthiopianCalendar produces:
+
+* 'day_number': the fixed day number (date.toordinal() count). Dates
+  subtract to a day difference and convert to Gregorian for free.
+* 'ymd': a bitfield, ``year << 9 | month << 5 | day``. Fields decode
+  with shifts and masks alone, and packed values sort in date order.
+
+A column of dates is an array('i') in memory and, on the wire, the same
+values as little-endian int32 bytes: four bytes per date. dumps() and
+loads() move between the two, and loads() reads bytes, bytearray,
+memoryview or mmap data without copying on little-endian machines.
+NumPy reads the bytes directly with ``np.frombuffer(data, '<i4')``.
+"""
+
+import sys
+from array import array
+from typing import Iterable, Iterator, Sequence, Tuple, Union
+
+from .day_numbers import ETHIOPIAN_EPOCH, ethiopian_to_rd, rd_to_ethiopian
+
+ENCODINGS = ('day_number', 'ymd')
+
+# array typecode with 4-byte items on this platform
+INT32 = 'i' if array('i').itemsize == 4 else 'l'
+
+DAY_MASK = 0x1F
+MONTH_SHIFT = 5
+MONTH_MASK = 0x0F
+YEAR_SHIFT = 9
+
+# Years that fit the 23 signed bits left above month and day
+MIN_YMD_YEAR = -(1 << 22)
+MAX_YMD_YEAR = (1 << 22) - 1
+
+MIN_INT32 = -(1 << 31)
+MAX_INT32 = (1 << 31) - 1
+
+Buffer = Union[bytes, bytearray, memoryview, array]
+
+
+def _check_encoding(encoding: str) -> None:
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding: {encoding}")
+
+
+def _checked(year: int, month: int, day: int) -> None:
+    if not 1 <= month <= 13:
+        raise ValueError(f"month must be in 1..13, got {month}")
+    if not 1 <= day <= (30 if month < 13 else 6 if year % 4 == 3 else 5):
+        raise ValueError(f"day is out of range for {year}-{month:02d}, got {day}")
+
+
+def pack(year: int, month: int, day: int, encoding: str = 'day_number') -> int:
+    """Encode an Ethiopian date as an int32 value"""
+    _check_encoding(encoding)
+    _checked(year, month, day)
+    if encoding == 'ymd':
+        if not MIN_YMD_YEAR <= year <= MAX_YMD_YEAR:
+            raise ValueError(f"year {year} does not fit the ymd encoding")
+        return year << YEAR_SHIFT | month << MONTH_SHIFT | day
+    value = ethiopian_to_rd(year, month, day)
+    if not MIN_INT32 <= value <= MAX_INT32:
+        raise ValueError(f"year {year} does not fit the day_number encoding")
+    return value
+
+
+def unpack(value: int, encoding: str = 'day_number') -> Tuple[int, int, int]:
+    """Decode an int32 value back into an Ethiopian (year, month, day)"""
+    if encoding == 'ymd':
+        return value >> YEAR_SHIFT, (value >> MONTH_SHIFT) & MONTH_MASK, value & DAY_MASK
+    _check_encoding(encoding)
+    return rd_to_ethiopian(value)
+
+
+def pack_many(dates: Iterable[Tuple[int, int, int]], encoding: str = 'day_number') -> array:
+    """Encode (year, month, day) triples into an int32 array"""
+    _check_encoding(encoding)
+    result = array(INT32)
+    append = result.append
+    to_rd = ethiopian_to_rd
+    ymd = encoding == 'ymd'
+    for year, month, day in dates:
+        if not (1 <= month <= 13 and 1 <= day <= (30 if month < 13 else 6 if year % 4 == 3 else 5)):
+            _checked(year, month, day)
+        if ymd:
+            if not MIN_YMD_YEAR <= year <= MAX_YMD_YEAR:
+                raise ValueError(f"year {year} does not fit the ymd encoding")
+            append(year << YEAR_SHIFT | month << MONTH_SHIFT | day)
+        else:
+            value = to_rd(year, month, day)
+            if not MIN_INT32 <= value <= MAX_INT32:
+                raise ValueError(f"year {year} does not fit the day_number encoding")
+            append(value)
+    return result
+
+
+def unpack_many(values: Union[Sequence[int], Buffer],
+                encoding: str = 'day_number') -> Iterator[Tuple[int, int, int]]:
+    """Lazily decode int32 values (or little-endian int32 bytes) into triples"""
+    _check_encoding(encoding)
+    values = loads(values) if isinstance(values, (bytes, bytearray, memoryview)) else values
+    if encoding == 'ymd':
+        return ((value >> YEAR_SHIFT, (value >> MONTH_SHIFT) & MONTH_MASK, value & DAY_MASK)
+                for value in values)
+    return map(rd_to_ethiopian, values)
+
+
+def convert_many(values: Union[Sequence[int], Buffer], source: str, target: str) -> array:
+    """Re-encode a column from one encoding to the other without building triples"""
+    _check_encoding(source)
+    _check_encoding(target)
+    values = loads(values) if isinstance(values, (bytes, bytearray, memoryview)) else values
+    if source == target:
+        return array(INT32, values)
+
+    result = array(INT32)
+    append = result.append
+    if target == 'ymd':
+        for rd in values:
+            n = rd - ETHIOPIAN_EPOCH
+            year = (4 * n + 1463) // 1461
+            day_of_year = n - 365 * (year - 1) - year // 4
+            if not MIN_YMD_YEAR <= year <= MAX_YMD_YEAR:
+                raise ValueError(f"year {year} does not fit the ymd encoding")
+            append(year << YEAR_SHIFT | (day_of_year // 30 + 1) << MONTH_SHIFT
+                   | day_of_year % 30 + 1)
+    else:
+        to_rd = ethiopian_to_rd
+        for value in values:
+            append(to_rd(value >> YEAR_SHIFT, (value >> MONTH_SHIFT) & MONTH_MASK, value & DAY_MASK))
+    return result
+
+
+def dumps(values: Union[array, Iterable[int]]) -> bytes:
+    """Serialize int32 values as little-endian bytes"""
+    if not isinstance(values, array) or values.typecode != INT32:
+        values = array(INT32, values)
+    if sys.byteorder == 'little':
+        return values.tobytes()
+    values = array(INT32, values)
+    values.byteswap()
+    return values.tobytes()
+
+
+def loads(data: Buffer) -> Sequence[int]:
+    """
+    View little-endian int32 bytes as a sequence of ints.
+
+    On little-endian machines this is a zero-copy memoryview over ``data``
+    (release it before closing an mmap); otherwise a byte-swapped array.
+    """
+    if isinstance(data, array):
+        return data
+    view = memoryview(data).cast('B')
+    if len(view) % 4:
+        raise ValueError(f"Expected a multiple of 4 bytes, got {len(view)}")
+    if sys.byteorder == 'little':
+        return view.cast(INT32)
+    values = array(INT32, view.tobytes())
+    values.byteswap()
+    return values
@@ -0,0 +1,181 @@
+"""
+Modern Calendar System - Ethiopian Date Ranges
+Lazy, indexable ranges of Ethiopian days, month starts and year starts
+"""
+
+from typing import Iterator
+
+from .day_numbers import ethiopian_to_rd, ethiopian_year_start, rd_to_ethiopian
+from .ethiopian_date import EthiopianDate
+
+MONTHS_PER_YEAR = 13
+
+
+def _day_number(value) -> int:
+    """Day number of an int, date, datetime or EthiopianDate"""
+    return value if isinstance(value, int) else value.toordinal()
+
+
+class EthiopianRange:
+    """
+    Lazy sequence of Ethiopian dates over a Python range of indices.
+
+    Like range(), it supports len(), ``in``, reversed() and O(1) indexing
+    and slicing, so ``r[n]`` or ``r[n:]`` seeks without walking the
+    earlier items. Items are EthiopianDate values, or plain day numbers
+    when ``as_day_numbers`` is True.
+    """
+
+    def __init__(self, indices: range, as_day_numbers: bool = False):
+        self._indices = indices
+        self.as_day_numbers = as_day_numbers
+
+    def _day_number_at(self, index: int) -> int:
+        raise NotImplementedError
+
+    def _wrap(self, rd: int):
+        return rd if self.as_day_numbers else EthiopianDate.from_day_number(rd)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __bool__(self) -> bool:
+        return bool(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.__class__._from_indices(self._indices[item], self.as_day_numbers)
+        return self._wrap(self._day_number_at(self._indices[item]))
+
+    @classmethod
+    def _from_indices(cls, indices: range, as_day_numbers: bool):
+        result = cls.__new__(cls)
+        EthiopianRange.__init__(result, indices, as_day_numbers)
+        return result
+
+    def __iter__(self) -> Iterator:
+        day_number_at = self._day_number_at
+        wrap = self._wrap
+        for index in self._indices:
+            yield wrap(day_number_at(index))
+
+    def __reversed__(self) -> Iterator:
+        return iter(self[::-1])
+
+    def __contains__(self, value) -> bool:
+        index = self._index_of(_day_number(value))
+        return index is not None and index in self._indices
+
+    def _index_of(self, rd: int):
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        if not self:
+            return f"{self.__class__.__name__}(empty)"
+        first, last = self[0], self[-1]
+        return f"{self.__class__.__name__}({first}..{last}, {len(self)} items)"
+
+
+class EthiopianDayRange(EthiopianRange):
+    """Ethiopian days from start (inclusive) to stop (exclusive)"""
+
+    def __init__(self, start, stop, step: int = 1, as_day_numbers: bool = False):
+        super().__init__(range(_day_number(start), _day_number(stop), step), as_day_numbers)
+
+    def _day_number_at(self, index: int) -> int:
+        return index
+
+    def _index_of(self, rd: int):
+        return rd
+
+    def __iter__(self) -> Iterator:
+        if self.as_day_numbers:
+            return iter(self._indices)
+        return map(EthiopianDate.from_day_number, self._indices)
+
+
+class EthiopianMonthRange(EthiopianRange):
+    """
+    First days of Ethiopian months (Pagume included) falling in
+    [start, stop), every ``step`` months.
+    """
+
+    def __init__(self, start, stop, step: int = 1, as_day_numbers: bool = False):
+        if step < 1:
+            raise ValueError("step must be positive; use reversed() to walk backwards")
+        first = self._month_at_or_after(_day_number(start))
+        last = self._month_at_or_after(_day_number(stop))
+        super().__init__(range(first, last, step), as_day_numbers)
+
+    @staticmethod
+    def _month_at_or_after(rd: int) -> int:
+        """Index (year * 13 + month - 1) of the first month starting on or after rd"""
+        year, month, day = rd_to_ethiopian(rd)
+        index = year * MONTHS_PER_YEAR + month - 1
+        return index if day == 1 else index + 1
+
+    def _day_number_at(self, index: int) -> int:
+        year, month = divmod(index, MONTHS_PER_YEAR)
+        return ethiopian_to_rd(year, month + 1, 1)
+
+    def _index_of(self, rd: int):
+        year, month, day = rd_to_ethiopian(rd)
+        return year * MONTHS_PER_YEAR + month - 1 if day == 1 else None
+
+    def __iter__(self) -> Iterator:
+        indices = self._indices
+        if indices.step != 1 or not indices:
+            yield from super().__iter__()
+            return
+        # Consecutive months: advance the day number by each month's length
+        year, month = divmod(indices.start, MONTHS_PER_YEAR)
+        month += 1
+        rd = ethiopian_to_rd(year, month, 1)
+        wrap = self._wrap
+        for _ in indices:
+            yield wrap(rd)
+            if month < MONTHS_PER_YEAR:
+                rd += 30
+                month += 1
+            else:
+                rd += 6 if year % 4 == 3 else 5
+                year += 1
+                month = 1
+
+
+class EthiopianYearRange(EthiopianRange):
+    """New Year days (Meskerem 1) falling in [start, stop), every ``step`` years"""
+
+    def __init__(self, start, stop, step: int = 1, as_day_numbers: bool = False):
+        if step < 1:
+            raise ValueError("step must be positive; use reversed() to walk backwards")
+        first = self._year_at_or_after(_day_number(start))
+        last = self._year_at_or_after(_day_number(stop))
+        super().__init__(range(first, last, step), as_day_numbers)
+
+    @staticmethod
+    def _year_at_or_after(rd: int) -> int:
+        year, month, day = rd_to_ethiopian(rd)
+        return year if (month, day) == (1, 1) else year + 1
+
+    def _day_number_at(self, index: int) -> int:
+        return ethiopian_year_start(index)
+
+    def _index_of(self, rd: int):
+        year, month, day = rd_to_ethiopian(rd)
+        return year if (month, day) == (1, 1) else None
+
+
+def ethiopian_days(start, stop, step: int = 1, as_day_numbers: bool = False) -> EthiopianDayRange:
+    """Lazy range of Ethiopian days in [start, stop)"""
+    return EthiopianDayRange(start, stop, step, as_day_numbers)
+
+
+def ethiopian_months(start, stop, step: int = 1, as_day_numbers: bool = False) -> EthiopianMonthRange:
+    """Lazy range of Ethiopian month starts in [start, stop)"""
+    return EthiopianMonthRange(start, stop, step, as_day_numbers)
+
+
+def ethiopian_years(start, stop, step: int = 1, as_day_numbers: bool = False) -> EthiopianYearRange:
+    """Lazy range of Ethiopian New Year days in [start, stop)"""
+    return EthiopianYearRange(start, stop, step, as_day_numbers)
@@ -6,9 +6,13 @@ Supports Ethiopian, Gregorian, and Islamic calendars with GUI integration
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime, date
-import calendar
 from typing import Optional, Callable, Dict, Any
-from .modern_calendar import ModernCalendar, EthiopianLocale, OromoLocale, EnglishLocale
+from .calendars import ModernCalendar
+from .month_view import MonthViewModel
+from .parsing import parse_ethiopian_day_number
+
+# (text, style) of a freshly created day button
+BLANK_CELL_STATE = ('', 'TButton')
 
 class ModernDatePicker:
     """
@@ -31,12 +35,24 @@ class ModernDatePicker:
         self.popup_window = None
         self.calendar_widget = None
         
+        # Day-cell widget pool, created once per popup
+        self.header_labels = []
+        self.day_buttons = []
+        self.cell_dates = []
+        self.cell_states = []
+        
         # Initialize calendar engine
         self.calendar_engine = ModernCalendar(
             self.options['calendar'], 
             self.options['language']
         )
         
+        # Month pages in the picker's own calendar, prefetched off the UI thread
+        self.view_model = MonthViewModel(
+            self.options['calendar'],
+            self.options['language']
+        )
+        
         self.setup_widget()
     
     def setup_widget(self):
@@ -95,6 +111,17 @@ class ModernDatePicker:
             self.popup_window.destroy()
             self.popup_window = None
             self.calendar_widget = None
+            self.header_labels = []
+            self.day_buttons = []
+            self.cell_dates = []
+            self.cell_states = []
+        # No prefetching while the popup is closed
+        self.view_model.close()
+    
+    def destroy(self):
+        """Destroy the popup and the entry widget and stop background work"""
+        self.hide_calendar()
+        self.frame.destroy()
     
     def position_popup(self):
         """Position popup near the entry widget"""
@@ -153,9 +180,10 @@ class ModernDatePicker:
         # Calendar grid
         self.calendar_frame = ttk.Frame(main_frame)
         self.calendar_frame.pack(fill=tk.BOTH, expand=True)
+        self.create_day_cells()
         
-        # Current date for navigation
-        self.current_date = datetime.now()
+        # Start at the selected month, else the current one
+        self.view_model.go_to(self.selected_date or datetime.now())
         
         # Render calendar
         self.render_calendar()
@@ -178,36 +206,30 @@ class ModernDatePicker:
         )
         close_button.pack(side=tk.RIGHT)
     
-    def render_calendar(self):
-        """Render the calendar grid"""
-        # Clear existing widgets
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
-        # Update month label
-        if self.options['calendar'] == 'ethiopian':
-            month_name = self.get_ethiopian_month_name()
-            year = self.get_ethiopian_year()
-            self.month_label.config(text=f"{month_name} {year}")
-        else:
-            month_name = calendar.month_name[self.current_date.month]
-            self.month_label.config(text=f"{month_name} {self.current_date.year}")
-        
-        # Day headers
-        day_names = self.get_day_names()
-        for i, day_name in enumerate(day_names):
+    def create_day_cells(self):
+        """Create the header labels and the 6x7 pool of day buttons once"""
+        for i in range(7):
             label = ttk.Label(
                 self.calendar_frame, 
-                text=day_name, 
+                text="", 
                 font=('Arial', 9, 'bold')
             )
             label.grid(row=0, column=i, padx=1, pady=1, sticky='nsew')
-        
-        # Calendar days
-        if self.options['calendar'] == 'ethiopian':
-            self.render_ethiopian_days()
-        else:
-            self.render_gregorian_days()
+            self.header_labels.append(label)
+        
+        for index in range(42):
+            row, col = divmod(index, 7)
+            # Each cell keeps one command; navigation only changes cell_dates
+            button = ttk.Button(
+                self.calendar_frame,
+                text="",
+                width=4,
+                command=lambda i=index: self.select_cell(i)
+            )
+            button.grid(row=row + 1, column=col, padx=1, pady=1, sticky='nsew')
+            self.day_buttons.append(button)
+            self.cell_dates.append(None)
+            self.cell_states.append(BLANK_CELL_STATE)
         
         # Configure grid weights
         for i in range(7):
@@ -215,126 +237,52 @@ class ModernDatePicker:
         for i in range(7):
             self.calendar_frame.rowconfigure(i, weight=1)
     
-    def render_gregorian_days(self):
-        """Render Gregorian calendar days"""
-        year = self.current_date.year
-        month = self.current_date.month
-        
-        # Get first day of month and number of days
-        first_day = datetime(year, month, 1)
-        first_weekday = first_day.weekday()
-        if first_weekday == 6:  # Sunday = 0 in our system
-            first_weekday = 0
-        else:
-            first_weekday += 1
-        
-        days_in_month = calendar.monthrange(year, month)[1]
+    def render_calendar(self):
+        """Render the view model's current month into the existing day cells"""
+        # Today is computed once per render, not once per cell
+        view = self.view_model.view(
+            today=datetime.now().date(),
+            selected=self.selected_date
+        )
         
-        # Previous month days
-        if month == 1:
-            prev_month_days = calendar.monthrange(year - 1, 12)[1]
-            prev_year, prev_month = year - 1, 12
-        else:
-            prev_month_days = calendar.monthrange(year, month - 1)[1]
-            prev_year, prev_month = year, month - 1
-        
-        day_num = 1
-        row = 1
-        
-        for week in range(6):
-            for day_col in range(7):
-                if week == 0 and day_col < first_weekday:
-                    # Previous month days
-                    day = prev_month_days - first_weekday + day_col + 1
-                    self.create_day_button(
-                        row, day_col, day, 
-                        datetime(prev_year, prev_month, day),
-                        other_month=True
-                    )
-                elif day_num <= days_in_month:
-                    # Current month days
-                    current_day = datetime(year, month, day_num)
-                    self.create_day_button(row, day_col, day_num, current_day)
-                    day_num += 1
-                else:
-                    # Next month days
-                    next_day = day_num - days_in_month
-                    if month == 12:
-                        next_year, next_month = year + 1, 1
-                    else:
-                        next_year, next_month = year, month + 1
-                    
-                    self.create_day_button(
-                        row, day_col, next_day,
-                        datetime(next_year, next_month, next_day),
-                        other_month=True
-                    )
-                    day_num += 1
-            row += 1
-            if day_num > days_in_month + 7:
-                break
-    
-    def render_ethiopian_days(self):
-        """Render Ethiopian calendar days"""
-        # Convert current Gregorian date to Ethiopian
-        eth_date = self.calendar_engine.gregorian_to_ethiopian(self.current_date)
-        
-        # Ethiopian months have 30 days (except Pagume)
-        days_in_month = 30 if eth_date['month'] <= 12 else (6 if self.is_ethiopian_leap_year(eth_date['year']) else 5)
-        
-        # Create Ethiopian calendar grid
-        day_num = 1
-        row = 1
-        
-        for week in range(6):
-            for day_col in range(7):
-                if day_num <= days_in_month:
-                    # Convert Ethiopian date back to Gregorian for button
-                    greg_date = self.calendar_engine.ethiopian_to_gregorian(
-                        eth_date['year'], eth_date['month'], day_num
-                    )
-                    self.create_day_button(row, day_col, day_num, greg_date)
-                    day_num += 1
-                else:
-                    # Empty cells
-                    empty_label = ttk.Label(self.calendar_frame, text="")
-                    empty_label.grid(row=row, column=day_col, padx=1, pady=1, sticky='nsew')
-            row += 1
-            if day_num > days_in_month:
-                break
-    
-    def create_day_button(self, row, col, day_text, date_obj, other_month=False):
-        """Create a day button in the calendar grid"""
-        style = 'Other.TButton' if other_month else 'Day.TButton'
+        # Update month label
+        self.month_label.config(text=view.title)
         
-        # Check if this is today
-        today = datetime.now().date()
-        is_today = date_obj.date() == today
+        # Day headers
+        for label, day_name in zip(self.header_labels, view.weekday_names):
+            if label.cget('text') != day_name:
+                label.config(text=day_name)
         
-        # Check if this is selected date
-        is_selected = (self.selected_date and 
-                      date_obj.date() == self.selected_date.date())
+        # Calendar days
+        for index, cell in enumerate(view.cells):
+            self.update_day_cell(index, cell)
+    
+    def update_day_cell(self, index, cell):
+        """Update one pooled day button from a DayCell"""
+        button = self.day_buttons[index]
+        self.cell_dates[index] = datetime.fromordinal(cell.day_number)
         
-        if is_today:
+        if cell.is_today:
             style = 'Today.TButton'
-        elif is_selected:
+        elif cell.is_selected:
             style = 'Selected.TButton'
+        elif not cell.in_month:
+            style = 'Other.TButton'
+        else:
+            style = 'TButton'
+        state = (cell.label, style)
         
-        button = ttk.Button(
-            self.calendar_frame,
-            text=str(day_text),
-            width=4,
-            command=lambda d=date_obj: self.select_date(d)
-        )
-        button.grid(row=row, column=col, padx=1, pady=1, sticky='nsew')
-        
-        # Configure button styles
-        if is_today:
-            button.configure(style='Today.TButton')
-        elif is_selected:
-            button.configure(style='Selected.TButton')
-        elif other_month:
-            button.configure(style='Other.TButton')
+        # Only touch the widget when something visible changed
+        if state == self.cell_states[index]:
+            return
+        self.cell_states[index] = state
+        button.configure(text=state[0], style=state[1])
+    
+    def select_cell(self, index):
+        """Select the date shown in a pooled day cell"""
+        date_obj = self.cell_dates[index]
+        if date_obj is not None:
+            self.select_date(date_obj)
     
     def select_date(self, date_obj):
         """Select a date and update the entry"""
@@ -361,65 +309,20 @@ class ModernDatePicker:
     
     def format_ethiopian_date(self, date_obj):
         """Format date in Ethiopian calendar"""
-        eth_date = self.calendar_engine.gregorian_to_ethiopian(date_obj)
-        
-        format_str = self.options['format']
-        year_str = str(eth_date['year'])
-        month_str = str(eth_date['month']).zfill(2)
-        day_str = str(eth_date['day']).zfill(2)
-        
-        return (format_str
-                .replace('%Y', year_str)
-                .replace('%m', month_str)
-                .replace('%d', day_str)
-                .replace('%y', year_str[-2:]))
+        return self.calendar_engine.compile_format(self.options['format'])(date_obj)
     
     def get_day_names(self):
-        """Get day names for current language"""
-        if self.options['language'] == 'am':
-            return ['እሑድ', 'ሰኞ', 'ማክሰ', 'ረቡዕ', 'ሐሙስ', 'ዓርብ', 'ቅዳሜ']
-        elif self.options['language'] == 'oro':
-            return ['Wix', 'Kib', 'Rob', 'Kam', 'Jim', 'San', 'Dil']
-        else:
-            return ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-    
-    def get_ethiopian_month_name(self):
-        """Get Ethiopian month name"""
-        eth_date = self.calendar_engine.gregorian_to_ethiopian(self.current_date)
-        month_names = self.calendar_engine.get_month_names()
-        return month_names[eth_date['month'] - 1]
-    
-    def get_ethiopian_year(self):
-        """Get Ethiopian year"""
-        eth_date = self.calendar_engine.gregorian_to_ethiopian(self.current_date)
-        return eth_date['year']
-    
-    def is_ethiopian_leap_year(self, year):
-        """Check if Ethiopian year is leap year"""
-        return year % 4 == 3
+        """Get day names for current language, in column order"""
+        return self.view_model.weekday_names
     
     def prev_month(self):
         """Navigate to previous month"""
-        if self.current_date.month == 1:
-            self.current_date = self.current_date.replace(
-                year=self.current_date.year - 1, month=12
-            )
-        else:
-            self.current_date = self.current_date.replace(
-                month=self.current_date.month - 1
-            )
+        self.view_model.prev_month()
         self.render_calendar()
     
     def next_month(self):
         """Navigate to next month"""
-        if self.current_date.month == 12:
-            self.current_date = self.current_date.replace(
-                year=self.current_date.year + 1, month=1
-            )
-        else:
-            self.current_date = self.current_date.replace(
-                month=self.current_date.month + 1
-            )
+        self.view_model.next_month()
         self.render_calendar()
     
     def select_today(self):
@@ -434,10 +337,13 @@ class ModernDatePicker:
     def set_date(self, date_obj):
         """Set the selected date programmatically"""
         if isinstance(date_obj, str):
-            date_obj = datetime.strptime(date_obj, self.options['format'])
+            if self.options['calendar'] == 'ethiopian':
+                date_obj = datetime.fromordinal(parse_ethiopian_day_number(date_obj))
+            else:
+                date_obj = datetime.strptime(date_obj, self.options['format'])
         
         self.selected_date = date_obj
-        self.current_date = date_obj
+        self.view_model.go_to(date_obj)
         
         # Update entry
         if self.options['calendar'] == 'ethiopian':
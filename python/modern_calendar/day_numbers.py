@@ -0,0 +1,241 @@
+"""
+Modern Calendar System - Fixed Day Numbers
+Pure-integer day-number core shared by every calendar implementation
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Tuple
+
+# Day numbers are Rata Die (RD) integers: RD 1 is January 1, 1 CE in the
+# proleptic Gregorian calendar, the same count as datetime.date.toordinal().
+
+# Julian Day (at midnight) of RD 0
+JD_OFFSET = 1721424.5
+
+# Julian Day Number (at noon) of RD 0
+JDN_OFFSET = 1721425
+
+# RD of Meskerem 1, 1 EC (August 29, 8 CE Julian)
+ETHIOPIAN_EPOCH = 2796
+
+# RD of Muharram 1, 1 AH (July 16, 622 CE Julian), civil epoch
+ISLAMIC_EPOCH = 227015
+
+
+def gregorian_to_rd(year: int, month: int, day: int) -> int:
+    """Convert a proleptic Gregorian date to a day number"""
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 305
+
+
+def rd_to_gregorian(rd: int) -> Tuple[int, int, int]:
+    """Convert a day number to a proleptic Gregorian (year, month, day)"""
+    z = rd + 305
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (month <= 2), month, day
+
+
+def julian_to_rd(year: int, month: int, day: int) -> int:
+    """Convert a proleptic Julian calendar date to a day number"""
+    y = year - (month <= 2)
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    return 365 * y + y // 4 + doy - 307
+
+
+def ethiopian_to_rd(year: int, month: int, day: int) -> int:
+    """Convert an Ethiopian date to a day number"""
+    return ETHIOPIAN_EPOCH - 1 + 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
+
+
+def rd_to_ethiopian(rd: int) -> Tuple[int, int, int]:
+    """Convert a day number to an Ethiopian (year, month, day)"""
+    n = rd - ETHIOPIAN_EPOCH
+    year = (4 * n + 1463) // 1461
+    day_of_year = n - 365 * (year - 1) - year // 4
+    return year, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+def ethiopian_year_start(year: int) -> int:
+    """Day number of Meskerem 1 of an Ethiopian year"""
+    return ETHIOPIAN_EPOCH + 365 * (year - 1) + year // 4
+
+
+def is_ethiopian_leap_year(year: int) -> bool:
+    """Check if an Ethiopian year has a sixth Pagume day"""
+    return year % 4 == 3
+
+
+def ethiopian_days_in_month(year: int, month: int) -> int:
+    """Number of days in an Ethiopian month (Pagume has 5 or 6)"""
+    if month <= 12:
+        return 30
+    return 6 if year % 4 == 3 else 5
+
+
+def islamic_to_rd(year: int, month: int, day: int) -> int:
+    """Convert a tabular Islamic (Hijri) date to a day number"""
+    return (ISLAMIC_EPOCH - 1 + 354 * (year - 1) + (3 + 11 * year) // 30
+            + 29 * (month - 1) + month // 2 + day)
+
+
+def rd_to_islamic(rd: int) -> Tuple[int, int, int]:
+    """Convert a day number to a tabular Islamic (year, month, day)"""
+    year = (30 * (rd - ISLAMIC_EPOCH) + 10646) // 10631
+    day_of_year = rd - islamic_year_start(year)
+    month = min((11 * day_of_year + 330) // 325, 12)
+    return year, month, day_of_year - 29 * (month - 1) - month // 2 + 1
+
+
+def islamic_year_start(year: int) -> int:
+    """Day number of Muharram 1 of a tabular Islamic year"""
+    return ISLAMIC_EPOCH + 354 * (year - 1) + (3 + 11 * year) // 30
+
+
+def is_islamic_leap_year(year: int) -> bool:
+    """Check if a tabular Islamic year has 355 days"""
+    return (14 + 11 * year) % 30 < 11
+
+
+def islamic_days_in_month(year: int, month: int) -> int:
+    """Number of days in a tabular Islamic month (29 or 30)"""
+    if month == 12 and is_islamic_leap_year(year):
+        return 30
+    return 30 if month % 2 else 29
+
+
+def weekday(rd: int) -> int:
+    """Day of week for a day number (Monday = 0, like datetime.weekday)"""
+    return (rd + 6) % 7
+
+
+def rd_to_jd(rd: int) -> float:
+    """Julian Day at midnight for a day number"""
+    return rd + JD_OFFSET
+
+
+def jd_to_rd(jd: float) -> int:
+    """Day number containing a Julian Day"""
+    return int((jd - JD_OFFSET) // 1)
+
+
+class EthiopianYearIndex:
+    """
+    Precomputed Ethiopian year-start day numbers for a span of years.
+
+    EthiopianCalendar reads it for is_leap_year, days_in_month and the
+    month grid boundaries. Day-number conversion, the pattern formatters
+    and the holiday rules use the closed-form arithmetic, which is as fast
+    as a lookup. Years outside the span fall back to that arithmetic.
+    """
+
+    def __init__(self, first_year: int = 1, last_year: int = 3000):
+        if last_year < first_year:
+            raise ValueError("last_year must not be before first_year")
+        self.first_year = first_year
+        self.last_year = last_year
+        # One extra entry so the last year in the span has an end boundary
+        self.starts = tuple(
+            ethiopian_year_start(year) for year in range(first_year, last_year + 2)
+        )
+
+    def __contains__(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+    def year_start(self, year: int) -> int:
+        """Day number of Meskerem 1 of a year"""
+        i = year - self.first_year
+        if 0 <= i < len(self.starts):
+            return self.starts[i]
+        return ethiopian_year_start(year)
+
+    def month_start(self, year: int, month: int) -> int:
+        """Day number of the first day of an Ethiopian month"""
+        return self.year_start(year) + 30 * (month - 1)
+
+    def days_in_year(self, year: int) -> int:
+        """Number of days in an Ethiopian year (365 or 366)"""
+        return self.year_start(year + 1) - self.year_start(year)
+
+    def is_leap_year(self, year: int) -> bool:
+        """Check if an Ethiopian year has a sixth Pagume day"""
+        return self.days_in_year(year) == 366
+
+    def days_in_month(self, year: int, month: int) -> int:
+        """Number of days in an Ethiopian month"""
+        if month <= 12:
+            return 30
+        return self.days_in_year(year) - 360
+
+    def year_of(self, rd: int) -> int:
+        """Ethiopian year containing a day number"""
+        starts = self.starts
+        if starts[0] <= rd < starts[-1]:
+            return bisect_right(starts, rd) - 1 + self.first_year
+        return (4 * (rd - ETHIOPIAN_EPOCH) + 1463) // 1461
+
+    def split(self, rd: int) -> Tuple[int, int, int]:
+        """Ethiopian (year, month, day) for a day number"""
+        year = self.year_of(rd)
+        day_of_year = rd - self.year_start(year)
+        return year, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+@lru_cache(maxsize=None)
+def get_ethiopian_year_index() -> EthiopianYearIndex:
+    """Shared index covering 1-3000 EC, built on first use"""
+    return EthiopianYearIndex()
+
+
+class IslamicMonthTable:
+    """
+    Observed Islamic month starts (e.g. Umm al-Qura) overriding the
+    tabular arithmetic inside the span they cover.
+
+    ``month_starts`` maps (year, month) to the day number of the first
+    day of that month; months must be consecutive, and the last entry
+    only marks where the covered span ends.
+    """
+
+    def __init__(self, month_starts: Dict[Tuple[int, int], int]):
+        if len(month_starts) < 2:
+            raise ValueError("month_starts needs at least two consecutive months")
+        self.months = tuple(sorted(month_starts))
+        self.starts = tuple(month_starts[key] for key in self.months)
+        for (y1, m1), (y2, m2) in zip(self.months, self.months[1:]):
+            if (y2, m2) != ((y1, m1 + 1) if m1 < 12 else (y1 + 1, 1)):
+                raise ValueError(f"month_starts is not consecutive after {y1}-{m1}")
+        self._index = {key: i for i, key in enumerate(self.months)}
+
+    def to_rd(self, year: int, month: int, day: int) -> int:
+        """Day number of an Islamic date, tabular outside the table"""
+        i = self._index.get((year, month))
+        if i is None or i == len(self.starts) - 1:
+            return islamic_to_rd(year, month, day)
+        return self.starts[i] + day - 1
+
+    def from_rd(self, rd: int) -> Tuple[int, int, int]:
+        """Islamic (year, month, day) of a day number, tabular outside the table"""
+        starts = self.starts
+        if not starts[0] <= rd < starts[-1]:
+            return rd_to_islamic(rd)
+        i = bisect_right(starts, rd) - 1
+        year, month = self.months[i]
+        return year, month, rd - starts[i] + 1
+
+    def days_in_month(self, year: int, month: int) -> int:
+        """Observed month length, tabular outside the table"""
+        i = self._index.get((year, month))
+        if i is None or i == len(self.starts) - 1:
+            return islamic_days_in_month(year, month)
+        return self.starts[i + 1] - self.starts[i]
@@ -0,0 +1,151 @@
+"""
+Modern Calendar System - Ethiopian Date Value Type
+Compact, immutable Ethiopian date backed by a single day number
+"""
+
+from datetime import date, timedelta
+from typing import Tuple, Union
+
+from .day_numbers import ethiopian_days_in_month, ethiopian_to_rd, rd_to_ethiopian, weekday
+
+
+class EthiopianDate:
+    """Immutable Ethiopian date stored as a fixed day number"""
+
+    __slots__ = ('_rd',)
+
+    def __new__(cls, year: int, month: int, day: int):
+        if not 1 <= month <= 13:
+            raise ValueError(f"month must be in 1..13, got {month}")
+        if not 1 <= day <= ethiopian_days_in_month(year, month):
+            raise ValueError(f"day is out of range for {year}-{month:02d}, got {day}")
+        return cls._from_rd(ethiopian_to_rd(year, month, day))
+
+    @classmethod
+    def _from_rd(cls, rd: int) -> 'EthiopianDate':
+        self = object.__new__(cls)
+        object.__setattr__(self, '_rd', rd)
+        return self
+
+    @classmethod
+    def from_day_number(cls, rd: int) -> 'EthiopianDate':
+        """Create from a fixed day number (date.toordinal() count)"""
+        return cls._from_rd(int(rd))
+
+    @classmethod
+    def from_gregorian(cls, value: date) -> 'EthiopianDate':
+        """Create from a datetime.date or datetime.datetime"""
+        return cls._from_rd(value.toordinal())
+
+    @classmethod
+    def today(cls) -> 'EthiopianDate':
+        """Today's date in the Ethiopian calendar"""
+        return cls._from_rd(date.today().toordinal())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EthiopianDate is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("EthiopianDate is immutable")
+
+    def __reduce__(self):
+        return (self.__class__.from_day_number, (self._rd,))
+
+    @property
+    def day_number(self) -> int:
+        """Fixed day number of this date"""
+        return self._rd
+
+    @property
+    def year(self) -> int:
+        return rd_to_ethiopian(self._rd)[0]
+
+    @property
+    def month(self) -> int:
+        return rd_to_ethiopian(self._rd)[1]
+
+    @property
+    def day(self) -> int:
+        return rd_to_ethiopian(self._rd)[2]
+
+    def to_tuple(self) -> Tuple[int, int, int]:
+        """Ethiopian (year, month, day)"""
+        return rd_to_ethiopian(self._rd)
+
+    def to_gregorian(self) -> date:
+        """Convert to a datetime.date"""
+        return date.fromordinal(self._rd)
+
+    def toordinal(self) -> int:
+        """Fixed day number, matching datetime.date.toordinal()"""
+        return self._rd
+
+    def weekday(self) -> int:
+        """Day of week (Monday = 0)"""
+        return weekday(self._rd)
+
+    def replace(self, year: int = None, month: int = None, day: int = None) -> 'EthiopianDate':
+        """Return a date with the given fields replaced"""
+        y, m, d = rd_to_ethiopian(self._rd)
+        return self.__class__(
+            y if year is None else year,
+            m if month is None else month,
+            d if day is None else day
+        )
+
+    def __add__(self, other: Union[int, timedelta]) -> 'EthiopianDate':
+        if isinstance(other, timedelta):
+            other = other.days
+        elif not isinstance(other, int):
+            return NotImplemented
+        return self._from_rd(self._rd + other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, EthiopianDate):
+            return self._rd - other._rd
+        if isinstance(other, timedelta):
+            other = other.days
+        elif not isinstance(other, int):
+            return NotImplemented
+        return self._from_rd(self._rd - other)
+
+    def __hash__(self) -> int:
+        return hash(self._rd)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd == other._rd
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd != other._rd
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd < other._rd
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd <= other._rd
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd > other._rd
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, EthiopianDate):
+            return self._rd >= other._rd
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "%s(%d, %d, %d)" % ((self.__class__.__name__,) + rd_to_ethiopian(self._rd))
+
+    def __str__(self) -> str:
+        return "%04d-%02d-%02d" % rd_to_ethiopian(self._rd)
@@ -0,0 +1,149 @@
+"""
+Modern Calendar System - Date Format Patterns
+Compiles strftime-style patterns once into cached formatter callables
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, List
+
+from .day_numbers import (
+    ethiopian_year_start, gregorian_to_rd, islamic_year_start,
+    rd_to_ethiopian, rd_to_gregorian, rd_to_islamic
+)
+from .geez_numerals import to_geez
+
+# Per-calendar (day number -> (year, month, day), year -> first day number)
+CALENDAR_CONVERTERS = {
+    'ethiopian': (rd_to_ethiopian, ethiopian_year_start),
+    'gregorian': (rd_to_gregorian, lambda year: gregorian_to_rd(year, 1, 1)),
+    'islamic': (rd_to_islamic, islamic_year_start),
+}
+
+# Locale attribute holding month names for each calendar
+MONTH_NAME_ATTRIBUTES = {
+    'ethiopian': 'ethiopian_month_names',
+    'gregorian': 'gregorian_month_names',
+    'islamic': 'islamic_month_names',
+}
+
+# Directive -> str.format field over
+# (year, month, day, short year, month name, weekday name, short weekday name, day of year,
+#  Ge'ez year, Ge'ez month, Ge'ez day)
+DIRECTIVES = {
+    'Y': '{0}',
+    'y': '{3:02d}',
+    'm': '{1:02d}',
+    '-m': '{1}',
+    'd': '{2:02d}',
+    '-d': '{2}',
+    'B': '{4}',
+    'A': '{5}',
+    'a': '{6}',
+    'j': '{7:03d}',
+    '-j': '{7}',
+    # strftime's %O modifier: alternative (Ge'ez) numerals
+    'OY': '{8}',
+    'Om': '{9}',
+    'Od': '{10}',
+}
+
+GEEZ_DIRECTIVES = frozenset(('OY', 'Om', 'Od'))
+
+_TOKEN = re.compile(r'%(O[A-Za-z]|-?[A-Za-z%])')
+
+
+def _translate(pattern: str):
+    """
+    Translate a strftime-style pattern into a str.format template.
+
+    Returns (template, uses day of year, uses Ge'ez numerals).
+    """
+    template = []
+    used = set()
+    position = 0
+    for match in _TOKEN.finditer(pattern):
+        template.append(pattern[position:match.start()].replace('{', '{{').replace('}', '}}'))
+        directive = match.group(1)
+        if directive == '%':
+            template.append('%')
+        elif directive in DIRECTIVES:
+            template.append(DIRECTIVES[directive])
+            used.add(directive.lstrip('-'))
+        else:
+            raise ValueError(f"Unsupported format directive %{directive} in {pattern!r}")
+        position = match.end()
+    template.append(pattern[position:].replace('{', '{{').replace('}', '}}'))
+    return ''.join(template), 'j' in used, not used.isdisjoint(GEEZ_DIRECTIVES)
+
+
+def _day_number(value) -> int:
+    """Day number of a date or datetime, or of an integer type such as numpy.int64"""
+    try:
+        return value.toordinal()
+    except AttributeError:
+        return operator.index(value)
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, calendar_type: str = 'ethiopian', locale=None,
+                    converters=None) -> Callable:
+    """
+    Compile a format pattern into a reusable formatter.
+
+    Supported directives: %Y %y %m %d %B %A %a %j %% (with %-m, %-d and
+    %-j for unpadded numbers, and %OY, %Om and %Od for the year, month and
+    day in Ge'ez numerals). The returned callable accepts a day
+    number, date, datetime or EthiopianDate and returns a string.
+    Month and weekday names come from ``locale``. ``converters`` is an
+    optional (day number -> date, year -> first day number) pair that
+    replaces the calendar's default arithmetic.
+    """
+    if calendar_type not in CALENDAR_CONVERTERS:
+        raise ValueError(f"Unknown calendar type: {calendar_type}")
+    split, year_start = converters or CALENDAR_CONVERTERS[calendar_type]
+    template, needs_day_of_year, needs_geez = _translate(pattern)
+    render = template.format
+
+    month_names = getattr(locale, MONTH_NAME_ATTRIBUTES[calendar_type], None) or ('',) * 13
+    day_names = getattr(locale, 'day_names', None) or ('',) * 7
+    day_names_short = getattr(locale, 'day_names_short', None) or ('',) * 7
+
+    def format_plain(value) -> str:
+        rd = value if isinstance(value, int) else _day_number(value)
+        year, month, day = split(rd)
+        wd = (rd + 6) % 7
+        day_of_year = rd - year_start(year) + 1 if needs_day_of_year else 0
+        return render(year, month, day, year % 100, month_names[month - 1],
+                      day_names[wd], day_names_short[wd], day_of_year)
+
+    def format_geez(value) -> str:
+        rd = value if isinstance(value, int) else _day_number(value)
+        year, month, day = split(rd)
+        wd = (rd + 6) % 7
+        day_of_year = rd - year_start(year) + 1 if needs_day_of_year else 0
+        return render(year, month, day, year % 100, month_names[month - 1],
+                      day_names[wd], day_names_short[wd], day_of_year,
+                      to_geez(year), to_geez(month), to_geez(day))
+
+    formatter = format_geez if needs_geez else format_plain
+    formatter.pattern = pattern
+    formatter.calendar_type = calendar_type
+    return formatter
+
+
+def format_many(pattern: str, dates: Iterable, calendar_type: str = 'ethiopian',
+                locale=None) -> List[str]:
+    """
+    Format a batch of dates (or day numbers) with one compiled pattern.
+
+    ``pattern`` may also be a formatter already returned by compile_pattern.
+    """
+    formatter = pattern if callable(pattern) else compile_pattern(pattern, calendar_type, locale)
+    # datetime64 and integer arrays convert in one vectorized step; object
+    # arrays of dates are formatted element by element like a list
+    if getattr(getattr(dates, 'dtype', None), 'kind', None) in ('M', 'i', 'u'):
+        from .batch import to_day_numbers
+        dates = to_day_numbers(dates).tolist()
+    return list(map(formatter, dates))
@@ -0,0 +1,139 @@
+"""
+Modern Calendar System - Ge'ez Numerals
+Renders and parses Ethiopic (Ge'ez) numerals such as ፳፻፲፯ for 2017
+
+Ge'ez numerals have no zero and no place value. A number is written in
+base-100 groups, each group as a tens sign (፲-፺) plus a ones sign
+(፩-፱), separated by ፻ (hundred) and ፼ (ten thousand):
+
+    1 -> ፩, 30 -> ፴, 100 -> ፻, 2017 -> ፳፻፲፯, 10000 -> ፼
+
+Day numbers, months and common years come from precomputed tables, so
+formatting a calendar page hands out the same shared strings instead of
+building new ones; other values go through a memoized conversion.
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+ONES = '፩፪፫፬፭፮፯፰፱'
+TENS = '፲፳፴፵፶፷፸፹፺'
+HUNDRED = '፻'
+TEN_THOUSAND = '፼'
+
+DIGIT_VALUES: Dict[str, int] = {
+    **{sign: value for value, sign in enumerate(ONES, 1)},
+    **{sign: 10 * value for value, sign in enumerate(TENS, 1)},
+}
+
+# Every Ge'ez numeral sign, for spotting numerals inside other text
+NUMERAL_RUN = re.compile(f"[{ONES}{TENS}{HUNDRED}{TEN_THOUSAND}]+")
+
+# Ethiopian years given table entries (the rest are memoized on demand)
+COMMON_YEARS = range(1900, 2201)
+
+
+def _group(value: int) -> str:
+    """Ge'ez signs for 1..99 (empty for 0)"""
+    tens, ones = divmod(value, 10)
+    return (TENS[tens - 1] if tens else '') + (ONES[ones - 1] if ones else '')
+
+
+@lru_cache(maxsize=4096)
+def _compose(number: int) -> str:
+    groups = []
+    while number:
+        number, group = divmod(number, 100)
+        groups.append(group)
+
+    parts = []
+    top = len(groups) - 1
+    for position in range(top, -1, -1):
+        group = groups[position]
+        # A leading 1 is implied before ፻ or ፼, and any 1 before ፻
+        if group == 1 and position and (position == top or position % 2):
+            digits = ''
+        else:
+            digits = _group(group)
+        if position % 2:
+            if group:
+                parts.append(digits + HUNDRED)
+        elif position:
+            parts.append(digits + TEN_THOUSAND)
+        else:
+            parts.append(digits)
+    return ''.join(parts)
+
+
+def _build_tables() -> Tuple[Tuple[str, ...], Dict[int, str]]:
+    small = ('',) + tuple(_compose(n) for n in range(1, 100))
+    years = {year: _compose(year) for year in COMMON_YEARS}
+    return small, years
+
+
+# SMALL[n] for 1..99 (days and months); YEARS for COMMON_YEARS
+SMALL, YEARS = _build_tables()
+
+# Reverse lookup for every tabled numeral
+VALUES: Dict[str, int] = {text: n for n, text in enumerate(SMALL) if n}
+VALUES.update((text, year) for year, text in YEARS.items())
+
+
+def to_geez(number: int) -> str:
+    """Render a positive integer in Ge'ez numerals"""
+    if type(number) is not int:
+        # Integer types such as numpy.int64 are accepted, floats are not
+        try:
+            number = operator.index(number)
+        except TypeError:
+            raise ValueError(f"Ge'ez numerals represent positive integers only, "
+                             f"got {number!r}") from None
+    if 0 < number < 100:
+        return SMALL[number]
+    text = YEARS.get(number)
+    if text is not None:
+        return text
+    if number < 1:
+        raise ValueError(f"Ge'ez numerals represent positive integers only, got {number!r}")
+    return _compose(number)
+
+
+def to_geez_many(numbers: Iterable[int]) -> List[str]:
+    """Render a batch of integers (e.g. a month grid row); 0 becomes ''"""
+    small = SMALL
+    return [small[n] if 0 <= n < 100 else to_geez(n) for n in numbers]
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str) -> int:
+    total = section = current = 0
+    for sign in text:
+        value = DIGIT_VALUES.get(sign)
+        if value is not None:
+            current += value
+        elif sign == HUNDRED:
+            section += (current or 1) * 100
+            current = 0
+        elif sign == TEN_THOUSAND:
+            total = (total + section + current or 1) * 10000
+            section = current = 0
+        else:
+            raise ValueError(f"Not a Ge'ez numeral: {text!r}")
+    if not text:
+        raise ValueError("Empty Ge'ez numeral")
+    return total + section + current
+
+
+def from_geez(text: str) -> int:
+    """Parse a Ge'ez numeral such as '፳፻፲፯' into an integer"""
+    value = VALUES.get(text)
+    if value is not None:
+        return value
+    return _parse(text.strip())
+
+
+def replace_geez_numerals(text: str) -> str:
+    """Replace every Ge'ez numeral in text with its decimal digits"""
+    return NUMERAL_RUN.sub(lambda match: str(from_geez(match.group())), text)
@@ -0,0 +1,250 @@
+"""
+Modern Calendar System - Holiday Engine
+Rule-based fixed and movable holidays compiled into per-year day-number sets
+"""
+
+from bisect import bisect_left, bisect_right
+from threading import Lock
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from .day_numbers import (
+    ethiopian_to_rd, ethiopian_year_start, gregorian_to_rd, julian_to_rd,
+    rd_to_ethiopian, rd_to_gregorian
+)
+
+
+def orthodox_easter(gregorian_year: int) -> int:
+    """
+    Day number of Fasika (Orthodox Easter) in a Gregorian year.
+
+    Uses the Julian computus, which gives the same date as the Ethiopian
+    Bahire Hasab, and converts the Julian result to a day number.
+    """
+    a = gregorian_year % 4
+    b = gregorian_year % 7
+    c = gregorian_year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    month, day = divmod(d + e + 114, 31)
+    return julian_to_rd(gregorian_year, month, day + 1)
+
+
+class HolidayRule:
+    """Base holiday rule: yields the day numbers a holiday falls on"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def day_numbers(self, start: int, end: int) -> Iterable[int]:
+        """Day numbers of the holiday in the half-open range [start, end)"""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+class EthiopianHoliday(HolidayRule):
+    """Holiday on a fixed Ethiopian month and day"""
+
+    def __init__(self, name: str, month: int, day: int, day_after_leap_year: Optional[int] = None):
+        super().__init__(name)
+        self.month = month
+        self.day = day
+        # Some feasts move one day earlier in the year after a leap year so
+        # they stay on the same Julian date (e.g. Genna on Tahsas 28)
+        self.day_after_leap_year = day_after_leap_year
+
+    def day_numbers(self, start: int, end: int) -> Iterable[int]:
+        for year in range(rd_to_ethiopian(start)[0], rd_to_ethiopian(end - 1)[0] + 1):
+            day = self.day
+            if self.day_after_leap_year is not None and year % 4 == 0:
+                day = self.day_after_leap_year
+            rd = ethiopian_to_rd(year, self.month, day)
+            if start <= rd < end:
+                yield rd
+
+
+class GregorianHoliday(HolidayRule):
+    """Holiday on a fixed Gregorian month and day"""
+
+    def __init__(self, name: str, month: int, day: int):
+        super().__init__(name)
+        self.month = month
+        self.day = day
+
+    def day_numbers(self, start: int, end: int) -> Iterable[int]:
+        for year in range(rd_to_gregorian(start)[0], rd_to_gregorian(end - 1)[0] + 1):
+            rd = gregorian_to_rd(year, self.month, self.day)
+            if start <= rd < end:
+                yield rd
+
+
+class EasterHoliday(HolidayRule):
+    """Movable feast a fixed number of days from Fasika"""
+
+    def __init__(self, name: str, offset: int = 0):
+        super().__init__(name)
+        self.offset = offset
+
+    def day_numbers(self, start: int, end: int) -> Iterable[int]:
+        first = rd_to_gregorian(start - self.offset)[0]
+        last = rd_to_gregorian(end - 1 - self.offset)[0]
+        for year in range(first, last + 1):
+            rd = orthodox_easter(year) + self.offset
+            if start <= rd < end:
+                yield rd
+
+
+class Holiday(NamedTuple):
+    day_number: int
+    name: str
+
+
+class CompiledYear(NamedTuple):
+    """All holidays of one year, ready for membership and range queries"""
+    days: frozenset
+    day_numbers: Tuple[int, ...]
+    holidays: Tuple[Holiday, ...]
+
+
+ETHIOPIAN_HOLIDAY_RULES = (
+    EthiopianHoliday('Enkutatash', 1, 1),
+    EthiopianHoliday('Meskel', 1, 17),
+    EthiopianHoliday('Genna', 4, 29, day_after_leap_year=28),
+    EthiopianHoliday('Timket', 5, 11),
+    EthiopianHoliday('Adwa Victory Day', 6, 23),
+    EasterHoliday('Siklet', -2),
+    EasterHoliday('Fasika', 0),
+    GregorianHoliday('International Labour Day', 5, 1),
+    EthiopianHoliday("Patriots' Victory Day", 8, 27),
+    EthiopianHoliday('Derg Downfall Day', 9, 20),
+)
+
+GREGORIAN_HOLIDAY_RULES = (
+    GregorianHoliday("New Year's Day", 1, 1),
+    GregorianHoliday('Christmas', 12, 25),
+)
+
+# Per-calendar (day number -> year, year -> first day number)
+YEAR_BOUNDARIES = {
+    'ethiopian': (lambda rd: rd_to_ethiopian(rd)[0], ethiopian_year_start),
+    'gregorian': (lambda rd: rd_to_gregorian(rd)[0], lambda year: gregorian_to_rd(year, 1, 1)),
+}
+
+
+class HolidayCalendar:
+    """
+    Holiday rules compiled into day-number sets.
+
+    Days inside ``window_years`` (Gregorian years, inclusive) are compiled
+    into one frozenset on first use, so is_holiday there is a single range
+    check and set lookup. Other days compile their calendar year on demand
+    into a plain dict holding up to ``cache_size`` years.
+    """
+
+    def __init__(self, rules: Iterable[HolidayRule], calendar_type: str = 'ethiopian',
+                 cache_size: int = 64, window_years: Tuple[int, int] = (1900, 2100)):
+        if calendar_type not in YEAR_BOUNDARIES:
+            raise ValueError(f"Unknown calendar type: {calendar_type}")
+        self.rules = tuple(rules)
+        self.calendar_type = calendar_type
+        self.cache_size = cache_size
+        self._year_of, self._year_start = YEAR_BOUNDARIES[calendar_type]
+        self._window_start = gregorian_to_rd(window_years[0], 1, 1)
+        self._window_end = gregorian_to_rd(window_years[1] + 1, 1, 1)
+        self._window_days: Optional[frozenset] = None
+        # Reads are plain dict lookups; when full, the oldest year is dropped
+        self._years = {}
+        self._lock = Lock()
+
+    def compile_year(self, year: int) -> CompiledYear:
+        """Holidays of a calendar year (cached)"""
+        compiled = self._years.get(year)
+        if compiled is None:
+            # Misses compile under the lock, so threads never evict and
+            # insert at the same time; hits stay lock-free
+            with self._lock:
+                compiled = self._years.get(year)
+                if compiled is None:
+                    compiled = self._compile_year(year)
+                    if self.cache_size > 0:
+                        if len(self._years) >= self.cache_size:
+                            del self._years[next(iter(self._years))]
+                        self._years[year] = compiled
+        return compiled
+
+    def _compile_year(self, year: int) -> CompiledYear:
+        start, end = self._year_start(year), self._year_start(year + 1)
+        holidays = sorted(
+            Holiday(rd, rule.name)
+            for rule in self.rules
+            for rd in rule.day_numbers(start, end)
+        )
+        return CompiledYear(
+            frozenset(h.day_number for h in holidays),
+            tuple(h.day_number for h in holidays),
+            tuple(holidays)
+        )
+
+    def window_days(self) -> frozenset:
+        """Holiday day numbers inside the precompiled window"""
+        days = self._window_days
+        if days is None:
+            with self._lock:
+                days = self._window_days
+                if days is None:
+                    start, end = self._window_start, self._window_end
+                    days = self._window_days = frozenset(
+                        rd for rule in self.rules for rd in rule.day_numbers(start, end)
+                    )
+        return days
+
+    def is_holiday(self, date) -> bool:
+        """Check if a date (or day number) is a holiday"""
+        rd = date if isinstance(date, int) else date.toordinal()
+        if self._window_start <= rd < self._window_end:
+            days = self._window_days
+            if days is None:
+                days = self.window_days()
+            return rd in days
+        return rd in self.compile_year(self._year_of(rd)).days
+
+    def holiday_names(self, date) -> List[str]:
+        """Names of the holidays falling on a date (or day number)"""
+        rd = date if isinstance(date, int) else date.toordinal()
+        compiled = self.compile_year(self._year_of(rd))
+        if rd not in compiled.days:
+            return []
+        i = bisect_left(compiled.day_numbers, rd)
+        j = bisect_right(compiled.day_numbers, rd)
+        return [h.name for h in compiled.holidays[i:j]]
+
+    def holidays_between(self, start, end) -> List[Holiday]:
+        """All holidays from start to end inclusive, in date order"""
+        first = start if isinstance(start, int) else start.toordinal()
+        last = end if isinstance(end, int) else end.toordinal()
+        result = []
+        for year in range(self._year_of(first), self._year_of(last) + 1):
+            compiled = self.compile_year(year)
+            i = bisect_left(compiled.day_numbers, first)
+            j = bisect_right(compiled.day_numbers, last)
+            result.extend(compiled.holidays[i:j])
+        return result
+
+    def day_numbers_between(self, start, end) -> List[int]:
+        """Distinct holiday day numbers from start to end inclusive"""
+        days = []
+        for holiday in self.holidays_between(start, end):
+            if not days or days[-1] != holiday.day_number:
+                days.append(holiday.day_number)
+        return days
+
+    def cache_clear(self) -> None:
+        """Forget compiled years and the precompiled window"""
+        with self._lock:
+            self._years.clear()
+            self._window_days = None
+
+
+ETHIOPIAN_HOLIDAYS = HolidayCalendar(ETHIOPIAN_HOLIDAY_RULES, 'ethiopian')
+GREGORIAN_HOLIDAYS = HolidayCalendar(GREGORIAN_HOLIDAY_RULES, 'gregorian')
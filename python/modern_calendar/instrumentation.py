@@ -0,0 +1,233 @@
+"""
+Modern Calendar System - Instrumentation
+Opt-in call counters and latency histograms with Prometheus text export
+"""
+
+from bisect import bisect_left
+from functools import wraps
+from importlib import import_module
+from threading import Lock
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .calendars import BaseCalendar, EthiopianCalendar, ModernCalendar
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+DEFAULT_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01
+)
+
+# The NumPy batch API, named so that importing this module does not load NumPy
+BATCH_MODULE = f"{__package__}.batch"
+
+# (class or module name, attribute) pairs wrapped while instrumentation is
+# enabled: the entry points conversion, formatting and grid requests go
+# through. Only one method per operation is listed (format_date, not the
+# compile_format it calls); get_date_info is the one composite, and its
+# format_date and is_holiday calls are also counted under their own names.
+INSTRUMENTED_METHODS = (
+    (BaseCalendar, 'format_date'),
+    (EthiopianCalendar, 'gregorian_to_ethiopian'),
+    (EthiopianCalendar, 'ethiopian_to_gregorian'),
+    (ModernCalendar, 'format_many'),
+    (ModernCalendar, 'get_month_calendar'),
+    (ModernCalendar, 'get_year_calendar'),
+    (ModernCalendar, 'get_date_info'),
+    (ModernCalendar, 'is_holiday'),
+    (BATCH_MODULE, 'gregorian_to_ethiopian_batch'),
+    (BATCH_MODULE, 'ethiopian_to_gregorian_batch'),
+    (BATCH_MODULE, 'gregorian_to_islamic_batch'),
+    (BATCH_MODULE, 'islamic_to_gregorian_batch'),
+)
+
+# A class, or the dotted name of a module imported when instrumentation is enabled
+Owner = Union[type, str]
+
+METRIC_PREFIX = 'modern_calendar'
+
+SlowCallHook = Callable[[str, float, tuple, dict], None]
+
+
+class MethodStats:
+    """Call count, error count and latency histogram of one method"""
+
+    def __init__(self, name: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self._bounds_ns = tuple(int(b * 1e9) for b in self.buckets)
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.errors = 0
+            self.total_ns = 0
+            # One slot per bucket plus the +Inf overflow slot
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, elapsed_ns: int, failed: bool = False) -> None:
+        slot = bisect_left(self._bounds_ns, elapsed_ns)
+        with self._lock:
+            self.calls += 1
+            self.total_ns += elapsed_ns
+            self.bucket_counts[slot] += 1
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> Dict:
+        """Consistent copy of the counters, with cumulative buckets in seconds"""
+        with self._lock:
+            calls, errors, total_ns = self.calls, self.errors, self.total_ns
+            counts = list(self.bucket_counts)
+        cumulative, running = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            running += count
+            cumulative.append((bound, running))
+        return {
+            'calls': calls,
+            'errors': errors,
+            'sum_seconds': total_ns / 1e9,
+            'buckets': cumulative
+        }
+
+
+class Instrumentation:
+    """
+    Wraps hot calendar methods with counters and latency histograms.
+
+    Nothing is wrapped until enable() is called, and disable() puts the
+    original methods back, so disabled instrumentation costs nothing.
+    Module functions are wrapped on the module, so names bound earlier
+    with ``from module import name`` keep calling the original.
+    Calls slower than ``slow_threshold`` seconds are passed to
+    ``on_slow_call(method, seconds, args, kwargs)``.
+    """
+
+    def __init__(self, methods=INSTRUMENTED_METHODS, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.methods = tuple(methods)
+        self.stats: Dict[str, MethodStats] = {
+            self.metric_name(owner, name): MethodStats(self.metric_name(owner, name), buckets)
+            for owner, name in self.methods
+        }
+        self.slow_threshold: Optional[float] = None
+        self.on_slow_call: Optional[SlowCallHook] = None
+        self._originals: Dict[Tuple[Owner, str], Tuple[object, Callable]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def metric_name(owner: Owner, name: str) -> str:
+        if isinstance(owner, str):
+            return f"{owner.rpartition('.')[2]}.{name}"
+        return f"{owner.__name__}.{name}"
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self, slow_threshold: Optional[float] = None,
+               on_slow_call: Optional[SlowCallHook] = None) -> None:
+        """Start recording; safe to call again to change the slow-call settings"""
+        with self._lock:
+            self.slow_threshold = slow_threshold
+            self.on_slow_call = on_slow_call
+            for owner, name in self.methods:
+                if (owner, name) not in self._originals:
+                    target = import_module(owner) if isinstance(owner, str) else owner
+                    original = vars(target)[name]
+                    self._originals[(owner, name)] = (target, original)
+                    setattr(target, name,
+                            self._wrap(original, self.stats[self.metric_name(owner, name)]))
+
+    def disable(self) -> None:
+        """Stop recording and restore the original methods (metrics are kept)"""
+        with self._lock:
+            for (_, name), (target, original) in self._originals.items():
+                setattr(target, name, original)
+            self._originals.clear()
+
+    def reset(self) -> None:
+        """Zero all counters and histograms"""
+        for stats in self.stats.values():
+            stats.reset()
+
+    def _record(self, stats: MethodStats, start: int, failed: bool, args, kwargs) -> None:
+        elapsed = perf_counter_ns() - start
+        stats.observe(elapsed, failed)
+        threshold = self.slow_threshold
+        hook = self.on_slow_call
+        if threshold is not None and hook is not None and elapsed >= threshold * 1e9:
+            try:
+                hook(stats.name, elapsed / 1e9, args, kwargs)
+            except Exception:
+                # A failing hook must not replace the call's result or exception
+                pass
+
+    def _wrap(self, method: Callable, stats: MethodStats) -> Callable:
+        record = self._record
+
+        @wraps(method)
+        def instrumented(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                result = method(*args, **kwargs)
+            except BaseException:
+                record(stats, start, True, args, kwargs)
+                raise
+            record(stats, start, False, args, kwargs)
+            return result
+        return instrumented
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Metrics per method as plain data"""
+        return {name: stats.snapshot() for name, stats in self.stats.items()}
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        calls = f"{METRIC_PREFIX}_calls_total"
+        errors = f"{METRIC_PREFIX}_call_errors_total"
+        duration = f"{METRIC_PREFIX}_call_duration_seconds"
+        snapshots = self.to_dict()
+
+        lines: List[str] = [
+            f"# HELP {calls} Calls to instrumented calendar methods.",
+            f"# TYPE {calls} counter",
+        ]
+        lines.extend(f'{calls}{{method="{name}"}} {s["calls"]}' for name, s in snapshots.items())
+        lines.append(f"# HELP {errors} Instrumented calls that raised an exception.")
+        lines.append(f"# TYPE {errors} counter")
+        lines.extend(f'{errors}{{method="{name}"}} {s["errors"]}' for name, s in snapshots.items())
+        lines.append(f"# HELP {duration} Latency of instrumented calendar methods.")
+        lines.append(f"# TYPE {duration} histogram")
+        for name, s in snapshots.items():
+            for bound, count in s['buckets']:
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{duration}_bucket{{method="{name}",le="{le}"}} {count}')
+            lines.append(f'{duration}_sum{{method="{name}"}} {s["sum_seconds"]!r}')
+            lines.append(f'{duration}_count{{method="{name}"}} {s["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide instrumentation used by the module-level helpers
+INSTRUMENTATION = Instrumentation()
+
+
+def enable(slow_threshold: Optional[float] = None, on_slow_call: Optional[SlowCallHook] = None) -> None:
+    """Turn on process-wide instrumentation"""
+    INSTRUMENTATION.enable(slow_threshold, on_slow_call)
+
+
+def disable() -> None:
+    """Turn off process-wide instrumentation"""
+    INSTRUMENTATION.disable()
+
+
+def get_metrics() -> Dict[str, Dict]:
+    """Process-wide metrics as a dict"""
+    return INSTRUMENTATION.to_dict()
+
+
+def export_prometheus() -> str:
+    """Process-wide metrics in Prometheus text format"""
+    return INSTRUMENTATION.to_prometheus()
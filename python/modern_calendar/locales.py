@@ -0,0 +1,164 @@
+"""
+Modern Calendar System - Locales
+Month and day names per language, built lazily on first use
+"""
+
+from threading import Lock
+from typing import Callable, Dict, Iterator, Mapping
+
+# Ethiopian month names in Ge'ez script
+ETHIOPIAN_MONTH_NAMES = (
+    'መስከረም', 'ጥቅምት', 'ኅዳር', 'ታኅሳስ', 'ጥር', 'የካቲት',
+    'መጋቢት', 'ሚያዝያ', 'ግንቦት', 'ሰኔ', 'ሐምሌ', 'ነሐሴ', 'ጳጉሜ'
+)
+
+# Islamic month names, English transliteration and Arabic
+ISLAMIC_MONTH_NAMES = (
+    'Muharram', 'Safar', "Rabi' al-Awwal", "Rabi' al-Thani", 'Jumada al-Ula', 'Jumada al-Akhirah',
+    'Rajab', "Sha'ban", 'Ramadan', 'Shawwal', "Dhu al-Qa'dah", 'Dhu al-Hijjah'
+)
+ISLAMIC_MONTH_NAMES_ARABIC = (
+    'محرم', 'صفر', 'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+    'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'
+)
+
+# Gregorian month names, used by locales that do not name Gregorian months
+GREGORIAN_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+
+class BaseLocale:
+    """Base locale class"""
+
+    def __init__(self):
+        self.month_names = ()
+        self.day_names = ()
+        self.day_names_short = ()
+        self.gregorian_month_names = GREGORIAN_MONTH_NAMES
+        self.ethiopian_month_names = ETHIOPIAN_MONTH_NAMES
+        self.islamic_month_names = ISLAMIC_MONTH_NAMES
+        self.weekend_days = (5, 6)  # Saturday, Sunday
+
+
+class EnglishLocale(BaseLocale):
+    """English locale"""
+
+    def __init__(self):
+        super().__init__()
+        self.month_names = GREGORIAN_MONTH_NAMES
+        self.day_names = (
+            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+        )
+        self.day_names_short = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+class AmharicLocale(BaseLocale):
+    """Amharic locale"""
+
+    def __init__(self):
+        super().__init__()
+        self.month_names = (
+            'መስከረም', 'ጥቅምት', 'ኅዳር', 'ታኅሳስ', 'ጥር', 'የካቲት',
+            'መጋቢት', 'ሚያዝያ', 'ግንቦት', 'ሰኔ', 'ሐምሌ', 'ነሐሴ', 'ጳጉሜ'
+        )
+        self.day_names = (
+            'ሰኞ', 'ማክሰኞ', 'ረቡዕ', 'ሐሙስ', 'ዓርብ', 'ቅዳሜ', 'እሑድ'
+        )
+        self.day_names_short = ('ሰኞ', 'ማክሰ', 'ረቡዕ', 'ሐሙስ', 'ዓርብ', 'ቅዳሜ', 'እሑድ')
+        # month_names holds the Ethiopian months
+        self.gregorian_month_names = (
+            'ጃንዩወሪ', 'ፌብሩወሪ', 'ማርች', 'ኤፕሪል', 'ሜይ', 'ጁን',
+            'ጁላይ', 'ኦገስት', 'ሴፕቴምበር', 'ኦክቶበር', 'ኖቬምበር', 'ዲሴምበር'
+        )
+
+
+class OromoLocale(BaseLocale):
+    """Afaan Oromo locale"""
+
+    def __init__(self):
+        super().__init__()
+        self.month_names = (
+            'Fuulbaana', 'Onkolooleessaa', 'Sadaasaa', 'Muddee', 'Ammajjii', 'Gurraandhala',
+            'Bitooteessaa', 'Ebla', 'Caamsaa', 'Waxabajjii', 'Adoolessa', 'Hagayya', 'Qaamee'
+        )
+        self.day_names = (
+            'Kibxata', 'Roobii', 'Khamisa', 'Jimaata', 'Sanbata', 'Dilbata', 'Wiixata'
+        )
+        self.day_names_short = ('Kib', 'Ro', 'Ka', 'Ji', 'Sa', 'Di', 'Wi')
+        self.ethiopian_month_names = self.month_names
+        self.gregorian_month_names = (
+            'Amajjii', 'Guraandhala', 'Bitootessa', 'Elba', 'Caamsa', 'Waxabajjii',
+            'Adoolessa', 'Hagayya', 'Fuulbana', 'Onkololessa', 'Sadaasa', 'Muddee'
+        )
+
+
+class ArabicLocale(BaseLocale):
+    """Arabic locale"""
+
+    def __init__(self):
+        super().__init__()
+        self.month_names = (
+            'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو',
+            'يوليو', 'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر'
+        )
+        self.day_names = (
+            'الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'
+        )
+        self.day_names_short = ('اثنين', 'ثلاثاء', 'أربعاء', 'خميس', 'جمعة', 'سبت', 'أحد')
+        self.gregorian_month_names = self.month_names
+        self.islamic_month_names = ISLAMIC_MONTH_NAMES_ARABIC
+        self.weekend_days = (4, 5)  # Friday, Saturday
+
+
+LOCALE_FACTORIES: Dict[str, Callable[[], BaseLocale]] = {
+    'en': EnglishLocale,
+    'am': AmharicLocale,
+    'ar': ArabicLocale,
+    'oro': OromoLocale
+}
+
+
+def build_locales() -> Dict[str, BaseLocale]:
+    """Construct a fresh set of locales"""
+    return {code: factory() for code, factory in LOCALE_FACTORIES.items()}
+
+
+class LazyLocales(Mapping):
+    """
+    Read-only mapping of language code to locale that builds each
+    locale's name tables the first time that language is looked up.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], BaseLocale]]):
+        self._factories = dict(factories)
+        self._locales: Dict[str, BaseLocale] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, code: str) -> BaseLocale:
+        locale = self._locales.get(code)
+        if locale is None:
+            factory = self._factories[code]
+            with self._lock:
+                locale = self._locales.get(code)
+                if locale is None:
+                    locale = self._locales[code] = factory()
+        return locale
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def __contains__(self, code) -> bool:
+        return code in self._factories
+
+    def loaded(self) -> tuple:
+        """Language codes whose locale has been built so far"""
+        return tuple(self._locales)
+
+
+# Process-wide locale registry shared by every ModernCalendar instance
+LOCALES = LazyLocales(LOCALE_FACTORIES)
@@ -0,0 +1,211 @@
+"""
+Modern Calendar System - Month View Model
+Toolkit-independent month pages for date pickers, with adjacent-month prefetch
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .caching import LRUCache
+from .calendars import CALENDARS
+from .day_numbers import weekday
+from .formatting import MONTH_NAME_ATTRIBUTES
+from .geez_numerals import to_geez
+from .locales import LOCALES
+
+# Six weeks always fit any month of any supported calendar
+CELLS_PER_VIEW = 42
+
+# Sunday (Monday = 0), matching the date picker's column order
+SUNDAY = 6
+
+
+class DayCell(NamedTuple):
+    """One cell of a month page"""
+    day_number: int
+    day: int
+    label: str
+    in_month: bool
+    is_today: bool
+    is_selected: bool
+    is_holiday: bool
+    is_weekend: bool
+
+
+class MonthView(NamedTuple):
+    """A month page: title, weekday headers and 42 cells in row-major order"""
+    calendar_type: str
+    year: int
+    month: int
+    title: str
+    weekday_names: Tuple[str, ...]
+    cells: Tuple[DayCell, ...]
+
+    @property
+    def weeks(self) -> Tuple[Tuple[DayCell, ...], ...]:
+        return tuple(self.cells[i:i + 7] for i in range(0, CELLS_PER_VIEW, 7))
+
+
+def _day_number(value) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    return value.toordinal()
+
+
+class MonthViewModel:
+    """
+    Current month of a date picker, navigated in the calendar's own months.
+
+    Ethiopian pages step through all 13 months, Pagume included. Pages are
+    plain data (MonthView) and cached; after each view() the previous and
+    next pages are built on a background thread, so a navigation click
+    normally finds its page ready. With numerals='geez' day labels and the
+    title year are written in Ge'ez numerals.
+    """
+
+    def __init__(self, calendar_type: str = 'gregorian', language: str = 'en',
+                 first_weekday: int = SUNDAY, prefetch: bool = True, cache_size: int = 24,
+                 numerals: str = 'arabic'):
+        if numerals not in ('arabic', 'geez'):
+            raise ValueError(f"Unknown numerals: {numerals}")
+        self.calendar_type = calendar_type
+        self.calendar_impl = CALENDARS[calendar_type]
+        self.locale = LOCALES.get(language) or LOCALES['en']
+        self.first_weekday = first_weekday
+        self.prefetch = prefetch
+        self.label = to_geez if numerals == 'geez' else str
+
+        self._views = LRUCache(maxsize=cache_size)
+        self._pending: Dict[tuple, Future] = {}
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.year, self.month = 0, 0
+        self.go_to(date.today())
+
+    @property
+    def weekday_names(self) -> Tuple[str, ...]:
+        """Short weekday names in column order (no page needs to be built)"""
+        day_names = self.locale.day_names_short
+        return tuple(day_names[(self.first_weekday + i) % 7] for i in range(7))
+
+    def go_to(self, value) -> None:
+        """Show the month containing a date (or day number)"""
+        self.year, self.month, _ = self.calendar_impl.from_day_number(_day_number(value))
+
+    def step(self, months: int) -> None:
+        """Move forward (or back, if negative) by whole months of this calendar"""
+        months_in_year = self.calendar_impl.months_in_year
+        year, month = self.year, self.month + months
+        while month > months_in_year(year):
+            month -= months_in_year(year)
+            year += 1
+        while month < 1:
+            year -= 1
+            month += months_in_year(year)
+        self.year, self.month = year, month
+
+    def next_month(self) -> None:
+        self.step(1)
+
+    def prev_month(self) -> None:
+        self.step(-1)
+
+    def adjacent(self, months: int) -> Tuple[int, int]:
+        """(year, month) of the page ``months`` away from the current one"""
+        current = self.year, self.month
+        self.step(months)
+        target = self.year, self.month
+        self.year, self.month = current
+        return target
+
+    def view(self, today=None, selected=None) -> MonthView:
+        """Current page, with today (default: the local date) and the selection flagged"""
+        today_rd = _day_number(today) if today is not None else date.today().toordinal()
+        selected_rd = _day_number(selected)
+        result = self._get(self.year, self.month, today_rd, selected_rd)
+        if self.prefetch:
+            for offset in (-1, 1):
+                year, month = self.adjacent(offset)
+                self._schedule(year, month, today_rd, selected_rd)
+        return result
+
+    def _get(self, year: int, month: int, today_rd: int, selected_rd: Optional[int]) -> MonthView:
+        key = (year, month, today_rd, selected_rd)
+        result = self._views.get(key)
+        if result is not None:
+            return result
+        # A prefetch still in flight is ignored rather than waited on: view()
+        # runs on the UI thread, and building one page is quicker than blocking
+        result = self.build(year, month, today_rd, selected_rd)
+        self._views.put(key, result)
+        return result
+
+    def _schedule(self, year: int, month: int, today_rd: int, selected_rd: Optional[int]) -> None:
+        key = (year, month, today_rd, selected_rd)
+        if key in self._views:
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix='month-view-prefetch')
+            self._pending[key] = self._executor.submit(self._prefetch, key)
+
+    def _prefetch(self, key: tuple) -> MonthView:
+        try:
+            result = self.build(*key)
+            self._views.put(key, result)
+            return result
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def build(self, year: int, month: int, today_rd: int,
+              selected_rd: Optional[int] = None) -> MonthView:
+        """Build a month page from scratch (pure; no caching)"""
+        calendar_impl = self.calendar_impl
+        locale = self.locale
+        first = calendar_impl.to_day_number(year, month, 1)
+        days_in_month = calendar_impl.days_in_month(year, month)
+        start = first - (weekday(first) - self.first_weekday) % 7
+        end = start + CELLS_PER_VIEW
+
+        holidays = frozenset(calendar_impl.holidays.day_numbers_between(start, end - 1))
+        weekend = frozenset(locale.weekend_days)
+        last = first + days_in_month
+        label = self.label
+
+        cells = []
+        for rd in range(start, end):
+            in_month = first <= rd < last
+            day = rd - first + 1 if in_month else calendar_impl.from_day_number(rd)[2]
+            cells.append(DayCell(
+                day_number=rd,
+                day=day,
+                label=label(day),
+                in_month=in_month,
+                is_today=rd == today_rd,
+                is_selected=rd == selected_rd,
+                is_holiday=rd in holidays,
+                is_weekend=weekday(rd) in weekend
+            ))
+
+        month_names = getattr(locale, MONTH_NAME_ATTRIBUTES[self.calendar_type], None) or ()
+        name = month_names[month - 1] if month <= len(month_names) else str(month)
+        return MonthView(self.calendar_type, year, month, f"{name} {label(year)}",
+                         self.weekday_names, tuple(cells))
+
+    def cache_clear(self) -> None:
+        """Forget cached pages"""
+        self._views.cache_clear()
+
+    def close(self) -> None:
+        """Stop the prefetch thread (a later view() starts a new one)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,189 @@
+"""
+Modern Calendar System - pandas Accessors
+Vectorized Ethiopian calendar operations on pandas Series and DataFrames
+
+Importing this module registers ``Series.ethiopian`` and
+``DataFrame.ethiopian``:
+
+    import modern_calendar.pandas_accessor
+
+    df['year'] = df['when'].ethiopian.year
+    df['label'] = df['when'].ethiopian.format('%-d %B %Y', language='am')
+    df['when'] = df.ethiopian.to_gregorian('year', 'month', 'day')
+
+Conversions run on whole arrays with the same integer arithmetic as
+EthiopianCalendar; nothing is applied row by row. Missing values (NaT,
+None) stay missing in every result.
+"""
+
+from typing import Optional, Tuple
+
+from .batch import (
+    UNIX_EPOCH_RD, day_numbers_to_datetime64, day_numbers_to_ethiopian,
+    ethiopian_to_day_numbers
+)
+from .calendars import CALENDARS
+from .formatting import compile_pattern
+from .locales import LOCALES
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas is optional
+    np = pd = None
+
+ACCESSOR_NAME = 'ethiopian'
+
+
+def _require_pandas():
+    """Raise a helpful error when pandas is not installed"""
+    if pd is None:
+        raise ImportError("The .ethiopian accessor requires pandas: pip install pandas")
+
+
+def _get_locale(language: str):
+    return LOCALES.get(language) or LOCALES['en']
+
+
+def series_day_numbers(series) -> Tuple:
+    """
+    Day numbers of a Series as (int64 array, missing mask).
+
+    Accepts datetime64 Series (timezone-aware ones use their local wall
+    time), integer day numbers, or objects with toordinal() such as
+    datetime.date and EthiopianDate.
+    """
+    _require_pandas()
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+        dtype = series.dtype
+    if pd.api.types.is_datetime64_dtype(dtype):
+        values = series.to_numpy(dtype='datetime64[D]')
+        mask = np.isnat(values)
+        return values.astype(np.int64) + UNIX_EPOCH_RD, mask
+    if pd.api.types.is_integer_dtype(dtype):
+        mask = series.isna().to_numpy()
+        return series.to_numpy(dtype=np.int64, na_value=0), mask
+    if pd.api.types.is_object_dtype(dtype):
+        mask = series.isna().to_numpy()
+        day_numbers = np.fromiter(
+            (0 if missing else value.toordinal()
+             for value, missing in zip(series.array, mask)),
+            dtype=np.int64, count=len(series)
+        )
+        return day_numbers, mask
+    raise TypeError(f"Expected datetime, day-number or date values, got {dtype}")
+
+
+def _integer_series(values, mask, like):
+    """Wrap an int array as a Series shaped like ``like``, nullable if needed"""
+    if mask.any():
+        values = pd.arrays.IntegerArray(values.astype(np.int64), mask.copy())
+    return pd.Series(values, index=like.index, name=like.name)
+
+
+class EthiopianSeriesAccessor:
+    """``Series.ethiopian``: Ethiopian calendar fields of a Series of dates"""
+
+    def __init__(self, series):
+        try:
+            series_day_numbers(series.iloc[:0])
+        except TypeError as error:
+            # pandas expects AttributeError from accessors that do not apply
+            raise AttributeError(str(error)) from None
+        self._series = series
+
+    def _split(self) -> Tuple:
+        day_numbers, mask = series_day_numbers(self._series)
+        return day_numbers, mask, day_numbers_to_ethiopian(day_numbers)
+
+    @property
+    def day_number(self):
+        """Fixed day numbers (date.toordinal() counts)"""
+        day_numbers, mask = series_day_numbers(self._series)
+        return _integer_series(day_numbers, mask, self._series)
+
+    @property
+    def year(self):
+        """Ethiopian year"""
+        _, mask, (years, _, _) = self._split()
+        return _integer_series(years, mask, self._series)
+
+    @property
+    def month(self):
+        """Ethiopian month, 1-13 (13 is Pagume)"""
+        _, mask, (_, months, _) = self._split()
+        return _integer_series(months, mask, self._series)
+
+    @property
+    def day(self):
+        """Day of the Ethiopian month"""
+        _, mask, (_, _, days) = self._split()
+        return _integer_series(days, mask, self._series)
+
+    def month_name(self, language: str = 'am'):
+        """Ethiopian month names in a locale's language"""
+        _, mask, (_, months, _) = self._split()
+        names = np.array(_get_locale(language).ethiopian_month_names + (None,), dtype=object)
+        # Missing rows index the trailing None
+        return pd.Series(names[np.where(mask, len(names) - 1, months - 1)],
+                         index=self._series.index, name=self._series.name)
+
+    def format(self, pattern: str, language: str = 'am'):
+        """
+        Format every date with a strftime-style pattern (see compile_pattern).
+
+        Each distinct day is formatted once and the strings are broadcast
+        back, so repeated dates cost a single lookup.
+        """
+        day_numbers, mask = series_day_numbers(self._series)
+        formatter = compile_pattern(pattern, 'ethiopian', _get_locale(language))
+        unique, inverse = np.unique(day_numbers[~mask], return_inverse=True)
+        labels = np.empty(len(day_numbers), dtype=object)
+        labels[~mask] = np.array(list(map(formatter, unique.tolist())), dtype=object)[inverse]
+        return pd.Series(labels, index=self._series.index, name=self._series.name)
+
+    def is_holiday(self, holidays=None):
+        """Whether each date is an Ethiopian holiday (nullable boolean)"""
+        day_numbers, mask = series_day_numbers(self._series)
+        holidays = holidays or CALENDARS['ethiopian'].holidays
+        present = day_numbers[~mask]
+        flags = np.zeros(len(day_numbers), dtype=bool)
+        if len(present):
+            holiday_days = holidays.day_numbers_between(int(present.min()), int(present.max()))
+            flags[~mask] = np.isin(present, holiday_days)
+        return pd.Series(pd.arrays.BooleanArray(flags, mask.copy()),
+                         index=self._series.index, name=self._series.name)
+
+    def to_gregorian(self):
+        """Gregorian dates (datetime64, midnight) of the values"""
+        day_numbers, mask = series_day_numbers(self._series)
+        return _datetime_series(day_numbers, mask, self._series.index, self._series.name)
+
+
+def _datetime_series(day_numbers, mask, index, name):
+    values = day_numbers_to_datetime64(day_numbers)
+    values[mask] = np.datetime64('NaT')
+    return pd.Series(values, index=index, name=name)
+
+
+class EthiopianFrameAccessor:
+    """``DataFrame.ethiopian``: Ethiopian dates stored as year/month/day columns"""
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def to_gregorian(self, year: str = 'year', month: str = 'month', day: str = 'day',
+                     name: Optional[str] = None):
+        """Gregorian dates (datetime64) from Ethiopian year, month and day columns"""
+        columns = self._frame[[year, month, day]]
+        mask = columns.isna().any(axis=1).to_numpy()
+        values = columns.to_numpy(dtype=np.float64, na_value=0).astype(np.int64)
+        day_numbers = ethiopian_to_day_numbers(values[:, 0], values[:, 1], values[:, 2])
+        return _datetime_series(day_numbers, mask, self._frame.index, name)
+
+
+if pd is not None:
+    pd.api.extensions.register_series_accessor(ACCESSOR_NAME)(EthiopianSeriesAccessor)
+    pd.api.extensions.register_dataframe_accessor(ACCESSOR_NAME)(EthiopianFrameAccessor)
@@ -0,0 +1,163 @@
+"""
+Modern Calendar System - Ethiopian Date Parsing
+Parses numeric and month-name Ethiopian dates in Amharic, Oromo and English
+"""
+
+import re
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from .day_numbers import ethiopian_days_in_month, ethiopian_to_rd
+from .ethiopian_date import EthiopianDate
+from .geez_numerals import NUMERAL_RUN, replace_geez_numerals
+from .locales import LOCALES
+
+# Common English transliterations of the Ethiopian months, several spellings each
+ETHIOPIAN_MONTH_TRANSLITERATIONS = (
+    ('Meskerem', 'Meskarem', 'Maskaram'),
+    ('Tikimt', 'Tikemt', 'Teqemt', 'Tekemt', 'Tiqimt'),
+    ('Hidar', 'Hedar', 'Khidar'),
+    ('Tahsas', 'Tahesas', 'Takhsas'),
+    ('Tir', 'Ter', 'Tirr'),
+    ('Yekatit', 'Yakatit', 'Yekatīt'),
+    ('Megabit', 'Magabit', 'Megabīt'),
+    ('Miazia', 'Miyazya', 'Miyazia', 'Miyaziya'),
+    ('Ginbot', 'Genbot', 'Guenbot'),
+    ('Sene', 'Sane'),
+    ('Hamle', 'Hamlie', 'Hamile'),
+    ('Nehase', 'Nehasse', 'Nahase', 'Nahasse'),
+    ('Pagume', 'Pagumen', 'Paguemen', 'Pagumē'),
+)
+
+# Era markers that may follow the year ("ዓ.ም.", "E.C.")
+ERA_MARKERS = frozenset(('ዓ.ም', 'ዓም', 'ec', 'e.c'))
+
+# Shortest prefix accepted as a month abbreviation
+MIN_PREFIX_LENGTH = 3
+
+_NUMERIC = re.compile(r'^\s*(\d{1,4})\s*[-/.]\s*(\d{1,2})\s*[-/.]\s*(\d{1,4})\s*$')
+_TOKEN = re.compile(r'\d+|[^\W\d_][^\s,/\-\d]*')
+
+
+def _normalize(name: str) -> str:
+    return name.strip().rstrip('.').casefold()
+
+
+def build_month_index(min_prefix: int = MIN_PREFIX_LENGTH) -> Dict[str, int]:
+    """
+    Build a lookup from month names and unambiguous prefixes to month numbers.
+
+    Names come from the Amharic and Oromo locales plus the English
+    transliterations. A prefix shared by two different months is left
+    out; a full name always wins over a prefix.
+    """
+    names = {}
+    for month_names in (LOCALES['am'].month_names, LOCALES['oro'].month_names):
+        for month, name in enumerate(month_names, 1):
+            names[_normalize(name)] = month
+    for month, spellings in enumerate(ETHIOPIAN_MONTH_TRANSLITERATIONS, 1):
+        for name in spellings:
+            names[_normalize(name)] = month
+
+    prefixes = {}
+    for name, month in names.items():
+        for length in range(min_prefix, len(name)):
+            prefix = name[:length]
+            if prefixes.get(prefix, month) != month:
+                prefixes[prefix] = None
+            else:
+                prefixes[prefix] = month
+
+    index = {prefix: month for prefix, month in prefixes.items() if month is not None}
+    index.update(names)
+    return index
+
+
+def build_weekday_index() -> frozenset:
+    """Weekday names in every locale, skipped when they lead a date"""
+    return frozenset(
+        _normalize(name)
+        for locale in LOCALES.values()
+        for name in locale.day_names + locale.day_names_short
+    )
+
+
+MONTH_INDEX = build_month_index()
+WEEKDAY_INDEX = build_weekday_index()
+
+
+def _checked(year: int, month: int, day: int, text: str) -> int:
+    if not 1 <= month <= 13 or not 1 <= day <= ethiopian_days_in_month(year, month):
+        raise ValueError(f"Invalid Ethiopian date: {text!r}")
+    return ethiopian_to_rd(year, month, day)
+
+
+@lru_cache(maxsize=4096)
+def parse_ethiopian_day_number(text: str) -> int:
+    """
+    Parse an Ethiopian date string into a fixed day number.
+
+    Accepts numeric YYYY-MM-DD (also with / or .), the M/D/YYYY order
+    used by the 'short' format style, and forms with a month name such
+    as "5 Meskerem 2017", "መስከረም 5, 2017" or "ረቡዕ, 1 መስከረም 2017 ዓ.ም".
+    Numbers may be written in Ge'ez numerals ("፩ መስከረም ፳፻፲፯").
+    """
+    if NUMERAL_RUN.search(text):
+        return parse_ethiopian_day_number(replace_geez_numerals(text))
+    match = _NUMERIC.match(text)
+    if match:
+        first, second, third = match.groups()
+        if len(first) >= 3:
+            return _checked(int(first), int(second), int(third), text)
+        if len(third) >= 3:
+            return _checked(int(third), int(first), int(second), text)
+        raise ValueError(f"Ambiguous Ethiopian date, year must have 3-4 digits: {text!r}")
+
+    month = None
+    numbers = []
+    for token in _TOKEN.findall(text):
+        if token.isdigit():
+            numbers.append(token)
+            continue
+        key = _normalize(token)
+        found = MONTH_INDEX.get(key)
+        if found is not None and month is None:
+            month = found
+        elif key not in WEEKDAY_INDEX and key not in ERA_MARKERS:
+            raise ValueError(f"Unrecognized word {token!r} in Ethiopian date: {text!r}")
+
+    if month is None or len(numbers) != 2:
+        raise ValueError(f"Could not parse Ethiopian date: {text!r}")
+    first, second = numbers
+    if len(first) >= 3 > len(second):
+        year, day = first, second
+    else:
+        day, year = first, second
+    return _checked(int(year), month, int(day), text)
+
+
+def parse_ethiopian(text: str) -> EthiopianDate:
+    """Parse an Ethiopian date string into an EthiopianDate"""
+    return EthiopianDate.from_day_number(parse_ethiopian_day_number(text))
+
+
+def parse_many(texts: Iterable[Optional[str]]) -> Tuple[array, array]:
+    """
+    Parse a batch of Ethiopian date strings.
+
+    Returns (day_numbers, errors): an array('q') of day numbers and an
+    array('b') mask that is 1 where the input could not be parsed (its
+    day number is left as 0). Both wrap into NumPy with np.frombuffer.
+    """
+    day_numbers = array('q')
+    errors = array('b')
+    parse = parse_ethiopian_day_number
+    for text in texts:
+        try:
+            day_numbers.append(parse(text))
+            errors.append(0)
+        except (ValueError, TypeError):
+            day_numbers.append(0)
+            errors.append(1)
+    return day_numbers, errors
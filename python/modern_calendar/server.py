@@ -0,0 +1,628 @@
+"""
+Modern Calendar System - HTTP Service
+Stdlib asyncio JSON API for conversion, month/year grids and holidays
+
+    python -m modern_calendar serve --port 8080
+
+GET  /convert?date=2024-09-11&from=gregorian&to=ethiopian&language=am&style=medium
+POST /convert   {"from": ..., "to": ..., "language": ..., "style": ..., "dates": [...]}
+GET  /month?calendar=ethiopian&year=2017&month=1&language=am&first_weekday=0
+GET  /year?calendar=ethiopian&year=2017&language=am&first_weekday=0
+GET  /holidays?calendar=ethiopian&start=2024-01-01&end=2024-12-31
+GET  /metrics[?format=json]
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from http import HTTPStatus
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .caching import LRUCache
+from .calendars import CALENDARS, ModernCalendar
+from .instrumentation import MethodStats
+from .locales import LOCALES
+
+SERVER_NAME = 'modern-calendar'
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+MAX_BATCH_SIZE = 10000
+MAX_HOLIDAY_SPAN_DAYS = 366 * 20
+KEEP_ALIVE_TIMEOUT = 15.0
+HANDLER_THREADS = 4
+
+# Routes that can run long enough to stall the event loop
+BLOCKING_ROUTES = frozenset({('POST', '/convert'), ('GET', '/month'), ('GET', '/year')})
+
+# Successful GET responses never change for the same URL
+CACHE_CONTROL = 'public, max-age=86400'
+
+ISO_PATTERN = '%Y-%m-%d'
+
+_NUMERIC_DATE = re.compile(r'^\s*(-?\d{1,4})-(\d{1,2})-(\d{1,2})\s*$')
+
+
+class HTTPError(Exception):
+    """Error turned into a JSON error response"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request(NamedTuple):
+    method: str
+    target: str
+    path: str
+    query: Dict[str, str]
+    version: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+class Response(NamedTuple):
+    status: int
+    body: bytes
+    content_type: str = 'application/json; charset=utf-8'
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+def json_response(data, status: int = 200) -> Response:
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return Response(status, body)
+
+
+def error_response(status: int, message: str) -> Response:
+    return json_response({'error': message, 'status': status}, status)
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Whether an If-None-Match header lists the ETag (weak comparison, or *)"""
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:].lstrip()
+        if candidate == etag:
+            return True
+    return False
+
+
+def parse_date(value: str, calendar_type: str) -> int:
+    """Day number of a date string in a calendar (ISO-style Y-M-D, or Ethiopian names)"""
+    if calendar_type == 'ethiopian':
+        from .parsing import parse_ethiopian_day_number
+        return parse_ethiopian_day_number(value)
+    if calendar_type == 'gregorian':
+        return date.fromisoformat(value.strip()[:10]).toordinal()
+    match = _NUMERIC_DATE.match(value)
+    if not match:
+        raise ValueError(f"Expected YYYY-MM-DD, got {value!r}")
+    year, month, day = (int(part) for part in match.groups())
+    calendar_impl = CALENDARS[calendar_type]
+    if not 1 <= month <= calendar_impl.months_in_year(year):
+        raise ValueError(f"Month out of range in {value!r}")
+    if not 1 <= day <= calendar_impl.days_in_month(year, month):
+        raise ValueError(f"Day out of range in {value!r}")
+    return calendar_impl.to_day_number(year, month, day)
+
+
+class ServiceMetrics:
+    """Request, connection and cache counters for /metrics"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.connections_open = 0
+        self.connections_total = 0
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+        self.responses_by_status: Dict[int, int] = {}
+        self.not_modified = 0
+        self.routes: Dict[str, MethodStats] = {}
+        # Guards counters updated from handler threads; the others are
+        # only touched on the event loop
+        self._lock = Lock()
+
+    def add_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def route(self, name: str) -> MethodStats:
+        stats = self.routes.get(name)
+        if stats is None:
+            # setdefault: handler threads may add the same route at once
+            stats = self.routes.setdefault(name, MethodStats(name))
+        return stats
+
+
+class CalendarService:
+    """
+    Routes requests to ModernCalendar and caches GET responses.
+
+    Independent of the transport: handle() turns a Request into a Response,
+    so the routes can be exercised without sockets. handle() is safe to
+    call from several threads at once.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache = LRUCache(maxsize=cache_size)
+        self.metrics = ServiceMetrics()
+        self.routes: Dict[Tuple[str, str], Callable[[Request], Response]] = {
+            ('GET', '/convert'): self.convert_one,
+            ('POST', '/convert'): self.convert_batch,
+            ('GET', '/month'): self.month,
+            ('GET', '/year'): self.year,
+            ('GET', '/holidays'): self.holidays,
+            ('GET', '/metrics'): self.metrics_endpoint,
+        }
+
+    # --- Dispatch ---------------------------------------------------------
+
+    @staticmethod
+    def is_blocking(request: Request) -> bool:
+        """Whether handling the request may take long enough to block an event loop"""
+        method = 'GET' if request.method == 'HEAD' else request.method
+        return (method, request.path) in BLOCKING_ROUTES
+
+    def handle(self, request: Request) -> Response:
+        """Build the response for one request"""
+        if request.method == 'OPTIONS':
+            return Response(204, b'', headers=(
+                ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+                ('Access-Control-Allow-Headers', 'Content-Type, If-None-Match'),
+                ('Access-Control-Max-Age', '86400'),
+            ))
+
+        method = 'GET' if request.method == 'HEAD' else request.method
+        handler = self.routes.get((method, request.path))
+        if handler is None:
+            if any(path == request.path for _, path in self.routes):
+                return error_response(405, f"Method {request.method} not allowed")
+            return error_response(404, f"No route for {request.path}")
+
+        stats = self.metrics.route(f"{method} {request.path}")
+        start = time.perf_counter_ns()
+        failed = False
+        try:
+            if method == 'GET' and handler is not self.metrics_endpoint:
+                response = self._cached(request, handler)
+            else:
+                response = handler(request)
+        except HTTPError as e:
+            failed = True
+            response = error_response(e.status, e.message)
+        except (ValueError, KeyError) as e:
+            failed = True
+            response = error_response(400, str(e).strip("'\""))
+        finally:
+            stats.observe(time.perf_counter_ns() - start, failed)
+
+        etag = dict(response.headers).get('ETag')
+        if etag is not None and etag_matches(etag, request.headers.get('if-none-match', '')):
+            self.metrics.add_not_modified()
+            return Response(304, b'', response.content_type, response.headers)
+        return response
+
+    def _cached(self, request: Request, handler) -> Response:
+        key = (request.path, tuple(sorted(request.query.items())))
+        response = self.cache.get(key)
+        if response is None:
+            response = handler(request)
+            if response.status == 200:
+                response = response._replace(headers=response.headers + (
+                    ('ETag', etag_for(response.body)),
+                    ('Cache-Control', CACHE_CONTROL),
+                ))
+                self.cache.put(key, response)
+        return response
+
+    # --- Parameters -------------------------------------------------------
+
+    @staticmethod
+    def _param(request: Request, name: str, default: Optional[str] = None) -> str:
+        value = request.query.get(name, default)
+        if value is None:
+            raise HTTPError(400, f"Missing query parameter: {name}")
+        return value
+
+    @staticmethod
+    def _int_param(request: Request, name: str, default: Optional[int] = None) -> int:
+        value = request.query.get(name)
+        if value is None:
+            if default is None:
+                raise HTTPError(400, f"Missing query parameter: {name}")
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise HTTPError(400, f"Query parameter {name} must be an integer") from None
+
+    @staticmethod
+    def _calendar_type(value: str) -> str:
+        if value not in CALENDARS:
+            raise HTTPError(400, f"Unknown calendar: {value}")
+        return value
+
+    @staticmethod
+    def _language(value: str) -> str:
+        if value not in LOCALES:
+            raise HTTPError(400, f"Unknown language: {value}")
+        return value
+
+    @staticmethod
+    def _first_weekday(value: int) -> int:
+        if not 0 <= value <= 6:
+            raise HTTPError(400, "first_weekday must be 0 (Monday) to 6 (Sunday)")
+        return value
+
+    # --- Routes -----------------------------------------------------------
+
+    def _converter(self, source: str, target: str, language: str, style: str):
+        """(parse, describe) pair for one conversion direction and style"""
+        source = self._calendar_type(source)
+        target_impl = CALENDARS[self._calendar_type(target)]
+        locale = LOCALES[self._language(language)]
+        if style == 'iso':
+            pattern = ISO_PATTERN
+        elif style in ('full', 'short', 'medium', 'geez'):
+            pattern = target_impl.format_patterns.get(style) or target_impl.format_patterns['medium']
+        else:
+            raise HTTPError(400, f"Unknown style: {style}")
+        render = target_impl.compile_format(pattern, locale)
+        from_day_number = target_impl.from_day_number
+
+        def describe(value: str) -> Dict:
+            rd = parse_date(value, source)
+            year, month, day = from_day_number(rd)
+            return {
+                'input': value,
+                'day_number': rd,
+                'year': year,
+                'month': month,
+                'day': day,
+                'formatted': render(rd)
+            }
+
+        return describe
+
+    def convert_one(self, request: Request) -> Response:
+        describe = self._converter(
+            self._param(request, 'from', 'gregorian'),
+            self._param(request, 'to', 'ethiopian'),
+            self._param(request, 'language', 'en'),
+            self._param(request, 'style', 'iso')
+        )
+        return json_response(describe(self._param(request, 'date')))
+
+    def convert_batch(self, request: Request) -> Response:
+        try:
+            payload = json.loads(request.body.decode('utf-8') or '{}')
+        except (UnicodeDecodeError, ValueError) as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}") from None
+        if not isinstance(payload, dict) or not isinstance(payload.get('dates'), list):
+            raise HTTPError(400, 'Body must be an object with a "dates" list')
+        dates = payload['dates']
+        if len(dates) > MAX_BATCH_SIZE:
+            raise HTTPError(413, f"At most {MAX_BATCH_SIZE} dates per batch")
+
+        describe = self._converter(
+            str(payload.get('from', 'gregorian')),
+            str(payload.get('to', 'ethiopian')),
+            str(payload.get('language', 'en')),
+            str(payload.get('style', 'iso'))
+        )
+        results = []
+        for value in dates:
+            try:
+                results.append(describe(str(value)))
+            except ValueError as e:
+                results.append({'input': value, 'error': str(e)})
+        return json_response({'results': results})
+
+    def month(self, request: Request) -> Response:
+        calendar = ModernCalendar(
+            self._calendar_type(self._param(request, 'calendar', 'gregorian')),
+            self._language(self._param(request, 'language', 'en'))
+        )
+        year = self._int_param(request, 'year')
+        month = self._int_param(request, 'month')
+        if not 1 <= month <= calendar.get_calendar().months_in_year(year):
+            raise HTTPError(400, f"Month out of range: {month}")
+        first_weekday = self._first_weekday(self._int_param(request, 'first_weekday', 0))
+        grid = calendar.get_year_calendar(year, first_weekday)[month - 1]
+        return json_response({
+            'calendar': calendar.calendar_type,
+            'year': year,
+            'month': grid.month,
+            'name': grid.name,
+            'first_weekday': first_weekday,
+            'weeks': grid.weeks
+        })
+
+    def year(self, request: Request) -> Response:
+        calendar = ModernCalendar(
+            self._calendar_type(self._param(request, 'calendar', 'gregorian')),
+            self._language(self._param(request, 'language', 'en'))
+        )
+        year = self._int_param(request, 'year')
+        first_weekday = self._first_weekday(self._int_param(request, 'first_weekday', 0))
+        return json_response({
+            'calendar': calendar.calendar_type,
+            'year': year,
+            'first_weekday': first_weekday,
+            'months': [
+                {'month': grid.month, 'name': grid.name, 'weeks': grid.weeks}
+                for grid in calendar.get_year_calendar(year, first_weekday)
+            ]
+        })
+
+    def holidays(self, request: Request) -> Response:
+        calendar_type = self._param(request, 'calendar', 'ethiopian')
+        calendar_impl = CALENDARS[self._calendar_type(calendar_type)]
+        start = parse_date(self._param(request, 'start'), 'gregorian')
+        end = parse_date(self._param(request, 'end'), 'gregorian')
+        if end < start:
+            raise HTTPError(400, "end must not be before start")
+        if end - start > MAX_HOLIDAY_SPAN_DAYS:
+            raise HTTPError(400, f"Range too long (max {MAX_HOLIDAY_SPAN_DAYS} days)")
+        holidays = []
+        for holiday in calendar_impl.holidays.holidays_between(start, end):
+            year, month, day = calendar_impl.from_day_number(holiday.day_number)
+            holidays.append({
+                'name': holiday.name,
+                'day_number': holiday.day_number,
+                'gregorian': date.fromordinal(holiday.day_number).isoformat(),
+                'date': {'year': year, 'month': month, 'day': day}
+            })
+        return json_response({'calendar': calendar_type, 'holidays': holidays})
+
+    def metrics_endpoint(self, request: Request) -> Response:
+        if request.query.get('format') == 'json':
+            return json_response(self.metrics_dict())
+        return Response(200, self.metrics_prometheus().encode('utf-8'),
+                        'text/plain; version=0.0.4; charset=utf-8')
+
+    # --- Metrics ----------------------------------------------------------
+
+    def metrics_dict(self) -> Dict:
+        m = self.metrics
+        cache = self.cache.cache_info()
+        return {
+            'uptime_seconds': time.time() - m.started,
+            'connections_open': m.connections_open,
+            'connections_total': m.connections_total,
+            'requests_in_flight': m.requests_in_flight,
+            'max_requests_in_flight': m.max_requests_in_flight,
+            'responses_by_status': {str(k): v for k, v in sorted(m.responses_by_status.items())},
+            'not_modified': m.not_modified,
+            'cache': cache._asdict(),
+            'routes': {name: stats.snapshot() for name, stats in m.routes.items()}
+        }
+
+    def metrics_prometheus(self) -> str:
+        m = self.metrics
+        cache = self.cache.cache_info()
+        prefix = 'modern_calendar_http'
+        lines: List[str] = []
+
+        def gauge(name: str, value, help_text: str, kind: str = 'gauge'):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {value}")
+
+        gauge('connections_open', m.connections_open, 'Open client connections.')
+        gauge('connections_total', m.connections_total, 'Accepted client connections.', 'counter')
+        gauge('requests_in_flight', m.requests_in_flight, 'Requests being handled.')
+        gauge('max_requests_in_flight', m.max_requests_in_flight,
+              'Most requests handled at the same time.')
+        gauge('not_modified_total', m.not_modified, 'Responses answered with 304.', 'counter')
+        gauge('cache_hits_total', cache.hits, 'Response cache hits.', 'counter')
+        gauge('cache_misses_total', cache.misses, 'Response cache misses.', 'counter')
+        gauge('cache_entries', cache.currsize, 'Cached responses.')
+
+        lines.append(f"# HELP {prefix}_responses_total Responses by status code.")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for status, count in sorted(m.responses_by_status.items()):
+            lines.append(f'{prefix}_responses_total{{status="{status}"}} {count}')
+
+        duration = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {duration} Handler latency by route.")
+        lines.append(f"# TYPE {duration} histogram")
+        for name, stats in m.routes.items():
+            snapshot = stats.snapshot()
+            for bound, count in snapshot['buckets']:
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{duration}_bucket{{route="{name}",le="{le}"}} {count}')
+            lines.append(f'{duration}_sum{{route="{name}"}} {snapshot["sum_seconds"]!r}')
+            lines.append(f'{duration}_count{{route="{name}"}} {snapshot["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+
+class CalendarServer:
+    """
+    Asyncio HTTP/1.1 front end for a CalendarService.
+
+    Connections are kept alive between requests, and pipelined requests
+    are answered in order as they are read from the stream. Batch
+    conversions and month/year grids run on a small thread pool so a
+    large request does not hold up other connections.
+    """
+
+    def __init__(self, service: Optional[CalendarService] = None,
+                 keep_alive_timeout: float = KEEP_ALIVE_TIMEOUT,
+                 handler_threads: int = HANDLER_THREADS):
+        self.service = service or CalendarService()
+        self.keep_alive_timeout = keep_alive_timeout
+        self.handler_threads = handler_threads
+        self._server = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080):
+        self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                  limit=MAX_HEADER_BYTES)
+        return self._server
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server else ()
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _respond(self, request: Request) -> Response:
+        if not self.service.is_blocking(request):
+            return self.service.handle(request)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.handler_threads,
+                                                thread_name_prefix='calendar-handler')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.service.handle, request)
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keep_alive_timeout)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            return None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, 'Request headers too large') from None
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            raise HTTPError(400, 'Malformed request line') from None
+        if not version.startswith('HTTP/1.'):
+            raise HTTPError(505, 'HTTP version not supported')
+
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise HTTPError(411, 'Chunked request bodies are not supported')
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HTTPError(400, 'Invalid Content-Length') from None
+        if length < 0:
+            raise HTTPError(400, 'Invalid Content-Length')
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, 'Request body too large')
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length),
+                                          self.keep_alive_timeout) if length else b''
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            return None
+
+        parts = urlsplit(target)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        return Request(method.upper(), target, parts.path, query, version, headers, body)
+
+    @staticmethod
+    def _keep_alive(request: Request) -> bool:
+        connection = request.headers.get('connection', '').lower()
+        if request.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    @staticmethod
+    def _serialize(response: Response, keep_alive: bool, head_only: bool) -> bytes:
+        status = HTTPStatus(response.status)
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Server: {SERVER_NAME}",
+            'Access-Control-Allow-Origin: *',
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if response.status != 204 and response.status != 304:
+            lines.append(f"Content-Type: {response.content_type}")
+            lines.append(f"Content-Length: {len(response.body)}")
+        lines.extend(f"{name}: {value}" for name, value in response.headers)
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        if head_only or response.status in (204, 304):
+            return head
+        return head + response.body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        metrics = self.service.metrics
+        metrics.connections_open += 1
+        metrics.connections_total += 1
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    writer.write(self._serialize(error_response(e.status, e.message), False, False))
+                    await writer.drain()
+                    metrics.responses_by_status[e.status] = \
+                        metrics.responses_by_status.get(e.status, 0) + 1
+                    break
+                if request is None:
+                    break
+
+                metrics.requests_in_flight += 1
+                metrics.max_requests_in_flight = max(metrics.max_requests_in_flight,
+                                                     metrics.requests_in_flight)
+                try:
+                    try:
+                        response = await self._respond(request)
+                    except Exception:
+                        response = error_response(500, 'Internal server error')
+                    keep_alive = self._keep_alive(request)
+                    writer.write(self._serialize(response, keep_alive, request.method == 'HEAD'))
+                    await writer.drain()
+                finally:
+                    metrics.requests_in_flight -= 1
+                metrics.responses_by_status[response.status] = \
+                    metrics.responses_by_status.get(response.status, 0) + 1
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            metrics.connections_open -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def _serve(host: str, port: int, cache_size: int) -> None:
+    server = CalendarServer(CalendarService(cache_size))
+    await server.start(host, port)
+    for sock in server.sockets:
+        print(f"Serving on http://{sock.getsockname()[0]}:{sock.getsockname()[1]}")
+    await server.serve_forever()
+
+
+def serve(host: str = '127.0.0.1', port: int = 8080, cache_size: int = 4096) -> None:
+    """Run the HTTP service until interrupted"""
+    try:
+        asyncio.run(_serve(host, port, cache_size))
+    except KeyboardInterrupt:
+        pass
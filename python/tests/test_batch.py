@@ -0,0 +1,110 @@
+"""NumPy batch conversion against the scalar day-number functions"""
+
+from datetime import date
+
+import pytest
+
+from modern_calendar.day_numbers import (
+    ethiopian_to_rd, islamic_to_rd, rd_to_ethiopian, rd_to_islamic
+)
+
+np = pytest.importorskip('numpy')
+
+from modern_calendar.batch import (  # noqa: E402
+    ETHIOPIAN_DTYPE, ISLAMIC_DTYPE, UNIX_EPOCH_RD, day_numbers_to_datetime64,
+    ethiopian_to_gregorian_batch, gregorian_to_ethiopian_batch, gregorian_to_islamic_batch,
+    islamic_to_gregorian_batch, to_day_numbers
+)
+
+# Every day from 1850 to 2150, plus a few far-off ones
+DAY_NUMBERS = np.concatenate([
+    np.arange(date(1850, 1, 1).toordinal(), date(2150, 12, 31).toordinal() + 1),
+    np.array([date(1, 1, 1).toordinal() + 1000, date(9999, 12, 31).toordinal()]),
+])
+
+CONVERSIONS = [
+    (gregorian_to_ethiopian_batch, ethiopian_to_gregorian_batch, rd_to_ethiopian, ethiopian_to_rd,
+     ETHIOPIAN_DTYPE),
+    (gregorian_to_islamic_batch, islamic_to_gregorian_batch, rd_to_islamic, islamic_to_rd,
+     ISLAMIC_DTYPE),
+]
+
+
+@pytest.mark.parametrize('forward, backward, scalar_forward, scalar_backward, dtype', CONVERSIONS)
+def test_matches_scalar_functions(forward, backward, scalar_forward, scalar_backward, dtype):
+    years, months, days = forward(DAY_NUMBERS)
+    expected = [scalar_forward(rd) for rd in DAY_NUMBERS.tolist()]
+    assert list(zip(years.tolist(), months.tolist(), days.tolist())) == expected
+
+    back = backward(years, months, days, as_day_numbers=True)
+    assert back.dtype == np.int64
+    assert np.array_equal(back, DAY_NUMBERS)
+    assert back[:500].tolist() == [scalar_backward(*ymd) for ymd in expected[:500]]
+
+
+@pytest.mark.parametrize('forward, backward, scalar_forward, scalar_backward, dtype', CONVERSIONS)
+def test_datetime64_and_structured(forward, backward, scalar_forward, scalar_backward, dtype):
+    dates = day_numbers_to_datetime64(DAY_NUMBERS)
+    assert dates.dtype == np.dtype('datetime64[D]')
+    records = forward(dates, structured=True)
+    assert records.dtype == dtype
+    plain = forward(DAY_NUMBERS)
+    for name, field in zip(('year', 'month', 'day'), plain):
+        assert np.array_equal(records[name], field)
+    assert np.array_equal(backward(records), dates)
+
+    # Coarser datetime64 units are truncated to the day
+    seconds = dates.astype('datetime64[s]') + np.timedelta64(3600 * 23, 's')
+    assert np.array_equal(forward(seconds, structured=True), records)
+
+
+def test_known_dates():
+    dates = np.array(['2024-09-11', '2024-09-10', '2023-09-11', '2024-01-07'],
+                     dtype='datetime64[D]')
+    years, months, days = gregorian_to_ethiopian_batch(dates)
+    assert list(zip(years.tolist(), months.tolist(), days.tolist())) == \
+        [(2017, 1, 1), (2016, 13, 5), (2015, 13, 6), (2016, 4, 28)]
+    assert to_day_numbers(np.array(['1970-01-01'], dtype='datetime64[D]'))[0] == UNIX_EPOCH_RD
+
+
+@pytest.mark.parametrize('forward, backward, scalar_forward, scalar_backward, dtype', CONVERSIONS)
+def test_nat_and_masked_input(forward, backward, scalar_forward, scalar_backward, dtype):
+    dates = np.array(['2024-09-11', 'NaT', '2000-01-01'], dtype='datetime64[D]')
+    years, months, days = forward(dates)
+    for field in (years, months, days):
+        assert np.ma.getmaskarray(field).tolist() == [False, True, False]
+    assert (years[0], months[0], days[0]) == scalar_forward(date(2024, 9, 11).toordinal())
+
+    records = forward(dates, structured=True)
+    assert np.ma.getmaskarray(records['year']).tolist() == [False, True, False]
+    assert backward(records).astype(str).tolist() == ['2024-09-11', 'NaT', '2000-01-01']
+
+    masked = np.ma.masked_array(DAY_NUMBERS[:3], mask=[True, False, False])
+    years, _, _ = forward(masked)
+    assert np.ma.getmaskarray(years).tolist() == [True, False, False]
+
+    back = backward(years, np.ma.masked_array([1, 2, 3], mask=[False, False, True]), [1, 1, 1],
+                    as_day_numbers=True)
+    assert np.ma.getmaskarray(back).tolist() == [True, False, True]
+    assert np.isnat(backward(years, [1, 2, 3], [1, 1, 1])).tolist() == [True, False, False]
+
+
+def test_no_missing_values_returns_plain_arrays():
+    years, _, _ = gregorian_to_ethiopian_batch(DAY_NUMBERS[:10])
+    assert not np.ma.isMaskedArray(years)
+    assert not np.ma.isMaskedArray(gregorian_to_ethiopian_batch(DAY_NUMBERS[:10], structured=True))
+
+
+@pytest.mark.parametrize('forward', [gregorian_to_ethiopian_batch, gregorian_to_islamic_batch])
+@pytest.mark.parametrize('values', [
+    np.array([1.5, 2.5]), np.array(['2024-09-11']), np.array([date(2024, 9, 11)], dtype=object),
+])
+def test_rejects_other_dtypes(forward, values):
+    with pytest.raises(TypeError):
+        forward(values)
+
+
+@pytest.mark.parametrize('backward', [ethiopian_to_gregorian_batch, islamic_to_gregorian_batch])
+def test_backward_needs_fields_or_records(backward):
+    with pytest.raises(TypeError):
+        backward(np.array([2017, 2018]))
@@ -0,0 +1,109 @@
+"""Frontend data bundles: binary chunk round trips, decade chunks and reproducible output"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from modern_calendar.bundles import (
+    HEADER, UNIX_EPOCH_RD, YEAR_RECORD, build_chunk, chunk_ranges, export_bundles,
+    holiday_names, pack_chunk, read_chunk
+)
+from modern_calendar.day_numbers import ethiopian_to_rd
+from modern_calendar.holiday_rules import ETHIOPIAN_HOLIDAYS
+
+
+@pytest.fixture(scope='module')
+def holiday_ids():
+    return {name: index for index, name in enumerate(holiday_names())}
+
+
+@pytest.mark.parametrize('first_year, last_year', [(2010, 2019), (2011, 2011), (1, 9), (2099, 2108)])
+def test_pack_read_round_trip(holiday_ids, first_year, last_year):
+    chunk = build_chunk(first_year, last_year, holiday_ids)
+    data = pack_chunk(chunk)
+    assert read_chunk(data) == chunk
+    # The decoded chunk is the JSON chunk, so it survives a JSON round trip too
+    assert json.loads(json.dumps(read_chunk(data))) == chunk
+
+
+def test_chunk_contents(holiday_ids):
+    chunk = build_chunk(2014, 2016, holiday_ids)
+    names = holiday_names()
+    for year, first_day, weekday, pagume_days, month_weekdays, holidays in chunk['years']:
+        first = ethiopian_to_rd(year, 1, 1)
+        assert first_day == first - UNIX_EPOCH_RD
+        assert weekday == first % 7                     # 0 = Sunday
+        assert pagume_days == (6 if year % 4 == 3 else 5)
+        assert month_weekdays == [(first + 30 * m) % 7 for m in range(13)]
+        expected = sorted((h.day_number - first + 1, h.name)
+                          for h in ETHIOPIAN_HOLIDAYS.holidays_between(first, first + 364))
+        assert sorted((day, names[i]) for day, i in holidays) == expected
+
+
+def test_read_rejects_foreign_data(holiday_ids):
+    data = pack_chunk(build_chunk(2016, 2016, holiday_ids))
+    with pytest.raises(ValueError):
+        read_chunk(b'NOTABUND' + data[8:])
+    with pytest.raises(ValueError):
+        read_chunk(data[:8] + (99).to_bytes(2, 'little') + data[10:])
+    assert len(data) >= HEADER.size + YEAR_RECORD.size
+
+
+@pytest.mark.parametrize('first_year, last_year, expected', [
+    (2010, 2019, [(2010, 2019)]),
+    (2019, 2020, [(2010, 2019), (2020, 2029)]),
+    (2015, 2035, [(2010, 2019), (2020, 2029), (2030, 2039)]),
+    (2020, 2020, [(2020, 2029)]),
+    (1, 12, [(0, 9), (10, 19)]),
+])
+def test_chunk_ranges_align_to_decades(first_year, last_year, expected):
+    assert list(chunk_ranges(first_year, last_year)) == expected
+
+
+def test_export_decade_boundaries(tmp_path):
+    manifest = export_bundles(str(tmp_path), 2019, 2020)
+    assert [(c['first_year'], c['last_year']) for c in manifest['chunks']] == \
+        [(2010, 2019), (2020, 2029)]
+    assert (manifest['first_year'], manifest['last_year']) == (2010, 2029)
+    for entry in manifest['chunks']:
+        with open(tmp_path / entry['json']['name'], 'rb') as f:
+            chunk = json.loads(f.read())
+        with open(tmp_path / entry['bin']['name'], 'rb') as f:
+            assert read_chunk(f.read()) == chunk
+        assert [record[0] for record in chunk['years']] == \
+            list(range(entry['first_year'], entry['last_year'] + 1))
+
+    # Year 0 does not exist: the first decade starts at year 1
+    manifest = export_bundles(str(tmp_path / 'early'), 1, 5)
+    assert manifest['chunks'][0]['json']['name'] == 'ethiopian-1-9.json'
+
+
+def test_export_rejects_bad_ranges(tmp_path):
+    with pytest.raises(ValueError):
+        export_bundles(str(tmp_path), 2020, 2010)
+    with pytest.raises(ValueError):
+        export_bundles(str(tmp_path), 0, 10)
+    with pytest.raises(ValueError):
+        export_bundles(str(tmp_path), 2010, 2020, chunk_years=0)
+
+
+def read_tree(directory):
+    files = {}
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), 'rb') as f:
+            files[name] = f.read()
+    return files
+
+
+def test_output_is_byte_identical_across_runs(tmp_path):
+    first = export_bundles(str(tmp_path / 'a'), 2010, 2025, compress=True)
+    second = export_bundles(str(tmp_path / 'b'), 2010, 2025, compress=True)
+    assert first == second
+    files_a, files_b = read_tree(tmp_path / 'a'), read_tree(tmp_path / 'b')
+    assert files_a == files_b
+    assert 'manifest.json.gz' in files_a and 'ethiopian-2020-2029.bin.gz' in files_a
+    for name, data in files_a.items():
+        if name.endswith('.gz'):
+            assert gzip.decompress(data) == files_a[name[:-3]]
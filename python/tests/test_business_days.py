@@ -0,0 +1,93 @@
+"""Business-day counting and offsets, checked against NumPy"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from modern_calendar.business_days import COVERAGE_MARGIN, BusinessCalendar
+from modern_calendar.holiday_rules import ETHIOPIAN_HOLIDAYS
+
+np = pytest.importorskip('numpy')
+
+WEEKENDS = [(5, 6), (4, 5)]
+
+FIRST = date(2010, 1, 1)
+LAST = date(2035, 12, 31)
+
+OFFSETS = [0, 1, 2, 5, 9, -1, -2, -5, -9, 40, -40, 260, -260, 600, -600, 1500, -1500]
+
+
+def weekmask(weekend):
+    return [day not in weekend for day in range(7)]
+
+
+def holiday_dates(first=FIRST, last=LAST):
+    return np.array([date.fromordinal(rd) for rd in
+                     ETHIOPIAN_HOLIDAYS.day_numbers_between(first - timedelta(3000),
+                                                            last + timedelta(3000))],
+                    dtype='datetime64[D]')
+
+
+def start_dates():
+    """Ordinary days plus days that are holidays or weekends"""
+    starts = [FIRST + timedelta(days=i) for i in range(0, (LAST - FIRST).days, 97)]
+    for rd in ETHIOPIAN_HOLIDAYS.day_numbers_between(date(2020, 1, 1), date(2026, 1, 1)):
+        starts.append(date.fromordinal(rd))
+    starts += [date(2024, 9, 14), date(2024, 9, 15), date(2024, 9, 13)]  # Sat, Sun, Fri
+    return starts
+
+
+@pytest.mark.parametrize('weekend', WEEKENDS)
+@pytest.mark.parametrize('with_holidays', [False, True])
+def test_offsets_match_numpy(weekend, with_holidays):
+    holidays = holiday_dates() if with_holidays else []
+    for start in start_dates():
+        # A fresh calendar per start also exercises growing the coverage window
+        calendar = BusinessCalendar(weekend, ETHIOPIAN_HOLIDAYS if with_holidays else None)
+        for n in OFFSETS:
+            expected = np.busday_offset(np.datetime64(start, 'D'), n, roll='forward',
+                                        weekmask=weekmask(weekend), holidays=holidays)
+            assert calendar.add_business_days(start, n) == expected.astype(object), (start, n)
+
+
+@pytest.mark.parametrize('weekend', WEEKENDS)
+@pytest.mark.parametrize('with_holidays', [False, True])
+def test_counts_match_numpy(weekend, with_holidays):
+    holidays = holiday_dates() if with_holidays else []
+    calendar = BusinessCalendar(weekend, ETHIOPIAN_HOLIDAYS if with_holidays else None)
+    starts = start_dates()
+    spans = [0, 1, 6, 7, 30, 365, COVERAGE_MARGIN + 1, 2 * COVERAGE_MARGIN + 5, 3000]
+    for start in starts:
+        for span in spans:
+            for end in (start + timedelta(span), start - timedelta(span)):
+                expected = np.busday_count(np.datetime64(start, 'D'), np.datetime64(end, 'D'),
+                                           weekmask=weekmask(weekend), holidays=holidays)
+                assert calendar.count_business_days(start, end) == expected, (start, end)
+
+
+def test_coverage_grows_in_both_directions():
+    calendar = BusinessCalendar((5, 6), ETHIOPIAN_HOLIDAYS)
+    middle = date(2024, 1, 1)
+    calendar.count_business_days(middle, middle + timedelta(1))
+    lo, hi, _ = calendar._coverage
+    assert hi - lo < 3 * COVERAGE_MARGIN
+
+    far = middle + timedelta(days=5 * COVERAGE_MARGIN)
+    holidays = holiday_dates()
+    mask = weekmask((5, 6))
+    assert calendar.count_business_days(middle, far) == np.busday_count(
+        np.datetime64(middle, 'D'), np.datetime64(far, 'D'), weekmask=mask, holidays=holidays)
+    early = middle - timedelta(days=5 * COVERAGE_MARGIN)
+    assert calendar.add_business_days(middle, -1400) == np.busday_offset(
+        np.datetime64(middle, 'D'), -1400, roll='forward', weekmask=mask,
+        holidays=holidays).astype(object)
+    lo, hi, days = calendar._coverage
+    assert lo <= early.toordinal() and far.toordinal() < hi
+    assert list(days) == sorted(set(days))
+
+
+def test_day_numbers_return_day_numbers():
+    calendar = BusinessCalendar((5, 6), ETHIOPIAN_HOLIDAYS)
+    start = date(2024, 9, 10)
+    assert calendar.add_business_days(start.toordinal(), 3) == \
+        calendar.add_business_days(start, 3).toordinal()
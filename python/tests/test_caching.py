@@ -0,0 +1,115 @@
+"""LRU cache and the shared month grid cache behind ModernCalendar"""
+
+import pytest
+
+from modern_calendar import MONTH_GRID_CACHE, ModernCalendar
+from modern_calendar.caching import CacheInfo, LRUCache
+
+
+@pytest.fixture
+def grid_cache():
+    """MONTH_GRID_CACHE shrunk to three entries, restored afterwards"""
+    maxsize = MONTH_GRID_CACHE.maxsize
+    ModernCalendar.cache_clear()
+    MONTH_GRID_CACHE.resize(3)
+    yield MONTH_GRID_CACHE
+    MONTH_GRID_CACHE.resize(maxsize)
+    ModernCalendar.cache_clear()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    assert cache.get('a') == 'A'          # a is now the most recent
+    cache.put('d', 'D')                   # evicts b, the least recent
+    assert 'b' not in cache and len(cache) == 3
+    cache.put('c', 'C2')                  # overwriting refreshes c
+    cache.put('e', 'E')                   # evicts a
+    assert [key for key in 'abcde' if key in cache] == ['c', 'd', 'e']
+    assert cache.get('c') == 'C2'
+
+
+def test_lru_statistics():
+    cache = LRUCache(maxsize=2)
+    assert cache.cache_info() == CacheInfo(0, 0, 2, 0)
+    assert cache.get('x') is None and cache.get('x', 0) == 0
+    cache.put('x', 1)
+    assert cache.get('x') == 1
+    assert cache.get_or_compute('y', lambda: 2) == 2
+    assert cache.get_or_compute('y', lambda: 3) == 2
+    assert cache.cache_info() == CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+    cache.resize(1)
+    assert cache.cache_info().currsize == 1 and 'y' in cache
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(0, 0, 1, 0)
+
+
+def test_lru_zero_size_and_validation():
+    cache = LRUCache(maxsize=0)
+    cache.put('x', 1)
+    assert cache.get('x') is None and len(cache) == 0
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+
+
+def test_month_grid_hits_and_misses(grid_cache):
+    calendar = ModernCalendar('ethiopian', 'en')
+    first = calendar.get_month_calendar(2016, 1)
+    assert ModernCalendar.cache_info() == CacheInfo(0, 1, 3, 1)
+    assert calendar.get_month_calendar(2016, 1) is first
+    # Another instance (and language) shares the grid; the first weekday is part of the key
+    assert ModernCalendar('ethiopian', 'am').get_month_calendar(2016, 1) is first
+    assert calendar.get_month_calendar(2016, 1, first_weekday=6) != first
+    assert ModernCalendar.cache_info() == CacheInfo(2, 2, 3, 2)
+
+
+def test_month_grid_eviction_order(grid_cache):
+    calendar = ModernCalendar('gregorian', 'en')
+    for month in (1, 2, 3):
+        calendar.get_month_calendar(2024, month)
+    calendar.get_month_calendar(2024, 1)      # refresh January
+    calendar.get_month_calendar(2024, 4)      # evicts February
+    assert ('gregorian', 2024, 2, 0) not in grid_cache
+    assert [('gregorian', 2024, m, 0) in grid_cache for m in (1, 3, 4)] == [True] * 3
+
+    # Year views share the cache under month None and evict the same way
+    calendar.get_year_calendar(2024)
+    assert ('gregorian', 2024, None, 0) in grid_cache
+    assert ('gregorian', 2024, 3, 0) not in grid_cache
+    assert ModernCalendar.cache_info().currsize == 3
+
+    hits = ModernCalendar.cache_info().hits
+    calendar.get_month_calendar(2024, 2)      # recomputed after eviction
+    assert ModernCalendar.cache_info().hits == hits
+
+
+def test_cached_grids_are_immutable(grid_cache):
+    calendar = ModernCalendar('ethiopian', 'en')
+    grid = calendar.get_month_calendar(2015, 13)
+    assert isinstance(grid, tuple) and all(isinstance(week, tuple) for week in grid)
+    with pytest.raises(TypeError):
+        grid[0] = ()
+    with pytest.raises(TypeError):
+        grid[-1][0] = 99
+    with pytest.raises(AttributeError):
+        grid.append(())
+
+    year = calendar.get_year_calendar(2015)
+    with pytest.raises(TypeError):
+        year[0].weeks[0][0] = 99
+    with pytest.raises(AttributeError):
+        year[0].weeks = ()
+    # The next caller sees the unchanged grid
+    assert calendar.get_month_calendar(2015, 13) == grid
+    assert [day for week in grid for day in week if day] == list(range(1, 7))
+
+
+def test_cache_clear_resets_statistics(grid_cache):
+    calendar = ModernCalendar('islamic', 'en')
+    calendar.get_month_calendar(1445, 9)
+    calendar.get_month_calendar(1445, 9)
+    ModernCalendar.cache_clear()
+    assert ModernCalendar.cache_info() == CacheInfo(0, 0, 3, 0)
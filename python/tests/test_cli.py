@@ -0,0 +1,72 @@
+"""Streaming CSV and JSON Lines conversion"""
+
+import io
+import json
+
+import pytest
+
+from modern_calendar.cli import ConversionError, build_converter, convert_csv, convert_jsonl, main
+
+TO_ETHIOPIAN = build_converter('ethiopian', 'iso', 'en')
+
+
+def run_csv(text, columns=('date',), **options):
+    out = io.StringIO()
+    rows = convert_csv(io.StringIO(text), out, list(columns), TO_ETHIOPIAN, **options)
+    return rows, out.getvalue().splitlines()
+
+
+def test_csv_in_place_and_suffix():
+    text = 'id,date\n1,2024-09-11\n2,2024-01-07\n'
+    assert run_csv(text) == (2, ['id,date', '1,2017-01-01', '2,2016-04-28'])
+    assert run_csv(text, suffix='_et')[1] == \
+        ['id,date,date_et', '1,2024-09-11,2017-01-01', '2,2024-01-07,2016-04-28']
+
+
+def test_csv_errors_modes():
+    text = 'date\nnot a date\n'
+    with pytest.raises(ConversionError, match="line 2, column 'date'"):
+        run_csv(text)
+    assert run_csv(text, errors='keep')[1] == ['date', 'not a date']
+    assert run_csv(text, errors='blank')[1] == ['date', '""']
+
+
+def test_csv_short_row_is_blank():
+    assert run_csv('id,date\n1\n', suffix='_et')[1] == ['id,date,date_et', '1,,']
+
+
+def test_csv_row_with_extra_fields():
+    with pytest.raises(ConversionError, match='line 3: 3 fields, header has 2'):
+        run_csv('id,date\n1,2024-09-11\n2,2024-09-11,extra\n')
+
+
+def test_csv_missing_column():
+    with pytest.raises(ConversionError, match='Columns not found'):
+        run_csv('id\n1\n')
+
+
+def test_jsonl():
+    out = io.StringIO()
+    text = '{"date": "2024-09-11"}\n\n{"date": null}\n'
+    assert convert_jsonl(io.StringIO(text), out, ['date'], TO_ETHIOPIAN, '_et') == 2
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records == [{'date': '2024-09-11', 'date_et': '2017-01-01'},
+                       {'date': None, 'date_et': ''}]
+
+
+@pytest.mark.parametrize('line', ['[1, 2]', '{broken'])
+def test_jsonl_rejects_non_objects(line):
+    with pytest.raises(ConversionError, match='line 1'):
+        convert_jsonl(io.StringIO(line + '\n'), io.StringIO(), ['date'], TO_ETHIOPIAN)
+
+
+def test_to_gregorian():
+    convert = build_converter('gregorian', 'iso', 'en')
+    assert convert('2017-01-01') == '2024-09-11'
+
+
+def test_main_reports_ragged_csv(tmp_path, capsys):
+    source = tmp_path / 'dates.csv'
+    source.write_text('date\n2024-09-11,extra\n', encoding='utf-8')
+    assert main(['convert', str(source), '-c', 'date', '-o', str(tmp_path / 'out.csv')]) == 1
+    assert 'error: line 2: 2 fields, header has 1' in capsys.readouterr().err
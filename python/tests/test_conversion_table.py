@@ -0,0 +1,101 @@
+"""Memory-mapped conversion table: contents, validation and rebuilds"""
+
+import os
+
+import pytest
+
+from modern_calendar.conversion_table import (
+    FORMAT_VERSION, HEADER, ConversionTable, StaleTableError, load_table, write_table
+)
+from modern_calendar.day_numbers import gregorian_to_rd, rd_to_ethiopian, weekday
+from modern_calendar.holiday_rules import ETHIOPIAN_HOLIDAYS
+
+FIRST_YEAR, LAST_YEAR = 2020, 2025
+
+
+@pytest.fixture
+def path(tmp_path):
+    return write_table(str(tmp_path / 'table.tbl'), FIRST_YEAR, LAST_YEAR)
+
+
+def assert_matches_day_numbers(table):
+    first, last = gregorian_to_rd(FIRST_YEAR, 1, 1), gregorian_to_rd(LAST_YEAR, 12, 31)
+    assert (table.first_day_number, table.last_day_number) == (first, last)
+    for rd in range(first, last + 1):
+        assert table.lookup(rd) == table.ethiopian(rd) == rd_to_ethiopian(rd)
+        assert table.weekday(rd) == weekday(rd)
+        assert table.holiday_flag(rd) == ETHIOPIAN_HOLIDAYS.is_holiday(rd)
+    assert table.lookup(first - 1) is None
+    assert table.lookup(last + 1) is None
+    assert table.holiday_flag(last + 1) is None
+
+
+def patch_file(path, offset, data):
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def test_table_matches_day_numbers(path):
+    with ConversionTable(path) as table:
+        assert_matches_day_numbers(table)
+
+
+def test_corrupt_payload_fails_checksum(path):
+    with open(path, 'rb') as f:
+        f.seek(HEADER.size + 100)
+        byte = f.read(1)
+    patch_file(path, HEADER.size + 100, bytes([byte[0] ^ 0xFF]))
+
+    with pytest.raises(StaleTableError, match='checksum'):
+        ConversionTable(path)
+    # Without verification the corrupt table opens
+    ConversionTable(path, verify=False).close()
+    with pytest.raises(StaleTableError, match='checksum'):
+        load_table(path, FIRST_YEAR, LAST_YEAR, rebuild=False)
+
+    with load_table(path, FIRST_YEAR, LAST_YEAR) as table:
+        assert_matches_day_numbers(table)
+
+
+def test_other_version_is_stale(path):
+    # The version field follows the 8-byte magic
+    patch_file(path, 8, (FORMAT_VERSION + 1).to_bytes(2, 'little'))
+    with pytest.raises(StaleTableError, match='different data'):
+        ConversionTable(path)
+    with load_table(path, FIRST_YEAR, LAST_YEAR) as table:
+        assert_matches_day_numbers(table)
+
+
+@pytest.mark.parametrize('size', [0, HEADER.size - 1, HEADER.size + 10])
+def test_truncated_file_is_stale(path, size):
+    with open(path, 'r+b') as f:
+        f.truncate(size)
+    with pytest.raises(StaleTableError):
+        ConversionTable(path)
+    with load_table(path, FIRST_YEAR, LAST_YEAR) as table:
+        assert_matches_day_numbers(table)
+
+
+def test_not_a_table(path):
+    patch_file(path, 0, b'NOTATABL')
+    with pytest.raises(StaleTableError, match='not a conversion table'):
+        ConversionTable(path)
+
+
+def test_missing_file_is_built(tmp_path):
+    path = str(tmp_path / 'sub' / 'table.tbl')
+    with pytest.raises(FileNotFoundError):
+        load_table(path, FIRST_YEAR, LAST_YEAR, rebuild=False)
+    with load_table(path, FIRST_YEAR, LAST_YEAR) as table:
+        assert_matches_day_numbers(table)
+
+
+def test_narrow_window_is_rebuilt(tmp_path):
+    path = write_table(str(tmp_path / 'table.tbl'), 2022, 2023)
+    with pytest.raises(StaleTableError, match='does not cover'):
+        load_table(path, FIRST_YEAR, LAST_YEAR, rebuild=False)
+    before = os.stat(path).st_size
+    with load_table(path, FIRST_YEAR, LAST_YEAR) as table:
+        assert_matches_day_numbers(table)
+    assert os.stat(path).st_size > before
@@ -0,0 +1,101 @@
+"""Compact int32 encodings of Ethiopian dates"""
+
+from array import array
+
+import pytest
+
+from modern_calendar.date_encoding import (
+    ENCODINGS, MAX_INT32, MAX_YMD_YEAR, MIN_INT32, MIN_YMD_YEAR, convert_many, dumps, loads,
+    pack, pack_many, unpack, unpack_many
+)
+from modern_calendar.day_numbers import ethiopian_to_rd, rd_to_ethiopian
+
+# The same span the day-number tests cover, negative Ethiopian years included
+RD_RANGE = range(-800000, 900001)
+
+
+@pytest.fixture(scope='module')
+def triples():
+    return [rd_to_ethiopian(rd) for rd in RD_RANGE]
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+def test_round_trip(triples, encoding):
+    packed = pack_many(triples, encoding)
+    assert list(unpack_many(packed, encoding)) == triples
+    assert list(unpack_many(dumps(packed), encoding)) == triples
+    for index in range(0, len(triples), 997):
+        assert pack(*triples[index], encoding=encoding) == packed[index]
+        assert unpack(packed[index], encoding) == triples[index]
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+def test_sorts_in_date_order(triples, encoding):
+    packed = pack_many(triples, encoding)
+    assert all(a < b for a, b in zip(packed, packed[1:]))
+
+
+def test_day_number_is_the_ordinal(triples):
+    assert list(pack_many(triples)) == list(RD_RANGE)
+
+
+def test_convert_many(triples):
+    day_numbers = pack_many(triples, 'day_number')
+    ymd = pack_many(triples, 'ymd')
+    assert convert_many(day_numbers, 'day_number', 'ymd') == ymd
+    assert convert_many(dumps(ymd), 'ymd', 'day_number') == day_numbers
+
+
+def test_dumps_is_little_endian():
+    data = dumps([1, -2])
+    assert data == b'\x01\x00\x00\x00\xfe\xff\xff\xff'
+    assert list(loads(data)) == [1, -2]
+    assert list(loads(bytearray(data))) == [1, -2]
+    with pytest.raises(ValueError):
+        loads(data[:-1])
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+def test_invalid_dates(encoding):
+    for year, month, day in [(2016, 14, 1), (2016, 0, 1), (2016, 1, 31), (2016, 13, 6),
+                             (2015, 13, 7), (2016, 1, 0)]:
+        with pytest.raises(ValueError):
+            pack(year, month, day, encoding)
+        with pytest.raises(ValueError):
+            pack_many([(2016, 1, 1), (year, month, day)], encoding)
+    assert pack(2015, 13, 6, encoding) == pack_many([(2015, 13, 6)], encoding)[0]
+
+
+def test_ymd_year_bounds():
+    for year in (MIN_YMD_YEAR, MAX_YMD_YEAR):
+        assert unpack(pack(year, 13, 5, 'ymd'), 'ymd') == (year, 13, 5)
+        assert next(unpack_many(pack_many([(year, 1, 1)], 'ymd'), 'ymd')) == (year, 1, 1)
+    for year in (MIN_YMD_YEAR - 1, MAX_YMD_YEAR + 1):
+        with pytest.raises(ValueError, match='ymd'):
+            pack(year, 1, 1, 'ymd')
+        with pytest.raises(ValueError, match='ymd'):
+            pack_many([(year, 1, 1)], 'ymd')
+
+
+def test_day_number_bounds():
+    last = rd_to_ethiopian(MAX_INT32)
+    first = rd_to_ethiopian(MIN_INT32)
+    assert list(pack_many([first, last])) == [MIN_INT32, MAX_INT32]
+    after, before = rd_to_ethiopian(MAX_INT32 + 1), rd_to_ethiopian(MIN_INT32 - 1)
+    for triple in (after, before):
+        assert abs(ethiopian_to_rd(*triple)) > MAX_INT32
+        with pytest.raises(ValueError, match='day_number'):
+            pack(*triple)
+        with pytest.raises(ValueError, match='day_number'):
+            pack_many([triple])
+    with pytest.raises(ValueError, match='ymd'):
+        convert_many(array('q', [MAX_INT32]), 'day_number', 'ymd')
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        pack(2016, 1, 1, 'packed')
+    with pytest.raises(ValueError):
+        pack_many([], 'packed')
+    with pytest.raises(ValueError):
+        list(unpack_many([], 'packed'))
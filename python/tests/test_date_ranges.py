@@ -0,0 +1,104 @@
+"""Lazy Ethiopian day, month and year ranges"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from modern_calendar.date_ranges import ethiopian_days, ethiopian_months, ethiopian_years
+from modern_calendar.day_numbers import ethiopian_to_rd, rd_to_ethiopian
+from modern_calendar.ethiopian_date import EthiopianDate
+
+START = ethiopian_to_rd(2010, 1, 1)
+STOP = ethiopian_to_rd(2020, 1, 1)
+
+
+def month_starts(start, stop):
+    """Reference: walk every day and keep the first days of months"""
+    return [rd for rd in range(start, stop) if rd_to_ethiopian(rd)[2] == 1]
+
+
+@pytest.mark.parametrize('start, stop, step', [
+    (START, STOP, 1), (START + 5, STOP - 3, 1), (START, STOP, 7), (START, START, 1),
+    (STOP, START, -3), (START, START + 1, 1),
+])
+def test_days_behave_like_range(start, stop, step):
+    days = ethiopian_days(start, stop, step, as_day_numbers=True)
+    expected = range(start, stop, step)
+    assert len(days) == len(expected) and bool(days) == bool(expected)
+    assert list(days) == list(expected)
+    assert list(reversed(days)) == list(reversed(expected))
+    for item in (slice(None, None, 2), slice(3, -3), slice(None, None, -1), slice(10, 2)):
+        assert list(days[item]) == list(expected[item])
+    if expected:
+        assert days[0] == expected[0] and days[-1] == expected[-1]
+        assert expected[len(expected) // 2] in days
+    assert stop in days if stop in expected else stop not in days
+
+
+def test_days_as_dates():
+    days = ethiopian_days(date(2024, 9, 9), date(2024, 9, 13))
+    assert list(days) == [EthiopianDate(2016, 13, 4), EthiopianDate(2016, 13, 5),
+                          EthiopianDate(2017, 1, 1), EthiopianDate(2017, 1, 2)]
+    assert EthiopianDate(2017, 1, 1) in days
+    assert date(2024, 9, 11) in days and date(2024, 9, 13) not in days
+    with pytest.raises(IndexError):
+        days[4]
+
+
+@pytest.mark.parametrize('start, stop', [
+    (START, STOP), (START + 1, STOP), (START - 1, STOP + 1),
+    # Across the leap year 2015, whose Pagume has six days
+    (ethiopian_to_rd(2015, 12, 15), ethiopian_to_rd(2016, 3, 1)),
+    (ethiopian_to_rd(2016, 12, 15), ethiopian_to_rd(2017, 3, 2)),
+])
+def test_months_match_reference(start, stop):
+    months = ethiopian_months(start, stop, as_day_numbers=True)
+    expected = month_starts(start, stop)
+    # The consecutive-month fast path steps over Pagume by its length
+    assert list(months) == expected
+    assert len(months) == len(expected)
+    assert [months[i] for i in range(len(months))] == expected
+    assert list(reversed(months)) == expected[::-1]
+    assert list(months[1::3]) == expected[1::3]
+    assert list(months[::-2]) == expected[::-2]
+
+
+def test_months_pagume_lengths():
+    months = list(ethiopian_months(EthiopianDate(2015, 13, 1), EthiopianDate(2017, 2, 1)))
+    assert months == [EthiopianDate(2015, 13, 1), EthiopianDate(2016, 1, 1),
+                      *[EthiopianDate(2016, m, 1) for m in range(2, 14)],
+                      EthiopianDate(2017, 1, 1)]
+    assert months[1].toordinal() - months[0].toordinal() == 6
+    assert months[-1].toordinal() - months[-2].toordinal() == 5
+
+
+def test_months_membership_and_step():
+    months = ethiopian_months(START, STOP, step=4)
+    assert EthiopianDate(2010, 1, 1) in months
+    assert EthiopianDate(2010, 5, 1) in months
+    assert EthiopianDate(2010, 2, 1) not in months        # skipped by the step
+    assert EthiopianDate(2010, 5, 2) not in months        # not a month start
+    assert EthiopianDate(2020, 1, 1) not in months        # stop is exclusive
+    assert [m.toordinal() for m in months] == month_starts(START, STOP)[::4]
+    with pytest.raises(ValueError):
+        ethiopian_months(START, STOP, step=0)
+
+
+def test_years():
+    years = ethiopian_years(START - 1, STOP + 1, as_day_numbers=True)
+    expected = [ethiopian_to_rd(year, 1, 1) for year in range(2010, 2021)]
+    assert list(years) == expected and len(years) == 11
+    assert list(reversed(years)) == expected[::-1]
+    assert list(years[2:5]) == expected[2:5]
+    assert ethiopian_to_rd(2015, 1, 1) in years
+    assert ethiopian_to_rd(2015, 1, 2) not in years
+    assert list(ethiopian_years(START, STOP, step=3)) == \
+        [EthiopianDate(year, 1, 1) for year in range(2010, 2020, 3)]
+
+
+def test_large_ranges_are_lazy():
+    far = date(1, 1, 1) + timedelta(days=3_000_000)
+    months = ethiopian_months(date(1, 1, 1), far, as_day_numbers=True)
+    assert len(months) > 98_000
+    assert months[-1] == month_starts(far.toordinal() - 40, far.toordinal())[-1]
+    assert 'items' in repr(months) and repr(ethiopian_days(5, 5)).endswith('(empty)')
@@ -0,0 +1,163 @@
+"""Integer day-number conversions"""
+
+from datetime import date
+
+import pytest
+
+from modern_calendar.day_numbers import (
+    ETHIOPIAN_EPOCH, ISLAMIC_EPOCH, EthiopianYearIndex, ethiopian_days_in_month,
+    ethiopian_to_rd, ethiopian_year_start, get_ethiopian_year_index, gregorian_to_rd,
+    islamic_days_in_month, islamic_to_rd, islamic_year_start, julian_to_rd, rd_to_ethiopian,
+    rd_to_gregorian, rd_to_islamic, weekday
+)
+
+# Covers roughly 2190 BCE to 2465 CE, negative Ethiopian and Islamic years included
+RD_RANGE = range(-800000, 900001)
+
+
+class BaselineEthiopian:
+    """The Julian Day based engine the day-number core replaced"""
+
+    jd_epoch = 1724220.5
+
+    def gregorian_to_jd(self, value: date) -> float:
+        year, month, day = value.year, value.month, value.day
+        if month < 3:
+            month += 12
+            year -= 1
+        a = year // 100
+        b = 2 - a + a // 4
+        return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
+
+    def ethiopian_to_jd(self, year: int, month: int, day: int) -> float:
+        if year < 0:
+            year += 1
+        return day + (month - 1) * 30 + (year - 1) * 365 + year // 4 + self.jd_epoch - 1
+
+    def jd_to_ethiopian(self, jd: float):
+        c = int(jd) + 0.5 - self.jd_epoch
+        year = int((c - int((c + 366) / 1461)) / 365) + 1
+        if year <= 0:
+            year -= 1
+        year_start = self.ethiopian_to_jd(year, 1, 1)
+        day_of_year = int(jd) + 0.5 - year_start + 1
+        month = int((day_of_year - 1) / 30) + 1
+        return year, month, int(day_of_year - (month - 1) * 30)
+
+    def gregorian_to_ethiopian(self, value: date):
+        return self.jd_to_ethiopian(self.gregorian_to_jd(value))
+
+
+@pytest.mark.parametrize('gregorian, ethiopian', [
+    (date(2024, 9, 11), (2017, 1, 1)),     # Enkutatash after a common year
+    (date(2023, 9, 12), (2016, 1, 1)),     # Enkutatash after leap year 2015
+    (date(2023, 9, 11), (2015, 13, 6)),    # Pagume 6 of a leap year
+    (date(2019, 9, 11), (2011, 13, 6)),
+    (date(2024, 9, 10), (2016, 13, 5)),    # last day of a common year
+    (date(2024, 5, 5), (2016, 8, 27)),     # Fasika 2024
+    (date(2023, 4, 16), (2015, 8, 8)),     # Fasika 2023
+    (date(2025, 4, 20), (2017, 8, 12)),    # Fasika 2025
+    (date(2024, 1, 7), (2016, 4, 28)),     # Genna before a leap year
+    (date(1945, 11, 12), (1938, 3, 3)),    # Calendrical Calculations sample
+])
+def test_ethiopian_anchor_dates(gregorian, ethiopian):
+    rd = gregorian.toordinal()
+    assert rd_to_ethiopian(rd) == ethiopian
+    assert ethiopian_to_rd(*ethiopian) == rd
+
+
+def test_epochs():
+    assert ethiopian_to_rd(1, 1, 1) == ETHIOPIAN_EPOCH == julian_to_rd(8, 8, 29)
+    assert islamic_to_rd(1, 1, 1) == ISLAMIC_EPOCH == julian_to_rd(622, 7, 16)
+    # The day after Julian 1582-10-04 is Gregorian 1582-10-15
+    assert julian_to_rd(1582, 10, 5) == date(1582, 10, 15).toordinal()
+    assert rd_to_islamic(710347) == (1364, 12, 6)
+
+
+def test_ethiopian_round_trip():
+    for rd in RD_RANGE:
+        year, month, day = rd_to_ethiopian(rd)
+        assert 1 <= month <= 13 and 1 <= day <= ethiopian_days_in_month(year, month)
+        assert ethiopian_to_rd(year, month, day) == rd
+
+
+def test_ethiopian_year_lengths():
+    for year in range(-600, 2600):
+        length = ethiopian_year_start(year + 1) - ethiopian_year_start(year)
+        assert length == (366 if year % 4 == 3 else 365)
+        assert rd_to_ethiopian(ethiopian_year_start(year)) == (year, 1, 1)
+
+
+def test_islamic_round_trip():
+    for rd in RD_RANGE:
+        year, month, day = rd_to_islamic(rd)
+        assert 1 <= month <= 12 and 1 <= day <= islamic_days_in_month(year, month)
+        assert islamic_to_rd(year, month, day) == rd
+
+
+def test_islamic_year_starts():
+    for year in range(-1200, 1600):
+        length = islamic_year_start(year + 1) - islamic_year_start(year)
+        assert length == 354 + (islamic_days_in_month(year, 12) == 30)
+
+
+def test_gregorian_matches_datetime():
+    for rd in range(1, date(2500, 1, 1).toordinal()):
+        value = date.fromordinal(rd)
+        assert rd_to_gregorian(rd) == (value.year, value.month, value.day)
+        assert gregorian_to_rd(value.year, value.month, value.day) == rd
+        assert weekday(rd) == value.weekday()
+
+
+def test_julian_leap_days():
+    for year in range(1, 2500):
+        march_1 = julian_to_rd(year, 3, 1)
+        assert march_1 - julian_to_rd(year, 2, 28) == (2 if year % 4 == 0 else 1)
+
+
+def test_matches_baseline_engine():
+    # The baseline truncated toward zero, so it was only right from 1 EC on
+    baseline = BaselineEthiopian()
+    for rd in range(ETHIOPIAN_EPOCH, date(3000, 1, 1).toordinal(), 3):
+        value = date.fromordinal(rd)
+        assert rd_to_ethiopian(rd) == baseline.gregorian_to_ethiopian(value), value
+
+
+def test_year_index_matches_arithmetic():
+    index = EthiopianYearIndex(1900, 2100)
+    for rd in range(ethiopian_year_start(1890), ethiopian_year_start(2110)):
+        assert index.split(rd) == rd_to_ethiopian(rd)
+
+
+def test_year_index_span_edges():
+    index = EthiopianYearIndex(2000, 2010)
+    first, after = ethiopian_year_start(2000), ethiopian_year_start(2011)
+    assert 1999 not in index and 2000 in index and 2010 in index and 2011 not in index
+    assert index.starts[0] == first and index.starts[-1] == after
+    # Both sides of each span edge, inside the table and in the arithmetic fallback
+    for rd in (first - 1, first, after - 1, after, after + 365):
+        assert index.split(rd) == rd_to_ethiopian(rd)
+        assert index.year_of(rd) == rd_to_ethiopian(rd)[0]
+    for year in (1999, 2000, 2010, 2011, 2012):
+        assert index.year_start(year) == ethiopian_year_start(year)
+        assert index.month_start(year, 13) == ethiopian_to_rd(year, 13, 1)
+        assert index.days_in_month(year, 13) == ethiopian_days_in_month(year, 13)
+        assert index.is_leap_year(year) == (year % 4 == 3)
+
+
+def test_year_index_single_year_and_bad_span():
+    index = EthiopianYearIndex(2015, 2015)
+    assert len(index.starts) == 2 and index.days_in_year(2015) == 366
+    assert index.split(ethiopian_to_rd(2015, 13, 6)) == (2015, 13, 6)
+    assert index.split(ethiopian_to_rd(2016, 1, 1)) == (2016, 1, 1)
+    with pytest.raises(ValueError):
+        EthiopianYearIndex(2016, 2015)
+
+
+def test_shared_year_index_default_span():
+    index = get_ethiopian_year_index()
+    assert index is get_ethiopian_year_index()
+    assert (index.first_year, index.last_year) == (1, 3000)
+    assert index.split(ETHIOPIAN_EPOCH) == (1, 1, 1)
+    last = ethiopian_year_start(3001) - 1
+    assert index.split(last) == rd_to_ethiopian(last) == (3000, 13, 5)
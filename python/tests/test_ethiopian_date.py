@@ -0,0 +1,101 @@
+"""EthiopianDate value type: validation, arithmetic, ordering, hashing and pickling"""
+
+import copy
+import pickle
+from datetime import date, timedelta
+
+import pytest
+
+from modern_calendar.day_numbers import ethiopian_to_rd
+from modern_calendar.ethiopian_date import EthiopianDate
+
+
+@pytest.mark.parametrize('year, month, day', [
+    (2016, 0, 1), (2016, 14, 1), (2016, 1, 0), (2016, 1, 31),
+    (2016, 13, 6),   # 2016 is not a leap year: Pagume has 5 days
+    (2014, 13, 6),
+])
+def test_invalid_dates_rejected(year, month, day):
+    with pytest.raises(ValueError):
+        EthiopianDate(year, month, day)
+
+
+def test_fields_and_conversion():
+    pagume = EthiopianDate(2015, 13, 6)
+    assert pagume.to_tuple() == (2015, 13, 6)
+    assert (pagume.year, pagume.month, pagume.day) == (2015, 13, 6)
+    assert pagume.to_gregorian() == date(2023, 9, 11)
+    assert pagume.toordinal() == pagume.day_number == date(2023, 9, 11).toordinal()
+    assert pagume.weekday() == date(2023, 9, 11).weekday()
+    assert EthiopianDate.from_gregorian(date(2023, 9, 12)) == EthiopianDate(2016, 1, 1)
+    assert EthiopianDate.from_day_number(ethiopian_to_rd(2016, 1, 1)) == EthiopianDate(2016, 1, 1)
+    assert str(EthiopianDate(2016, 2, 3)) == '2016-02-03'
+    assert repr(EthiopianDate(2016, 2, 3)) == 'EthiopianDate(2016, 2, 3)'
+
+
+def test_replace_validates():
+    assert EthiopianDate(2015, 13, 6).replace(year=2011) == EthiopianDate(2011, 13, 6)
+    with pytest.raises(ValueError):
+        EthiopianDate(2015, 13, 6).replace(year=2016)
+
+
+def test_arithmetic():
+    new_year = EthiopianDate(2016, 1, 1)
+    assert new_year - 1 == EthiopianDate(2015, 13, 6)
+    assert new_year - timedelta(days=7) == EthiopianDate(2015, 12, 30)
+    assert new_year + 30 == EthiopianDate(2016, 2, 1)
+    assert new_year + timedelta(days=365) == EthiopianDate(2017, 1, 1)
+    assert timedelta(days=2) + new_year == 2 + new_year == EthiopianDate(2016, 1, 3)
+    assert EthiopianDate(2017, 1, 1) - new_year == 365
+    assert isinstance(new_year + timedelta(hours=30), EthiopianDate)
+    with pytest.raises(TypeError):
+        new_year + 1.5
+    with pytest.raises(TypeError):
+        new_year - date(2023, 9, 12)
+
+
+def test_ordering_and_equality():
+    dates = [EthiopianDate(2016, 1, 1), EthiopianDate(2015, 13, 6), EthiopianDate(2015, 1, 1)]
+    assert sorted(dates) == dates[::-1]
+    assert dates[1] < dates[0] <= EthiopianDate(2016, 1, 1)
+    assert dates[0] > dates[1] >= EthiopianDate(2015, 13, 6)
+    assert dates[0] != dates[1]
+    # Not equal to (or orderable with) the Gregorian date of the same day
+    assert EthiopianDate(2016, 1, 1) != date(2023, 9, 12)
+    with pytest.raises(TypeError):
+        EthiopianDate(2016, 1, 1) < date(2023, 9, 12)
+
+
+def test_hashing():
+    a = EthiopianDate(2016, 1, 1)
+    b = EthiopianDate.from_gregorian(date(2023, 9, 12))
+    assert a is not b and hash(a) == hash(b)
+    assert len({a, b, a + 1}) == 2
+    assert {a: 'new year'}[b] == 'new year'
+
+
+def test_immutable_slots():
+    value = EthiopianDate(2016, 1, 1)
+    assert not hasattr(value, '__dict__')
+    with pytest.raises(AttributeError):
+        value.year = 2017
+    with pytest.raises(AttributeError):
+        value._rd = 0
+    with pytest.raises(AttributeError):
+        del value._rd
+    with pytest.raises(AttributeError):
+        value.extra = 1
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(protocol):
+    value = EthiopianDate(2015, 13, 6)
+    restored = pickle.loads(pickle.dumps(value, protocol))
+    assert restored == value and type(restored) is EthiopianDate
+    assert restored.to_tuple() == (2015, 13, 6)
+
+
+def test_copy():
+    value = EthiopianDate(2015, 13, 6)
+    assert copy.copy(value) == value
+    assert copy.deepcopy([value]) == [value]
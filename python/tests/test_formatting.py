@@ -0,0 +1,119 @@
+"""Compiled format patterns against the original format_date output"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from modern_calendar import LOCALES, ModernCalendar
+from modern_calendar.day_numbers import rd_to_ethiopian, rd_to_islamic
+from modern_calendar.ethiopian_date import EthiopianDate
+from modern_calendar.formatting import compile_pattern, format_many
+from modern_calendar.locales import ETHIOPIAN_MONTH_NAMES
+
+DATES = [datetime(1999, 12, 31) + timedelta(days=i * 97) for i in range(120)] + [
+    datetime(2023, 9, 11), datetime(2023, 9, 12), datetime(2024, 9, 10), datetime(2024, 9, 11),
+]
+
+
+# The f-strings format_date used before patterns were compiled
+def legacy_gregorian(value, locale, style):
+    month_name = locale.month_names[value.month - 1]
+    if style == 'full':
+        return f"{locale.day_names[value.weekday()]}, {month_name} {value.day}, {value.year}"
+    if style == 'short':
+        return f"{value.month}/{value.day}/{value.year}"
+    return f"{month_name} {value.day}, {value.year}"
+
+
+def legacy_ethiopian(value, locale, style):
+    year, month, day = rd_to_ethiopian(value.toordinal())
+    month_name = ETHIOPIAN_MONTH_NAMES[month - 1]
+    if style == 'full':
+        return f"{locale.day_names[value.weekday()]}, {day} {month_name} {year}"
+    if style == 'short':
+        return f"{month}/{day}/{year}"
+    return f"{day} {month_name} {year}"
+
+
+@pytest.mark.parametrize('style', ['full', 'short', 'medium'])
+@pytest.mark.parametrize('language', ['en', 'ar'])
+def test_gregorian_matches_legacy(language, style):
+    calendar = ModernCalendar('gregorian', language)
+    for value in DATES:
+        assert calendar.format_date(value, style) == legacy_gregorian(value, LOCALES[language], style)
+
+
+@pytest.mark.parametrize('style', ['full', 'short', 'medium', 'other'])
+@pytest.mark.parametrize('language', ['en', 'am', 'ar'])
+def test_ethiopian_matches_legacy(language, style):
+    calendar = ModernCalendar('ethiopian', language)
+    for value in DATES:
+        assert calendar.format_date(value, style) == legacy_ethiopian(value, LOCALES[language], style)
+
+
+def test_directives():
+    enkutatash = date(2024, 9, 11)   # Meskerem 1, 2017
+    format_ = lambda pattern: compile_pattern(pattern, 'ethiopian', LOCALES['en'])(enkutatash)
+    assert format_('%Y|%y|%m|%-m|%d|%-d') == '2017|17|01|1|01|1'
+    assert format_('%A %a %B') == 'Wednesday Wed መስከረም'
+    assert format_('%j %-j 100%% {literal}') == '001 1 100% {literal}'
+    assert format_('%OY-%Om-%Od') == '፳፻፲፯-፩-፩'
+    assert compile_pattern('%j', 'ethiopian')(date(2023, 9, 11)) == '366'   # Pagume 6, 2015
+    assert compile_pattern('%j', 'gregorian')(date(2024, 12, 31)) == '366'
+
+
+def test_islamic_directives():
+    value = date(2024, 3, 11)
+    year, month, day = rd_to_islamic(value.toordinal())
+    formatter = compile_pattern('%-d %B %Y', 'islamic', LOCALES['ar'])
+    assert formatter(value) == f"{day} {LOCALES['ar'].islamic_month_names[month - 1]} {year}"
+
+
+@pytest.mark.parametrize('pattern', ['%Q', '%-Y', '%OA', '%'])
+def test_unsupported_directives(pattern):
+    if pattern == '%':
+        # A lone percent sign is kept as text
+        assert compile_pattern(pattern)(date(2024, 9, 11)) == '%'
+    else:
+        with pytest.raises(ValueError):
+            compile_pattern(pattern)
+
+
+def test_unknown_calendar():
+    with pytest.raises(ValueError):
+        compile_pattern('%Y', 'julian')
+
+
+def test_accepted_inputs():
+    formatter = compile_pattern('%Y-%m-%d', 'ethiopian')
+    value = datetime(2024, 9, 11, 15, 30)
+    expected = '2017-01-01'
+    assert formatter(value) == formatter(value.date()) == formatter(value.toordinal()) == expected
+    assert formatter(EthiopianDate(2017, 1, 1)) == expected
+    assert formatter.pattern == '%Y-%m-%d' and formatter.calendar_type == 'ethiopian'
+    assert compile_pattern('%Y-%m-%d', 'ethiopian') is formatter
+
+
+def test_numpy_integers():
+    np = pytest.importorskip('numpy')
+    from modern_calendar.batch import day_numbers_to_datetime64
+    rd = date(2024, 9, 11).toordinal()
+    for formatter in (compile_pattern('%Y-%m-%d'), compile_pattern('%OY %B')):
+        for dtype in (np.int64, np.int32, np.uint32):
+            assert formatter(dtype(rd)) == formatter(rd)
+    days = np.arange(rd, rd + 5)
+    expected = ['1', '2', '3', '4', '5']
+    assert format_many('%-d', days) == expected
+    assert format_many('%-d', days.astype(np.uint32)) == expected
+    as_datetime64 = day_numbers_to_datetime64(days)
+    assert format_many('%-d', as_datetime64) == expected
+    # Object arrays of dates are formatted one element at a time
+    assert format_many('%-d', as_datetime64.astype(object)) == expected
+    assert format_many('%-d', np.array([date.fromordinal(d) for d in range(rd, rd + 5)],
+                                       dtype=object)) == expected
+
+
+def test_format_many_matches_format_date():
+    calendar = ModernCalendar('ethiopian', 'am')
+    assert calendar.format_many(DATES, '%A, %-d %B %Y') == \
+        [calendar.format_date(value) for value in DATES]
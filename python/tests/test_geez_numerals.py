@@ -0,0 +1,65 @@
+"""Ge'ez numeral rendering and parsing"""
+
+import pytest
+
+from modern_calendar.geez_numerals import (
+    from_geez, replace_geez_numerals, to_geez, to_geez_many
+)
+
+KNOWN = [
+    (1, '፩'), (9, '፱'), (10, '፲'), (11, '፲፩'), (30, '፴'), (99, '፺፱'),
+    # A leading ፩ is left out before ፻ and ፼
+    (100, '፻'), (101, '፻፩'), (111, '፻፲፩'), (200, '፪፻'), (999, '፱፻፺፱'),
+    (1000, '፲፻'), (1100, '፲፩፻'), (1111, '፲፩፻፲፩'), (1996, '፲፱፻፺፮'), (2017, '፳፻፲፯'),
+    (9999, '፺፱፻፺፱'),
+    (10000, '፼'), (10001, '፼፩'), (10100, '፼፻'), (10101, '፼፻፩'), (12345, '፼፳፫፻፵፭'),
+    (20000, '፪፼'), (99999, '፱፼፺፱፻፺፱'), (100000, '፲፼'), (110000, '፲፩፼'),
+    (1000000, '፻፼'), (1010000, '፻፩፼'), (2000000, '፪፻፼'), (99999999, '፺፱፻፺፱፼፺፱፻፺፱'),
+    (100000000, '፼፼'), (100000005, '፼፼፭'), (100010000, '፼፩፼'),
+    (123456789, '፼፳፫፻፵፭፼፷፯፻፹፱'),
+]
+
+
+@pytest.mark.parametrize('number, text', KNOWN)
+def test_known_values(number, text):
+    assert to_geez(number) == text
+    assert from_geez(text) == number
+
+
+def test_round_trip():
+    numbers = list(range(1, 30001)) + [10 ** k + d for k in range(4, 13) for d in (-1, 0, 1)]
+    for number in numbers:
+        assert from_geez(to_geez(number)) == number
+
+
+def test_tables_share_strings():
+    # Days, months and common years come from tables, not fresh strings
+    assert to_geez(17) is to_geez(17)
+    assert to_geez(2017) is to_geez(2017)
+
+
+def test_integer_types():
+    np = pytest.importorskip('numpy')
+    assert to_geez(np.int64(2017)) == '፳፻፲፯'
+    assert to_geez_many(np.array([0, 5, 30])) == ['', '፭', '፴']
+
+
+@pytest.mark.parametrize('value', [0, -1, -2017, 2.5, 2017.0, '12', None])
+def test_rejects_non_positive_and_non_integers(value):
+    with pytest.raises(ValueError):
+        to_geez(value)
+
+
+@pytest.mark.parametrize('text', ['', '  ', '12', 'abc', '፳፻ ፲፯', '፳x'])
+def test_rejects_non_numerals(text):
+    with pytest.raises(ValueError):
+        from_geez(text)
+
+
+def test_to_geez_many():
+    assert to_geez_many([0, 1, 29, 30, 2017, 12345]) == ['', '፩', '፳፱', '፴', '፳፻፲፯', '፼፳፫፻፵፭']
+
+
+def test_replace_in_text():
+    assert replace_geez_numerals('፭ መስከረም ፳፻፲፯ ዓ.ም') == '5 መስከረም 2017 ዓ.ም'
+    assert replace_geez_numerals('no numerals') == 'no numerals'
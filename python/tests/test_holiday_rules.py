@@ -0,0 +1,141 @@
+"""Holiday rules and the compiled holiday calendar"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+
+from modern_calendar.day_numbers import ethiopian_to_rd, rd_to_ethiopian
+from modern_calendar.holiday_rules import (
+    ETHIOPIAN_HOLIDAYS, GREGORIAN_HOLIDAYS, EasterHoliday, EthiopianHoliday, HolidayCalendar,
+    orthodox_easter
+)
+
+FASIKA = [
+    date(2000, 4, 30), date(2005, 5, 1), date(2010, 4, 4), date(2019, 4, 28),
+    date(2020, 4, 19), date(2021, 5, 2), date(2022, 4, 24), date(2023, 4, 16),
+    date(2024, 5, 5), date(2025, 4, 20), date(2026, 4, 12),
+]
+
+
+@pytest.mark.parametrize('fasika', FASIKA)
+def test_orthodox_easter(fasika):
+    assert orthodox_easter(fasika.year) == fasika.toordinal()
+    assert date.fromordinal(orthodox_easter(fasika.year)).weekday() == 6
+
+
+@pytest.mark.parametrize('fasika', FASIKA)
+def test_easter_offsets(fasika):
+    rd = fasika.toordinal()
+    siklet = EasterHoliday('Siklet', -2)
+    assert list(siklet.day_numbers(rd - 10, rd + 10)) == [rd - 2]
+    # Half-open range: the end day itself is excluded
+    assert list(siklet.day_numbers(rd - 10, rd - 2)) == []
+    assert ETHIOPIAN_HOLIDAYS.holiday_names(fasika - timedelta(2)) == ['Siklet']
+
+
+def test_genna_moves_after_leap_year():
+    genna = EthiopianHoliday('Genna', 4, 29, day_after_leap_year=28)
+    for year in range(1893, 2092):
+        (rd,) = genna.day_numbers(ethiopian_to_rd(year, 1, 1), ethiopian_to_rd(year + 1, 1, 1))
+        expected_day = 28 if year % 4 == 0 else 29
+        assert rd_to_ethiopian(rd) == (year, 4, expected_day)
+        # The day keeps Genna on January 7 while Julian and Gregorian differ by 13 days
+        genna_date = date.fromordinal(rd)
+        assert (genna_date.month, genna_date.day) == (1, 7)
+
+
+def test_fixed_ethiopian_holidays():
+    for gregorian_year in range(1950, 2090):
+        enkutatash = ethiopian_to_rd(gregorian_year - 7, 1, 1)
+        assert ETHIOPIAN_HOLIDAYS.holiday_names(enkutatash) == ['Enkutatash']
+        assert ETHIOPIAN_HOLIDAYS.is_holiday(enkutatash + 16)   # Meskel
+        assert not ETHIOPIAN_HOLIDAYS.is_holiday(enkutatash - 1)
+
+
+def test_coinciding_holidays():
+    # Fasika 2005 fell on International Labour Day
+    may_day = date(2005, 5, 1)
+    assert sorted(ETHIOPIAN_HOLIDAYS.holiday_names(may_day)) == \
+        ['Fasika', 'International Labour Day']
+    between = ETHIOPIAN_HOLIDAYS.holidays_between(may_day, may_day)
+    assert len(between) == 2
+    assert ETHIOPIAN_HOLIDAYS.day_numbers_between(may_day, may_day) == [may_day.toordinal()]
+
+
+def test_holidays_between_is_inclusive():
+    enkutatash = date(2024, 9, 11)
+    names = lambda start, end: [h.name for h in ETHIOPIAN_HOLIDAYS.holidays_between(start, end)]
+    assert names(enkutatash, enkutatash) == ['Enkutatash']
+    assert names(enkutatash + timedelta(1), enkutatash + timedelta(15)) == []
+    assert names(enkutatash - timedelta(1), enkutatash + timedelta(16)) == ['Enkutatash', 'Meskel']
+    assert names(enkutatash + timedelta(1), enkutatash - timedelta(1)) == []
+
+
+def test_holidays_between_spans_years():
+    start, end = date(2019, 6, 1), date(2026, 6, 1)
+    holidays = ETHIOPIAN_HOLIDAYS.holidays_between(start, end)
+    day_numbers = [h.day_number for h in holidays]
+    assert day_numbers == sorted(day_numbers)
+    assert holidays == ETHIOPIAN_HOLIDAYS.holidays_between(start.toordinal(), end.toordinal())
+
+    # Same result as asking every rule directly over the whole range
+    expected = sorted(
+        (rd, rule.name)
+        for rule in ETHIOPIAN_HOLIDAYS.rules
+        for rd in rule.day_numbers(start.toordinal(), end.toordinal() + 1)
+    )
+    assert [(h.day_number, h.name) for h in holidays] == expected
+
+    # Each holiday exactly at a boundary is included
+    for holiday in holidays:
+        edge = holiday.day_number
+        assert holiday in ETHIOPIAN_HOLIDAYS.holidays_between(edge, end)
+        assert holiday in ETHIOPIAN_HOLIDAYS.holidays_between(start, edge)
+        assert holiday not in ETHIOPIAN_HOLIDAYS.holidays_between(edge + 1, end)
+        assert holiday not in ETHIOPIAN_HOLIDAYS.holidays_between(start, edge - 1)
+
+
+def test_gregorian_calendar():
+    assert GREGORIAN_HOLIDAYS.holiday_names(date(2024, 12, 25)) == ['Christmas']
+    assert [h.name for h in GREGORIAN_HOLIDAYS.holidays_between(date(2024, 12, 25),
+                                                                 date(2025, 1, 1))] == \
+        ['Christmas', "New Year's Day"]
+
+
+def test_unknown_calendar_type():
+    with pytest.raises(ValueError):
+        HolidayCalendar([], 'lunar')
+
+
+@pytest.mark.parametrize('holidays', [ETHIOPIAN_HOLIDAYS, GREGORIAN_HOLIDAYS])
+def test_window_matches_per_year_compilation(holidays):
+    # No window: every lookup goes through compile_year
+    per_year = HolidayCalendar(holidays.rules, holidays.calendar_type, cache_size=4,
+                               window_years=(1, 0))
+    start, end = date(1895, 1, 1).toordinal(), date(2106, 1, 1).toordinal()
+    for rd in range(start, end):
+        assert holidays.is_holiday(rd) == per_year.is_holiday(rd)
+    assert len(per_year._years) <= 4
+
+
+def test_cache_clear_drops_window():
+    calendar = HolidayCalendar(ETHIOPIAN_HOLIDAYS.rules, 'ethiopian', cache_size=0)
+    assert calendar.is_holiday(date(2024, 9, 11))
+    assert calendar.is_holiday(ethiopian_to_rd(1690, 1, 1))
+    assert calendar._years == {}
+    calendar.cache_clear()
+    assert calendar._window_days is None
+
+
+def test_concurrent_compilation_stays_bounded():
+    calendar = HolidayCalendar(ETHIOPIAN_HOLIDAYS.rules, 'ethiopian', cache_size=8,
+                               window_years=(1, 0))
+    years = list(range(1500, 1600)) * 5
+
+    def check(year):
+        return calendar.compile_year(year).days == ETHIOPIAN_HOLIDAYS.compile_year(year).days
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(check, years))
+    assert len(calendar._years) <= 8
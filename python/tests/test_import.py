@@ -0,0 +1,49 @@
+"""Cold-start import of the headless core"""
+
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a plain ``import modern_calendar`` must never load
+FORBIDDEN = ('tkinter', 'numpy', 'pandas')
+
+# Generous enough for slow CI machines compiling without a bytecode cache
+IMPORT_BUDGET_SECONDS = 0.5
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import modern_calendar
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+def cold_import():
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    env.pop('PYTHONPATH', None)
+    output = subprocess.run([sys.executable, '-c', PROBE], cwd=PACKAGE_DIR, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def test_import_is_headless():
+    modules = cold_import()['modules']
+    loaded = [name for name in FORBIDDEN
+              if any(m == name or m.startswith(name + '.') for m in modules)]
+    assert loaded == []
+
+
+def test_optional_modules_are_not_imported():
+    modules = cold_import()['modules']
+    for name in ('batch', 'pandas_accessor', 'datepicker', 'server', 'cli', 'bundles'):
+        assert f'modern_calendar.{name}' not in modules
+
+
+def test_import_time_budget():
+    # Best of three, so a single scheduler hiccup does not fail the suite
+    elapsed = min(cold_import()['elapsed'] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import took {elapsed:.3f}s"
@@ -0,0 +1,131 @@
+"""Opt-in method instrumentation and its exports"""
+
+from datetime import datetime
+from importlib import import_module
+
+import pytest
+
+from modern_calendar import ModernCalendar
+from modern_calendar.instrumentation import INSTRUMENTED_METHODS, Instrumentation
+
+
+class Target:
+    def ok(self, value):
+        return value * 2
+
+    def boom(self):
+        raise RuntimeError('boom')
+
+
+@pytest.fixture
+def instrumentation():
+    instance = Instrumentation([(Target, 'ok'), (Target, 'boom')], buckets=(0.001, 1.0))
+    yield instance
+    instance.disable()
+
+
+def test_enable_and_disable_restore_originals():
+    instrumentation = Instrumentation()
+    originals = {}
+    for owner, name in INSTRUMENTED_METHODS:
+        target = import_module(owner) if isinstance(owner, str) else owner
+        originals[owner, name] = (target, vars(target)[name])
+    try:
+        instrumentation.enable()
+        instrumentation.enable()   # idempotent: wrappers are not stacked
+        assert instrumentation.enabled
+        for (owner, name), (target, original) in originals.items():
+            wrapped = vars(target)[name]
+            assert wrapped is not original and wrapped.__wrapped__ is original
+    finally:
+        instrumentation.disable()
+    assert not instrumentation.enabled
+    for (owner, name), (target, original) in originals.items():
+        assert vars(target)[name] is original
+
+
+def test_format_date_counted_once():
+    instrumentation = Instrumentation()
+    calendar = ModernCalendar('ethiopian', 'am')
+    instrumentation.enable()
+    try:
+        calendar.format_date(datetime(2024, 9, 11))
+        calendar.get_month_calendar(2017, 1)
+    finally:
+        instrumentation.disable()
+    metrics = instrumentation.to_dict()
+    assert metrics['BaseCalendar.format_date']['calls'] == 1
+    assert metrics['ModernCalendar.get_month_calendar']['calls'] == 1
+    assert not any(name.endswith('compile_format') for name in metrics)
+    # Recorded metrics survive disable(), and calls made afterwards are not counted
+    calendar.format_date(datetime(2024, 9, 11))
+    assert instrumentation.to_dict()['BaseCalendar.format_date']['calls'] == 1
+
+
+def test_calls_and_errors(instrumentation):
+    instrumentation.enable()
+    target = Target()
+    assert target.ok(21) == 42
+    with pytest.raises(RuntimeError, match='boom'):
+        target.boom()
+    with pytest.raises(RuntimeError):
+        target.boom()
+    metrics = instrumentation.to_dict()
+    assert (metrics['Target.ok']['calls'], metrics['Target.ok']['errors']) == (1, 0)
+    assert (metrics['Target.boom']['calls'], metrics['Target.boom']['errors']) == (2, 2)
+    assert metrics['Target.ok']['buckets'][-1] == (float('inf'), 1)
+
+    instrumentation.reset()
+    assert instrumentation.to_dict()['Target.boom']['calls'] == 0
+
+
+def test_slow_call_hook(instrumentation):
+    calls = []
+    instrumentation.enable(slow_threshold=0.0,
+                           on_slow_call=lambda *args: calls.append(args))
+    target = Target()
+    target.ok(value=3)
+    assert len(calls) == 1
+    name, seconds, args, kwargs = calls[0]
+    assert name == 'Target.ok' and seconds >= 0
+    assert args == (target,) and kwargs == {'value': 3}
+
+    # Fast calls below the threshold do not fire the hook
+    instrumentation.enable(slow_threshold=60.0, on_slow_call=lambda *args: calls.append(args))
+    target.ok(1)
+    assert len(calls) == 1
+
+
+def test_failing_hook_does_not_change_result(instrumentation):
+    def hook(*args):
+        raise ValueError('hook failed')
+
+    instrumentation.enable(slow_threshold=0.0, on_slow_call=hook)
+    target = Target()
+    assert target.ok(2) == 4
+    with pytest.raises(RuntimeError, match='boom'):
+        target.boom()
+
+
+def test_prometheus_text(instrumentation):
+    instrumentation.enable()
+    target = Target()
+    target.ok(1)
+    target.ok(1)
+    with pytest.raises(RuntimeError):
+        target.boom()
+    lines = instrumentation.to_prometheus().splitlines()
+    samples = dict(line.rsplit(' ', 1) for line in lines if not line.startswith('#'))
+
+    assert '# TYPE modern_calendar_calls_total counter' in lines
+    assert '# TYPE modern_calendar_call_duration_seconds histogram' in lines
+    assert samples['modern_calendar_calls_total{method="Target.ok"}'] == '2'
+    assert samples['modern_calendar_call_errors_total{method="Target.boom"}'] == '1'
+    assert samples['modern_calendar_call_errors_total{method="Target.ok"}'] == '0'
+
+    duration = 'modern_calendar_call_duration_seconds'
+    buckets = [int(samples[f'{duration}_bucket{{method="Target.ok",le="{le}"}}'])
+               for le in ('0.001', '1.0', '+Inf')]
+    assert buckets == sorted(buckets) and buckets[-1] == 2
+    assert samples[f'{duration}_count{{method="Target.ok"}}'] == '2'
+    assert float(samples[f'{duration}_sum{{method="Target.ok"}}']) >= 0
@@ -0,0 +1,157 @@
+"""Date-picker month pages built by MonthViewModel"""
+
+import calendar as py_calendar
+from datetime import date
+
+import pytest
+
+from modern_calendar import LOCALES
+from modern_calendar.day_numbers import ethiopian_to_rd, weekday
+from modern_calendar.holiday_rules import ETHIOPIAN_HOLIDAYS
+from modern_calendar.month_view import CELLS_PER_VIEW, SUNDAY, MonthViewModel
+
+
+@pytest.mark.parametrize('language', ['en', 'am', 'ar', 'oro'])
+def test_gregorian_title_uses_gregorian_month_name(language):
+    model = MonthViewModel('gregorian', language, prefetch=False)
+    model.go_to(date(2024, 1, 15))
+    view = model.view(today=date(2024, 1, 15))
+    assert view.title == f"{LOCALES[language].gregorian_month_names[0]} 2024"
+    assert len(view.cells) == CELLS_PER_VIEW
+
+
+def test_gregorian_title_in_english_matches_calendar_module():
+    model = MonthViewModel('gregorian', 'en', prefetch=False)
+    for month in range(1, 13):
+        model.go_to(date(2024, month, 1))
+        assert model.view().title == f"{py_calendar.month_name[month]} 2024"
+
+
+def test_ethiopian_title_and_pagume():
+    model = MonthViewModel('ethiopian', 'am', prefetch=False)
+    model.go_to(date(2024, 9, 6))   # Pagume 1, 2016
+    view = model.view()
+    assert view.title == f"{LOCALES['am'].ethiopian_month_names[12]} 2016"
+    assert [cell.day for cell in view.cells if cell.in_month] == list(range(1, 6))
+    assert len(view.cells) == CELLS_PER_VIEW
+
+
+
+@pytest.mark.parametrize('start, months, expected', [
+    ((2015, 12), 1, (2015, 13)),     # into Pagume
+    ((2015, 13), 1, (2016, 1)),      # out of Pagume into the new year
+    ((2016, 1), -1, (2015, 13)),
+    ((2016, 1), -2, (2015, 12)),
+    ((2016, 13), 13, (2017, 13)),
+    ((2016, 2), -27, (2014, 1)),
+])
+def test_ethiopian_step(start, months, expected):
+    model = MonthViewModel('ethiopian', prefetch=False)
+    model.year, model.month = start
+    model.step(months)
+    assert (model.year, model.month) == expected
+
+
+def test_next_and_prev_month_walk_every_page():
+    model = MonthViewModel('ethiopian', prefetch=False)
+    model.go_to(ethiopian_to_rd(2015, 11, 10))
+    pages = []
+    for _ in range(4):
+        model.next_month()
+        pages.append((model.year, model.month))
+    assert pages == [(2015, 12), (2015, 13), (2016, 1), (2016, 2)]
+    for _ in range(4):
+        model.prev_month()
+    assert (model.year, model.month) == (2015, 11)
+    # adjacent() looks without moving
+    assert model.adjacent(3) == (2016, 1) and (model.year, model.month) == (2015, 11)
+
+    gregorian = MonthViewModel('gregorian', prefetch=False)
+    gregorian.go_to(date(2023, 12, 31))
+    gregorian.next_month()
+    assert (gregorian.year, gregorian.month) == (2024, 1)
+    gregorian.prev_month()
+    gregorian.prev_month()
+    assert (gregorian.year, gregorian.month) == (2023, 11)
+
+
+def test_pagume_page_after_step():
+    model = MonthViewModel('ethiopian', prefetch=False)
+    model.go_to(ethiopian_to_rd(2016, 1, 1))
+    model.prev_month()
+    view = model.view()
+    assert (view.year, view.month) == (2015, 13)
+    # 2015 is a leap year: Pagume has six days
+    assert [cell.day for cell in view.cells if cell.in_month] == list(range(1, 7))
+
+
+def test_today_and_selected_flags():
+    model = MonthViewModel('ethiopian', prefetch=False)
+    model.go_to(ethiopian_to_rd(2016, 1, 1))
+    today, selected = ethiopian_to_rd(2016, 1, 5), ethiopian_to_rd(2016, 1, 20)
+    view = model.view(today=today, selected=selected)
+    assert [cell.day_number for cell in view.cells if cell.is_today] == [today]
+    assert [cell.day_number for cell in view.cells if cell.is_selected] == [selected]
+
+    # Days outside the page, and no selection, flag nothing
+    view = model.view(today=ethiopian_to_rd(2016, 5, 1))
+    assert not any(cell.is_today or cell.is_selected for cell in view.cells)
+
+
+def test_holiday_and_weekend_flags():
+    model = MonthViewModel('ethiopian', 'en', prefetch=False)
+    model.go_to(ethiopian_to_rd(2016, 1, 1))
+    view = model.view()
+    flagged = [cell.day for cell in view.cells if cell.is_holiday and cell.in_month]
+    assert flagged == [1, 17]        # Enkutatash and Meskel
+    for cell in view.cells:
+        assert cell.is_holiday == ETHIOPIAN_HOLIDAYS.is_holiday(cell.day_number)
+        assert cell.is_weekend == (weekday(cell.day_number) in LOCALES['en'].weekend_days)
+    # Sunday-first columns: weekends fall in the first and last columns
+    assert all(week[0].is_weekend and week[6].is_weekend for week in view.weeks)
+
+
+def test_weekday_names_without_building_a_page():
+    model = MonthViewModel('gregorian', 'en', prefetch=False)
+    assert model.weekday_names[0] == LOCALES['en'].day_names_short[SUNDAY]
+    assert model.weekday_names == model.view().weekday_names
+    assert MonthViewModel('gregorian', 'en', first_weekday=0,
+                          prefetch=False).weekday_names == LOCALES['en'].day_names_short
+
+
+def wait_for_prefetch(model):
+    with model._lock:
+        pending = list(model._pending.values())
+    for future in pending:
+        future.result()
+
+
+def test_prefetched_neighbours_are_cache_hits():
+    model = MonthViewModel('ethiopian')
+    try:
+        model.go_to(ethiopian_to_rd(2015, 13, 1))
+        today = ethiopian_to_rd(2015, 13, 1)
+        model.view(today=today)
+        wait_for_prefetch(model)
+        assert model._views.cache_info().currsize == 3
+
+        hits = model._views.cache_info().hits
+        model.next_month()
+        view = model.view(today=today)
+        assert (view.year, view.month) == (2016, 1)
+        assert model._views.cache_info().hits == hits + 1
+        assert view == model.build(2016, 1, today)
+
+        wait_for_prefetch(model)
+        model.prev_month()
+        model.prev_month()
+        assert model.view(today=today).month == 12
+        assert model._views.cache_info().hits == hits + 2
+    finally:
+        model.close()
+
+
+def test_no_prefetch_when_disabled():
+    model = MonthViewModel('gregorian', prefetch=False)
+    model.view()
+    assert model._executor is None and model._views.cache_info().currsize == 1
@@ -0,0 +1,108 @@
+"""pandas .ethiopian accessor against the scalar calendar API"""
+
+from datetime import date, datetime
+
+import pytest
+
+from modern_calendar import LOCALES
+from modern_calendar.day_numbers import ethiopian_to_rd, rd_to_ethiopian
+from modern_calendar.ethiopian_date import EthiopianDate
+from modern_calendar.formatting import compile_pattern
+from modern_calendar.holiday_rules import ETHIOPIAN_HOLIDAYS
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+
+import modern_calendar.pandas_accessor  # noqa: E402,F401  registers .ethiopian
+
+DATES = pd.date_range('2023-08-01', '2025-10-01', freq='D')
+
+
+def scalar_fields(values):
+    return [rd_to_ethiopian(value.toordinal()) for value in values]
+
+
+def test_fields_match_scalar():
+    series = pd.Series(DATES, name='when')
+    expected = scalar_fields(DATES)
+    assert list(zip(series.ethiopian.year, series.ethiopian.month, series.ethiopian.day)) == \
+        expected
+    assert series.ethiopian.day_number.tolist() == [d.toordinal() for d in DATES]
+    assert series.ethiopian.year.name == 'when'
+    assert series.ethiopian.month_name('am').tolist() == \
+        [LOCALES['am'].ethiopian_month_names[m - 1] for _, m, _ in expected]
+
+
+@pytest.mark.parametrize('values', [
+    [date(2024, 9, 11), None, date(2024, 1, 7)],
+    [pd.Timestamp('2024-09-11'), pd.NaT, pd.Timestamp('2024-01-07')],
+    [EthiopianDate(2017, 1, 1), None, EthiopianDate(2016, 4, 28)],
+])
+def test_missing_values_stay_missing(values):
+    series = pd.Series(values, index=['a', 'b', 'c'])
+    accessor = series.ethiopian
+    assert accessor.year.isna().tolist() == [False, True, False]
+    assert accessor.year.dropna().astype(int).tolist() == [2017, 2016]
+    assert accessor.month_name('en').isna().tolist() == [False, True, False]
+    formatted = accessor.format('%Y-%m-%d')
+    assert formatted.isna().tolist() == [False, True, False]
+    assert formatted.dropna().tolist() == ['2017-01-01', '2016-04-28']
+    assert accessor.is_holiday().tolist() == [True, pd.NA, True]
+    gregorian = accessor.to_gregorian()
+    assert gregorian.isna().tolist() == [False, True, False]
+    assert gregorian.iloc[0] == pd.Timestamp('2024-09-11')
+    assert list(gregorian.index) == ['a', 'b', 'c']
+
+
+def test_integer_day_numbers():
+    series = pd.Series([ethiopian_to_rd(2017, 1, 1), None], dtype='Int64')
+    assert series.ethiopian.year.tolist() == [2017, pd.NA]
+    assert series.ethiopian.to_gregorian().tolist()[0] == pd.Timestamp('2024-09-11')
+
+
+def test_timezone_aware_uses_local_wall_time():
+    # 22:30 UTC on Sep 10 is already Sep 11 (Enkutatash) in Addis Ababa
+    utc = pd.Series(pd.to_datetime(['2024-09-10 22:30']).tz_localize('UTC'))
+    local = utc.dt.tz_convert('Africa/Addis_Ababa')
+    assert (utc.ethiopian.month.iloc[0], utc.ethiopian.day.iloc[0]) == (13, 5)
+    assert (local.ethiopian.month.iloc[0], local.ethiopian.day.iloc[0]) == (1, 1)
+    assert local.ethiopian.is_holiday().tolist() == [True]
+
+
+@pytest.mark.parametrize('pattern, language', [
+    ('%A, %-d %B %Y', 'am'), ('%-d %B %Y', 'oro'), ('%OY-%Om-%Od', 'am'), ('%j', 'en'),
+])
+def test_format_matches_compiled_pattern(pattern, language):
+    series = pd.Series(DATES[::7].append(DATES[::7]))   # repeated days
+    formatter = compile_pattern(pattern, 'ethiopian', LOCALES[language])
+    assert series.ethiopian.format(pattern, language).tolist() == \
+        [formatter(value) for value in series]
+
+
+def test_is_holiday_matches_scalar():
+    series = pd.Series(DATES)
+    assert series.ethiopian.is_holiday().tolist() == \
+        [ETHIOPIAN_HOLIDAYS.is_holiday(value.toordinal()) for value in DATES]
+    assert pd.Series([], dtype='datetime64[ns]').ethiopian.is_holiday().tolist() == []
+
+
+def test_series_to_gregorian_round_trip():
+    series = pd.Series(DATES)
+    assert series.ethiopian.to_gregorian().tolist() == list(DATES)
+
+
+def test_frame_to_gregorian():
+    fields = scalar_fields(DATES)
+    frame = pd.DataFrame(fields, columns=['year', 'month', 'day'])
+    result = frame.ethiopian.to_gregorian(name='gregorian')
+    assert result.tolist() == list(DATES) and result.name == 'gregorian'
+
+    frame = pd.DataFrame({'y': [2017, None, 2016], 'm': [1, 1, 13], 'd': [1, 1, 5]})
+    result = frame.ethiopian.to_gregorian('y', 'm', 'd')
+    assert result.isna().tolist() == [False, True, False]
+    assert result.iloc[2] == pd.Timestamp(datetime(2024, 9, 10))
+
+
+def test_accessor_unavailable_for_other_dtypes():
+    with pytest.raises(AttributeError):
+        pd.Series([1.5, 2.5]).ethiopian
@@ -0,0 +1,88 @@
+"""Ethiopian date parsing: numeric orders, month names and rejected input"""
+
+import pytest
+
+from modern_calendar.day_numbers import ethiopian_to_rd
+from modern_calendar.ethiopian_date import EthiopianDate
+from modern_calendar.parsing import (
+    MONTH_INDEX, build_month_index, parse_ethiopian, parse_ethiopian_day_number, parse_many
+)
+
+MESKEREM_5 = ethiopian_to_rd(2017, 1, 5)
+
+
+@pytest.mark.parametrize('text', [
+    '2017-01-05', '2017-1-5', '2017/01/05', '2017.1.5', ' 2017 - 01 - 05 ',
+    # M/D/YYYY, the 'short' format style
+    '1/5/2017',
+])
+def test_numeric_orders(text):
+    assert parse_ethiopian_day_number(text) == MESKEREM_5
+
+
+@pytest.mark.parametrize('text', [
+    '5 Meskerem 2017', 'Meskerem 5, 2017', '2017 Meskerem 5', 'meskerem 5 2017',
+    '5 Maskaram 2017', '5 Mes 2017', '5 Mesk. 2017',
+    '5 መስከረም 2017', 'መስከረም 5, 2017', '5 መስከረም 2017 ዓ.ም', '5 መስከረም 2017 ዓ.ም.',
+    'ዓርብ, 5 መስከረም 2017', 'Friday, 5 Meskerem 2017 E.C.',
+    '5 Fuulbaana 2017', 'Sanbata 5 Fuulbaana 2017',
+    '፭ መስከረም ፳፻፲፯', '፳፻፲፯-፩-፭',
+])
+def test_month_names(text):
+    assert parse_ethiopian_day_number(text) == MESKEREM_5
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('3 Pagume 2016', (2016, 13, 3)),
+    ('6 Pagume 2015', (2015, 13, 6)),     # 2015 is a leap year
+    ('13/6/2015', (2015, 13, 6)),
+    ('30 Nehase 2016', (2016, 12, 30)),
+    ('1 Tikimt 2017', (2017, 2, 1)),
+    ('1 Tir 2017', (2017, 5, 1)),
+    ('28 Tahsas 2016', (2016, 4, 28)),
+    ('5 Yekatit 999', (999, 6, 5)),
+    # With a month name the order is day-year, so short years are allowed
+    ('5 Meskerem 17', (17, 1, 5)),
+])
+def test_known_dates(text, expected):
+    assert parse_ethiopian_day_number(text) == ethiopian_to_rd(*expected)
+
+
+@pytest.mark.parametrize('text', [
+    # A two-digit year cannot be told apart from a day or month
+    '17-01-05', '1/5/17',
+    # Out of range
+    '2017-14-01', '2017-01-31', '2017-00-10', '2017-01-00', '6 Pagume 2016', '31 Meskerem 2017',
+    # Gregorian month names are not Ethiopian months
+    'January 5, 2017', '5 Jan 2017',
+    # Prefixes shorter than three letters, or shared by two months
+    '5 Me 2017',
+    # Wrong number of parts
+    'Meskerem 2017', '5 Meskerem', '1 2 Meskerem 2017', '2017-01', '',
+    'not a date', '5 Meskerem Tikimt 2017',
+])
+def test_rejected(text):
+    with pytest.raises(ValueError):
+        parse_ethiopian_day_number(text)
+
+
+def test_month_index_prefixes():
+    assert MONTH_INDEX['mes'] == 1
+    assert MONTH_INDEX['pagume'] == 13
+    # 'te' starts Tekemt and Ter; even at three letters 'tek'/'ter' are distinct
+    assert MONTH_INDEX['tek'] == 2 and MONTH_INDEX['ter'] == 5
+    assert 'me' not in MONTH_INDEX
+    # Full names always win over a prefix of another month's name
+    assert all(MONTH_INDEX[name] == month for name, month in
+               [('tir', 5), ('ter', 5), ('sene', 10), ('sane', 10)])
+    assert len(build_month_index(min_prefix=1)) > len(MONTH_INDEX)
+
+
+def test_parse_ethiopian():
+    assert parse_ethiopian('5 Meskerem 2017') == EthiopianDate(2017, 1, 5)
+
+
+def test_parse_many():
+    day_numbers, errors = parse_many(['2017-01-05', 'nonsense', None, '1/5/2017'])
+    assert list(day_numbers) == [MESKEREM_5, 0, 0, MESKEREM_5]
+    assert list(errors) == [0, 1, 1, 0]
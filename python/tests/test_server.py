@@ -0,0 +1,223 @@
+"""HTTP service routes, caching and connection handling on a live socket"""
+
+import asyncio
+import http.client
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modern_calendar.server import MAX_BATCH_SIZE, CalendarServer, CalendarService, Request
+
+
+@pytest.fixture(scope='module')
+def server():
+    loop = asyncio.new_event_loop()
+    calendar_server = CalendarServer(keep_alive_timeout=5)
+    loop.run_until_complete(calendar_server.start('127.0.0.1', 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    calendar_server.port = calendar_server.sockets[0].getsockname()[1]
+    yield calendar_server
+    loop.call_soon_threadsafe(calendar_server.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+@pytest.fixture
+def connection(server):
+    conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+    yield conn
+    conn.close()
+
+
+def request(conn, method, url, body=None, headers=None):
+    conn.request(method, url, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def get_json(conn, url):
+    response, body = request(conn, 'GET', url)
+    return response.status, json.loads(body)
+
+
+def raw_exchange(server, data: bytes) -> bytes:
+    with socket.create_connection(('127.0.0.1', server.port), timeout=5) as sock:
+        sock.sendall(data)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+
+
+def test_convert_one(connection):
+    status, data = get_json(connection, '/convert?date=2024-09-11')
+    assert status == 200
+    assert data == {'input': '2024-09-11', 'day_number': 739140, 'year': 2017,
+                    'month': 1, 'day': 1, 'formatted': '2017-01-01'}
+
+    status, data = get_json(connection, '/convert?date=2017-01-01&from=ethiopian&to=gregorian')
+    assert (status, data['formatted']) == (200, '2024-09-11')
+
+
+def test_etag_and_not_modified(connection):
+    url = '/convert?date=2024-01-07&style=medium&language=am'
+    response, body = request(connection, 'GET', url)
+    etag = response.getheader('ETag')
+    assert response.status == 200 and etag
+    assert response.getheader('Cache-Control').startswith('public')
+
+    for if_none_match in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        response, body = request(connection, 'GET', url, headers={'If-None-Match': if_none_match})
+        assert (response.status, body) == (304, b'')
+        assert response.getheader('ETag') == etag
+
+    # A prefix or substring of the ETag is not a match
+    for if_none_match in ('"other"', etag[:-2] + '"', etag[1:-1]):
+        response, _ = request(connection, 'GET', url, headers={'If-None-Match': if_none_match})
+        assert response.status == 200
+
+
+def test_keep_alive_reuses_connection(server, connection):
+    before = server.service.metrics.connections_total
+    for day in range(1, 6):
+        status, _ = get_json(connection, f'/convert?date=2024-03-0{day}')
+        assert status == 200
+    assert server.service.metrics.connections_total == before + 1
+
+    response, _ = request(connection, 'GET', '/convert?date=2024-03-01',
+                          headers={'Connection': 'close'})
+    assert response.getheader('Connection') == 'close'
+
+
+def test_pipelined_requests_answered_in_order(server):
+    data = raw_exchange(server, (
+        b'GET /convert?date=2024-09-11 HTTP/1.1\r\nHost: x\r\n\r\n'
+        b'GET /convert?date=2024-09-12 HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n'
+    ))
+    assert data.count(b'HTTP/1.1 200 OK') == 2
+    assert data.index(b'"2017-01-01"') < data.index(b'"2017-01-02"')
+
+
+def test_http10_closes_by_default(server):
+    data = raw_exchange(server, b'GET /convert?date=2024-09-11 HTTP/1.0\r\n\r\n')
+    assert data.startswith(b'HTTP/1.1 200 OK') and b'Connection: close' in data
+
+
+def test_convert_batch(connection):
+    body = json.dumps({'from': 'gregorian', 'to': 'ethiopian',
+                       'dates': ['2024-09-11', 'nonsense', '2024-01-07']})
+    response, data = request(connection, 'POST', '/convert', body,
+                             {'Content-Type': 'application/json'})
+    results = json.loads(data)['results']
+    assert response.status == 200
+    assert [r.get('formatted') for r in results] == ['2017-01-01', None, '2016-04-28']
+    assert results[1]['input'] == 'nonsense' and 'error' in results[1]
+
+
+@pytest.mark.parametrize('body, status', [
+    (b'{not json', 400),
+    (b'[1, 2]', 400),
+    (b'{"dates": "2024-09-11"}', 400),
+    (json.dumps({'dates': ['2024-09-11'] * (MAX_BATCH_SIZE + 1)}).encode(), 413),
+    (b'{"dates": [], "to": "lunar"}', 400),
+])
+def test_convert_batch_errors(connection, body, status):
+    response, data = request(connection, 'POST', '/convert', body)
+    assert response.status == status
+    assert json.loads(data)['status'] == status
+
+
+def test_month_and_year(connection):
+    # 2015 is a leap year, so Pagume has six days
+    status, month = get_json(connection, '/month?calendar=ethiopian&year=2015&month=13')
+    assert status == 200
+    assert [day for week in month['weeks'] for day in week if day] == list(range(1, 7))
+
+    status, month = get_json(connection, '/month?calendar=gregorian&year=2024&month=1&language=am')
+    assert (status, month['name']) == (200, 'ጃንዩወሪ')
+
+    status, year = get_json(connection, '/year?calendar=ethiopian&year=2017&language=am')
+    assert status == 200 and len(year['months']) == 13
+    assert year['months'][0]['name'] == 'መስከረም'
+
+
+def test_holidays(connection):
+    status, data = get_json(connection, '/holidays?start=2024-09-01&end=2024-09-30')
+    assert status == 200
+    assert [h['name'] for h in data['holidays']] == ['Enkutatash', 'Meskel']
+    assert data['holidays'][0]['gregorian'] == '2024-09-11'
+
+
+@pytest.mark.parametrize('method, url, status', [
+    ('GET', '/nowhere', 404),
+    ('POST', '/month', 405),
+    ('GET', '/convert', 400),
+    ('GET', '/convert?date=2024-13-45', 400),
+    ('GET', '/convert?date=2024-09-11&to=lunar', 400),
+    ('GET', '/convert?date=2024-09-11&style=fancy', 400),
+    ('GET', '/month?year=2024&month=13', 400),
+    ('GET', '/month?year=twenty&month=1', 400),
+    ('GET', '/month?year=2024&month=1&first_weekday=7', 400),
+    ('GET', '/holidays?start=2024-09-30&end=2024-09-01', 400),
+    ('GET', '/holidays?start=1900-01-01&end=2024-01-01', 400),
+])
+def test_error_statuses(connection, method, url, status):
+    response, data = request(connection, method, url)
+    assert response.status == status
+    assert json.loads(data) == {'error': json.loads(data)['error'], 'status': status}
+
+
+def test_head_and_options(connection):
+    response, body = request(connection, 'HEAD', '/convert?date=2024-09-11')
+    assert response.status == 200 and body == b''
+    assert int(response.getheader('Content-Length')) > 0
+
+    response, body = request(connection, 'OPTIONS', '/convert')
+    assert response.status == 204 and body == b''
+    assert 'POST' in response.getheader('Access-Control-Allow-Methods')
+
+
+@pytest.mark.parametrize('data, status', [
+    (b'NONSENSE\r\n\r\n', 400),
+    (b'GET / HTTP/2.0\r\n\r\n', 505),
+    (b'POST /convert HTTP/1.1\r\nContent-Length: -5\r\n\r\n', 400),
+    (b'POST /convert HTTP/1.1\r\nContent-Length: abc\r\n\r\n', 400),
+    (b'POST /convert HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n', 411),
+])
+def test_malformed_requests(server, data, status):
+    assert raw_exchange(server, data).startswith(f'HTTP/1.1 {status} '.encode())
+
+
+def test_metrics(connection):
+    get_json(connection, '/convert?date=2024-09-11')
+    response, body = request(connection, 'GET', '/metrics')
+    assert response.status == 200
+    assert response.getheader('Content-Type').startswith('text/plain')
+    text = body.decode()
+    assert 'modern_calendar_http_cache_hits_total' in text
+    assert 'route="GET /convert"' in text
+
+    status, data = get_json(connection, '/metrics?format=json')
+    assert status == 200
+    assert data['responses_by_status']['200'] > 0
+    assert data['cache']['hits'] > 0
+
+
+def test_not_modified_counted_across_threads():
+    service = CalendarService()
+    query = {'date': '2024-09-11'}
+    first = service.handle(Request('GET', '/convert', '/convert', query, 'HTTP/1.1', {}, b''))
+    etag = dict(first.headers)['ETag']
+    request = Request('GET', '/convert', '/convert', query, 'HTTP/1.1',
+                      {'if-none-match': etag}, b'')
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(lambda _: service.handle(request).status, range(2000)))
+    assert statuses == [304] * 2000
+    assert service.metrics.not_modified == 2000
@@ -0,0 +1,37 @@
+"""Whole-year calendars and their localized month names"""
+
+import calendar as py_calendar
+
+import pytest
+
+from modern_calendar import LOCALES, ModernCalendar
+
+
+@pytest.mark.parametrize('language', ['en', 'am', 'ar', 'oro'])
+def test_gregorian_year_uses_gregorian_month_names(language):
+    months = ModernCalendar('gregorian', language).get_year_calendar(2024)
+    names = [grid.name for grid in months]
+    assert names == list(LOCALES[language].gregorian_month_names)
+    assert len(set(names)) == 12
+    # January, not Meskerem, even where month_names holds the Ethiopian months
+    assert names[0] != LOCALES[language].ethiopian_month_names[0]
+
+
+def test_gregorian_month_names_in_english():
+    months = ModernCalendar('gregorian', 'en').get_year_calendar(2024)
+    assert [grid.name for grid in months] == list(py_calendar.month_name)[1:]
+
+
+@pytest.mark.parametrize('language', ['am', 'oro'])
+def test_ethiopian_year_uses_ethiopian_month_names(language):
+    months = ModernCalendar('ethiopian', language).get_year_calendar(2016)
+    assert len(months) == 13
+    assert [grid.name for grid in months] == list(LOCALES[language].ethiopian_month_names)
+
+
+@pytest.mark.parametrize('calendar_type', ['gregorian', 'ethiopian', 'islamic'])
+def test_year_matches_month_grids(calendar_type):
+    calendar = ModernCalendar(calendar_type, 'en')
+    year = {'gregorian': 2024, 'ethiopian': 2016, 'islamic': 1445}[calendar_type]
+    for grid in calendar.get_year_calendar(year):
+        assert grid.weeks == calendar.get_month_calendar(year, grid.month)